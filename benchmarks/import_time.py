@@ -0,0 +1,83 @@
+"""
+Startup-time budget for the resume_analysis package.
+
+Times ``import resume_analysis`` and ``python -m resume_analysis.cli --help`` in
+fresh interpreters, reports the best of N runs over bare interpreter startup and
+exits non-zero when a budget is exceeded or a heavy dependency gets imported
+eagerly.
+
+    python benchmarks/import_time.py [--runs 5] [--import-budget-ms 50] [--help-budget-ms 150]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = (
+    'spacy', 'torch', 'transformers', 'sklearn', 'pandas', 'numpy',
+    'github', 'PyPDF2', 'aiohttp', 'requests', 'pydantic_settings'
+)
+
+def _best_time(args, runs: int) -> float:
+    """Best wall-clock time in seconds of ``python <args>`` over ``runs`` runs"""
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args],
+            cwd=REPO_ROOT,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True
+        )
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def _eager_heavy_modules(statement: str) -> list:
+    """Heavy modules present in ``sys.modules`` after running ``statement``"""
+    code = (
+        f"import sys\n{statement}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout.strip()
+    return [m for m in output.split(',') if m]
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--import-budget-ms", type=float, default=50.0)
+    parser.add_argument("--help-budget-ms", type=float, default=150.0)
+    args = parser.parse_args()
+    
+    baseline = _best_time(["-c", "pass"], args.runs)
+    checks = [
+        ("import resume_analysis", ["-c", "import resume_analysis"], args.import_budget_ms),
+        ("cli --help", ["-m", "resume_analysis.cli", "--help"], args.help_budget_ms),
+    ]
+    
+    failed = False
+    print(f"interpreter startup: {baseline * 1000:.1f} ms")
+    for name, command, budget_ms in checks:
+        elapsed_ms = (_best_time(command, args.runs) - baseline) * 1000
+        status = "ok" if elapsed_ms <= budget_ms else "OVER BUDGET"
+        failed |= elapsed_ms > budget_ms
+        print(f"{name:24} {elapsed_ms:8.1f} ms  (budget {budget_ms:.0f} ms)  {status}")
+        
+    eager = _eager_heavy_modules("import resume_analysis")
+    if eager:
+        failed = True
+        print(f"heavy modules imported eagerly: {', '.join(eager)}")
+        
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
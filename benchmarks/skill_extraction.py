@@ -0,0 +1,96 @@
+"""
+SkillExtractor throughput on large synthetic resumes.
+
+Generates resumes of increasing length (plus an optional synthetic taxonomy of
+thousands of skills) and reports extract_skills time per size. Time per 1k
+tokens should stay flat as resumes grow; the legacy per-domain regexes are
+timed alongside for comparison unless --skip-legacy is given.
+
+    python benchmarks/skill_extraction.py [--sizes 1000 10000 100000] [--taxonomy-size 5000]
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_analysis.models.skill_extractor import SkillExtractor
+
+FILLER = (
+    "designed built shipped maintained team project platform service users "
+    "production data pipeline reliable scalable internal tooling features"
+).split()
+
+def _legacy_experience(text: str, domains) -> dict:
+    """The pre-rewrite experience regexes, for comparison"""
+    found = {}
+    for domain in domains:
+        for pattern in (
+            rf"(\d+)\s*(?:years?|yrs?).+?(?:experience|exp).+?{domain}",
+            rf"{domain}.+?(\d+)\s*(?:years?|yrs?).+?(?:experience|exp)"
+        ):
+            matches = re.findall(pattern, text.lower())
+            if matches:
+                found[domain] = max(map(int, matches))
+                break
+    return found
+
+def synthetic_resume(n_words: int, skills: list, rng: random.Random) -> str:
+    words = []
+    while len(words) < n_words:
+        roll = rng.random()
+        if roll < 0.05:
+            words.extend(rng.choice(skills).split())
+        elif roll < 0.07:
+            words.extend([str(rng.randint(1, 15)), rng.choice(["years", "yrs", "year"])])
+        elif roll < 0.12:
+            words.append(rng.choice([".", ";", "\n"]))
+        else:
+            words.append(rng.choice(FILLER))
+    return " ".join(words)
+
+def synthetic_taxonomy(size: int, base: dict) -> dict:
+    taxonomy = {domain: list(skills) for domain, skills in base.items()}
+    domains = list(taxonomy)
+    for i in range(size):
+        taxonomy[domains[i % len(domains)]].append(f"skill{i} framework")
+    return taxonomy
+
+def _best(fn, runs: int) -> float:
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--taxonomy-size", type=int, default=0, help="Extra synthetic skills to add")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+    
+    rng = random.Random(0)
+    extractor = SkillExtractor()
+    if args.taxonomy_size:
+        extractor = SkillExtractor(synthetic_taxonomy(args.taxonomy_size, extractor.domain_skills))
+    skills = [skill for skills in extractor.domain_skills.values() for skill in skills]
+    print(f"taxonomy: {len(skills)} skills across {len(extractor.domain_skills)} domains")
+    
+    for size in args.sizes:
+        text = synthetic_resume(size, skills, rng)
+        elapsed = _best(lambda: extractor.extract_skills(text), args.runs)
+        line = f"{size:>8} words  extract_skills {elapsed * 1000:9.1f} ms  ({elapsed * 1e6 / size:6.1f} ms/1k words)"
+        if not args.skip_legacy:
+            legacy = _best(lambda: _legacy_experience(text, extractor.domain_skills), 1)
+            line += f"  legacy experience regexes {legacy * 1000:9.1f} ms"
+        print(line)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
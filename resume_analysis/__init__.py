@@ -1,5 +1,21 @@
-from resume_analysis.models.enhanced_resume_scorer import EnhancedResumeScorer
-from resume_analysis.utils.rate_limiter import RateLimiter
-from resume_analysis.config import Config
+import importlib
 
-__version__ = "1.0.0" 
\ No newline at end of file
+__version__ = "1.0.0"
+
+# Public names are resolved on first access so that importing the package does
+# not pull in spaCy, torch, pandas or PyGithub before they are needed.
+_LAZY_ATTRS = {
+    'EnhancedResumeScorer': 'resume_analysis.models.enhanced_resume_scorer',
+    'RateLimiter': 'resume_analysis.utils.rate_limiter',
+    'Config': 'resume_analysis.config',
+}
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRS))
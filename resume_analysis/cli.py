@@ -1,24 +1,99 @@
 import sys
 import json
-from resume_analysis.main import analyze_candidate, analyze_linkedin_profile
+import logging
+import argparse
+from typing import Dict, Iterator
 import asyncio
 
+def _read_candidates(path: str) -> Iterator[Dict]:
+    """Lazily read one candidate JSON object per line ('-' reads stdin)"""
+    stream = sys.stdin if path == '-' else open(path)
+    try:
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="resume_analysis", description="Resume analysis CLI")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    candidate = commands.add_parser("analyze_candidate", help="Analyze a single candidate")
+    candidate.add_argument("input", help="JSON object with resume_pdf, github_username, linkedin_pdf, hackathons")
+    
+    linkedin = commands.add_parser("analyze_linkedin", help="Parse a LinkedIn PDF export")
+    linkedin.add_argument("input", help="JSON object with pdf_content")
+    
+    batch = commands.add_parser("analyze_batch", help="Analyze a JSON-lines file of candidates")
+    batch.add_argument("input", help="Path to a JSON-lines file of candidates, or '-' for stdin")
+    batch.add_argument("--concurrency", type=int, default=None,
+                       help="Candidates analyzed concurrently (default: BATCH_CONCURRENCY)")
+    batch.add_argument("--unordered", action="store_true",
+                       help="Emit results as they complete instead of in input order")
+    
+    serve = commands.add_parser("serve", help="Run a long-lived worker (JSON-lines over stdio, or local HTTP)")
+    serve.add_argument("--http", action="store_true", help="Serve HTTP instead of JSON-lines over stdin/stdout")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--concurrency", type=int, default=None,
+                       help="Requests analyzed concurrently (default: BATCH_CONCURRENCY)")
+    return parser
+
 async def main():
-    command = sys.argv[1]
-    input_data = json.loads(sys.argv[2])
+    args = _build_parser().parse_args()
+    
+    # Imported after argument parsing so --help and usage errors stay fast
+    from resume_analysis.config import Config
+    from resume_analysis.utils import tracing
+    
+    # Logs go to stderr so stdout stays clean for JSON results
+    config = Config()
+    handler = logging.StreamHandler(sys.stderr)
+    handler.addFilter(tracing.TraceIdFilter())
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s [%(trace_id)s] %(message)s"))
+    logging.basicConfig(level=config.LOG_LEVEL, handlers=[handler])
+    tracing.configure_from_config(config)
     
-    if command == "analyze_candidate":
+    from resume_analysis.main import (
+        analyze_candidate,
+        analyze_linkedin_profile,
+        analyze_candidates,
+        iter_candidate_analyses
+    )
+    from resume_analysis.server import AnalysisWorker, serve_stdio, serve_http
+    
+    if args.command == "analyze_candidate":
+        input_data = json.loads(args.input)
         result = await analyze_candidate(
             resume_pdf=input_data['resume_pdf'],
             github_username=input_data.get('github_username'),
-            linkedin_url=input_data.get('linkedin_url'),
+            linkedin_pdf=input_data.get('linkedin_pdf'),
             hackathons=input_data.get('hackathons')
         )
         print(json.dumps(result))
         
-    elif command == "analyze_linkedin":
+    elif args.command == "analyze_linkedin":
+        input_data = json.loads(args.input)
         result = await analyze_linkedin_profile(input_data['pdf_content'])
         print(json.dumps(result))
+        
+    elif args.command == "analyze_batch":
+        candidates = _read_candidates(args.input)
+        if args.unordered:
+            async for index, result in iter_candidate_analyses(candidates, args.concurrency, config):
+                print(json.dumps({'index': index, **result}), flush=True)
+        else:
+            for result in await analyze_candidates(candidates, args.concurrency, config):
+                print(json.dumps(result))
+                
+    elif args.command == "serve":
+        worker = AnalysisWorker(config, concurrency=args.concurrency)
+        if args.http:
+            await serve_http(worker, args.host, args.port)
+        else:
+            await serve_stdio(worker)
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    asyncio.run(main()) 
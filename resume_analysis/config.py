@@ -1,11 +1,46 @@
 from pydantic_settings import BaseSettings
 import os
 
+DEFAULT_INFERENCE_URL = "https://api-inference.huggingface.co/models/gpt2"
+
 class Config(BaseSettings):
-    HUGGINGFACE_TOKEN: str
+    HUGGINGFACE_TOKEN: str | None = None  # Only required by the remote backend
     GITHUB_TOKEN: str | None = None
-    MAX_REQUESTS_PER_MINUTE: int = 60
+    MAX_REQUESTS_PER_MINUTE: int = 60  # HF inference
+    GITHUB_REQUESTS_PER_HOUR: int = 5000  # Authenticated core limit; 60 without a token
+    GITHUB_SEARCH_REQUESTS_PER_MINUTE: int = 30
     CACHE_TTL: int = 3600
+    CACHE_CONTENT_TTL: int = 30 * 24 * 3600  # Content-addressed entries (PDF text, LLM output) never go stale
+    CACHE_MAX_ENTRIES: int = 1024
+    CACHE_DIR: str = "~/.cache/resume_analysis"  # Empty disables the disk tier
+    GITHUB_STALE_AFTER: int = 3600  # Stored GitHub responses are served without revalidation this long
+    GITHUB_REPO_SORT: str = "pushed"  # pushed, updated, created, full_name or stars
+    GITHUB_MAX_REPOS: int = 100  # Top-K repositories kept per user
+    GITHUB_MAX_SCANNED_REPOS: int = 1000  # Pages stop here when sorting by stars client-side
+    GITHUB_MAX_TEXT_CHARS: int = 8000  # Bound on the GitHub text fed to scoring
+    BATCH_CONCURRENCY: int = 4
+    PDF_WORKERS: int = 0  # Process pool size; 0 uses one per CPU
+    PDF_MAX_PAGES: int = 50
+    PDF_MAX_BYTES: int = 20 * 1024 * 1024
+    PDF_PAGES_PER_TASK: int = 8
+    HF_INFERENCE_URL: str = DEFAULT_INFERENCE_URL
+    LLM_TIMEOUT: float = 10
+    LLM_MAX_RETRIES: int = 3
+    LLM_MAX_CONNECTIONS: int = 10
+    LLM_BACKEND: str = "remote"  # "remote" (HF Inference API) or "local" (in-process transformers)
+    LOCAL_MODEL_NAME: str = "distilgpt2"
+    LOCAL_MODEL_QUANTIZE: bool = False
+    LLM_BATCH_SIZE: int = 8
+    LLM_BATCH_WAIT_MS: float = 10
+    LLM_TOKENIZER: str = "gpt2"  # Sizes analysis chunks; a word estimate is used if it cannot be loaded
+    LLM_CHUNK_TOKENS: int = 512
+    LLM_CHUNK_OVERLAP: int = 32
+    LLM_CONCURRENCY: int = 8  # In-flight prompts per analyzer
+    LLM_COMBINED_ANALYSIS: bool = True  # One prompt for all categories, per-category calls only as fallback
+    LLM_COMBINED_MAX_NEW_TOKENS: int = 320  # Room for all four sections; per-category prompts use the backend default
+    TRACING_ENABLED: bool = False  # Spans, counters and trace IDs; near-zero overhead when off
+    TRACE_FILE: str = ""  # JSON-lines span export; empty keeps only the in-process metrics
+    LOG_LEVEL: str = "INFO"
     
     class Config:
         env_file = ".env"
@@ -2,52 +2,63 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import requests
 from dotenv import load_dotenv
 from resume_analysis.models.enhanced_resume_scorer import EnhancedResumeScorer
 from resume_analysis.models.hackathon_matcher import HackathonMatcher
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, AsyncIterable, AsyncIterator, Tuple, Union
 import json
+import logging
+from dataclasses import asdict
 from resume_analysis.utils.rate_limiter import RateLimiter
 from resume_analysis.config import Config
 from resume_analysis.parsers.profile_parser import ProfileParser
+from resume_analysis.utils.inference_client import InferenceClient
+from resume_analysis.utils.cache import content_key
+from resume_analysis.utils import tracing
 import asyncio
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 
-def initialize_llm():
-    """Initialize LLM with environment variables and validate tokens"""
-    try:
-        huggingface_token = os.getenv('HUGGINGFACE_TOKEN')
-        if not huggingface_token:
-            raise ValueError("HUGGINGFACE_TOKEN not found in environment variables")
-        
-        # Test connection with a smaller, more reliable model
-        response = requests.post(
-            "https://api-inference.huggingface.co/models/gpt2",
-            headers={"Authorization": f"Bearer {huggingface_token}"},
-            json={"inputs": "Test"},
-            timeout=10
-        )
-        
-        if response.status_code in [200, 503]:  # 503 is acceptable as it means model is loading
-            print("Successfully initialized Hugging Face client")
+async def initialize_llm(config: Optional[Config] = None) -> bool:
+    """
+    Initialize LLM with environment variables and validate tokens.
+
+    The endpoint round-trip happens once per process; later calls reuse the
+    cached result of the first successful check. The local backend needs no
+    token and loads its model on first use.
+    """
+    import aiohttp
+    
+    config = config or Config()
+    with tracing.span('initialize_llm', backend=config.LLM_BACKEND) as span:
+        try:
+            if config.LLM_BACKEND == 'local':
+                return True
+                
+            huggingface_token = config.HUGGINGFACE_TOKEN or os.getenv('HUGGINGFACE_TOKEN')
+            if not huggingface_token:
+                raise ValueError("HUGGINGFACE_TOKEN not found in environment variables")
+            
+            # Test connection with a smaller, more reliable model
+            async with InferenceClient(config.HF_INFERENCE_URL, huggingface_token) as client:
+                await client.health_check()
+                
+            logger.info("Successfully initialized Hugging Face client")
             return True
             
-        raise ValueError(f"API test failed with status code: {response.status_code}")
-        
-    except requests.Timeout:
-        print("Connection timeout. Please try again.")
-        return False
-    except requests.RequestException as e:
-        print(f"Network error: {str(e)}")
-        return False
-    except Exception as e:
-        print(f"Error initializing LLM: {str(e)}")
-        print("\nPlease ensure you have:")
-        print("1. Set the HUGGINGFACE_TOKEN environment variable")
-        print("2. Created an API token at https://huggingface.co/settings/tokens")
+        except asyncio.TimeoutError:
+            logger.error("Connection timeout. Please try again.")
+        except aiohttp.ClientError as e:
+            logger.error("Network error: %s", e)
+        except Exception as e:
+            logger.error(
+                "Error initializing LLM: %s. Please ensure you have set the HUGGINGFACE_TOKEN "
+                "environment variable (create a token at https://huggingface.co/settings/tokens)", e
+            )
+        span.set(initialized=False)
         return False
 
 def analyze_skills(skills: List[str]) -> Dict:
@@ -69,70 +80,186 @@ def analyze_education(education: List[Dict]) -> str:
 async def analyze_candidate(
     resume_pdf: bytes,
     github_username: Optional[str] = None,
-    hackathons: Optional[List[Dict]] = None
+    hackathons: Optional[List[Dict]] = None,
+    linkedin_pdf: Optional[bytes] = None,
+    scorer: Optional[EnhancedResumeScorer] = None,
+    matcher: Optional[HackathonMatcher] = None
 ) -> Dict:
     """
-    Analyze a candidate's profile and match with hackathons
+    Analyze a candidate's profile and match with hackathons.
+
+    Pass a shared ``scorer`` (and ``matcher``) to skip the per-call LLM check
+    and model setup, as the batch API does. Sources and analyses run as one
+    stage graph with GitHub fetched once; per-stage seconds are returned
+    under ``timings``. With tracing enabled the run is one trace whose ID is
+    returned under ``trace_id``.
     """
+    owns_scorer = scorer is None
     try:
-        if not initialize_llm():
-            raise RuntimeError("Failed to initialize LLM")
+        with tracing.span('analyze_candidate', github=bool(github_username),
+                          linkedin=linkedin_pdf is not None) as span:
+            if owns_scorer:
+                config = Config()
+                if not await initialize_llm(config):
+                    raise RuntimeError("Failed to initialize LLM")
+                scorer = EnhancedResumeScorer(config)
             
-        config = Config()
-        scorer = EnhancedResumeScorer(config)
-        
-        # Initialize analysis dict
-        analysis = {}
-        
-        # Analyze resume
-        resume_analysis = await scorer.analyze_profile(
-            resume_pdf,
-            github_username
-        )
-        analysis['resume_analysis'] = resume_analysis
-        
-        # Add GitHub analysis if username provided
-        if github_username:
-            github_analysis = await analyze_github_profile(github_username)
-            analysis['github_analysis'] = github_analysis
-        
-        # Match with hackathons if provided
-        if hackathons:
-            matcher = HackathonMatcher()
-            matches = matcher.match_hackathons(resume_analysis, hackathons)
-            analysis['hackathon_matches'] = matches
+            pipeline = scorer.build_pipeline(github_events=bool(github_username))
+            
+            # GitHub analysis reuses the data fetched for the resume analysis
+            def github_analysis(github_snapshot):
+                if github_snapshot is None:
+                    return None
+                return summarize_github_profile(scorer.profile_parser.build_github_profile(github_snapshot))
+            pipeline.add('github_analysis', github_analysis, deps=['github_snapshot'])
+            
+            # Match with hackathons if provided
+            def hackathon_matches(resume_analysis, hackathons):
+                if not hackathons:
+                    return None
+                return (matcher or HackathonMatcher()).match_hackathons(resume_analysis, hackathons)
+            pipeline.add('hackathon_matches', hackathon_matches, deps=['resume_analysis', 'hackathons'])
+            
+            # Duplicate submissions in flight on the same scorer share one run
+            flight_key = content_key(
+                'candidate', resume_pdf, github_username, linkedin_pdf,
+                json.dumps(hackathons, sort_keys=True, default=str)
+            )
+            result = await scorer.inflight.do(flight_key, lambda: pipeline.run(
+                resume_pdf=resume_pdf,
+                github_username=github_username,
+                linkedin_pdf=linkedin_pdf,
+                hackathons=hackathons
+            ))
             
-        return analysis
+            analysis = {'resume_analysis': result['resume_analysis']}
+            for key in ('github_analysis', 'hackathon_matches'):
+                if result[key] is not None:
+                    analysis[key] = result[key]
+            analysis['timings'] = result.timings
+            if span.trace_id:
+                analysis['trace_id'] = span.trace_id
+            return analysis
         
     except Exception as e:
-        print(f"Error in analyze_candidate: {str(e)}")
+        logger.error("Error in analyze_candidate: %s", e)
         raise
+    finally:
+        if owns_scorer and scorer is not None:
+            await scorer.close()
 
-async def analyze_github_profile(username: str) -> Dict:
-    try:
-        parser = ProfileParser()
-        github_data = await parser.parse_github_profile(username)
-        
-        # GitHub-specific analysis
-        analysis_results = {
-            'profile_data': github_data,
-            'analysis': {
-                'repository_count': len(github_data.get('repositories', [])),
-                'total_stars': sum(repo.get('stars', 0) for repo in github_data.get('repositories', [])),
-                'languages': github_data.get('languages', {}),
-                'contribution_level': github_data.get('contributions_last_year', 0),
-                'top_projects': sorted(
-                    github_data.get('repositories', []),
-                    key=lambda x: x.get('stars', 0),
-                    reverse=True
-                )[:5]
-            }
-        }
+CandidateStream = Union[Iterable[Dict], AsyncIterable[Dict]]
+
+async def _aiter_candidates(candidates: CandidateStream) -> AsyncIterator[Dict]:
+    """Iterate a sync or async stream of candidate dicts"""
+    if hasattr(candidates, '__aiter__'):
+        async for candidate in candidates:
+            yield candidate
+    else:
+        for candidate in candidates:
+            yield candidate
+
+async def iter_candidate_analyses(
+    candidates: CandidateStream,
+    concurrency: Optional[int] = None,
+    config: Optional[Config] = None
+) -> AsyncIterator[Tuple[int, Dict]]:
+    """
+    Analyze a stream of candidates, yielding ``(index, result)`` as each completes.
+
+    Every candidate is a dict with the ``analyze_candidate`` keyword arguments
+    (``resume_pdf``, ``github_username``, ``hackathons``, ``linkedin_pdf``).
+    A single scorer and matcher are shared by the whole batch and at most
+    ``concurrency`` candidates are in flight at once; the input stream is only
+    consumed as slots free up. A failed candidate yields ``{'error': ...}``
+    instead of aborting the batch.
+    """
+    config = config or Config()
+    if not await initialize_llm(config):
+        raise RuntimeError("Failed to initialize LLM")
         
-        return analysis_results
+    concurrency = max(1, concurrency or config.BATCH_CONCURRENCY)
+    scorer = EnhancedResumeScorer(config)
+    matcher = HackathonMatcher()
+    
+    async def run(index: int, candidate: Dict) -> Tuple[int, Dict]:
+        try:
+            result = await analyze_candidate(
+                resume_pdf=candidate['resume_pdf'],
+                github_username=candidate.get('github_username'),
+                hackathons=candidate.get('hackathons'),
+                linkedin_pdf=candidate.get('linkedin_pdf'),
+                scorer=scorer,
+                matcher=matcher
+            )
+        except Exception as e:
+            result = {'error': str(e)}
+        return index, result
+    
+    pending = set()
+    index = 0
+    try:
+        async for candidate in _aiter_candidates(candidates):
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+            pending.add(asyncio.ensure_future(run(index, candidate)))
+            index += 1
+            
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        await scorer.close()
+
+async def analyze_candidates(
+    candidates: CandidateStream,
+    concurrency: Optional[int] = None,
+    config: Optional[Config] = None
+) -> List[Dict]:
+    """Analyze a batch of candidates and return the results in input order"""
+    results = {}
+    async for index, result in iter_candidate_analyses(candidates, concurrency, config):
+        results[index] = result
+    return [results[i] for i in range(len(results))]
+
+async def analyze_github_profile(username: str, parser: Optional[ProfileParser] = None) -> Dict:
+    try:
+        parser = parser or ProfileParser()
+        return summarize_github_profile(await parser.parse_github_profile(username))
     except Exception as e:
         raise ValueError(f"Failed to analyze GitHub profile: {str(e)}")
 
+def summarize_github_profile(github_data: Dict) -> Dict:
+    """GitHub-specific analysis of a parsed profile"""
+    return {
+        'profile_data': github_data,
+        'analysis': {
+            'repository_count': len(github_data.get('repositories', [])),
+            'total_stars': sum(repo.get('stars', 0) for repo in github_data.get('repositories', [])),
+            'languages': github_data.get('languages', {}),
+            'contribution_level': github_data.get('contributions_last_year', 0),
+            'top_projects': sorted(
+                github_data.get('repositories', []),
+                key=lambda x: x.get('stars', 0),
+                reverse=True
+            )[:5]
+        }
+    }
+
+async def analyze_linkedin_profile(pdf_content: bytes, parser: Optional[ProfileParser] = None) -> Dict:
+    """Parse a LinkedIn PDF export into profile text and its structured fields"""
+    try:
+        parser = parser or ProfileParser()
+        linkedin = await parser._parse_linkedin_pdf(pdf_content)
+        return {'profile_text': linkedin.text, 'profile_data': asdict(linkedin)}
+    except Exception as e:
+        raise ValueError(f"Failed to analyze LinkedIn profile: {str(e)}")
+
 def print_analysis_results(results: Dict):
     """Pretty print analysis results"""
     print("\n" + "="*50)
@@ -1,5 +1,20 @@
-from resume_analysis.models.enhanced_resume_scorer import EnhancedResumeScorer
-from resume_analysis.models.llm_analyzer import LLMAnalyzer
-from resume_analysis.models.resume_scorer import ResumeScorer
-from resume_analysis.models.hackathon_matcher import HackathonMatcher
-from resume_analysis.models.skill_extractor import SkillExtractor
+import importlib
+
+_LAZY_ATTRS = {
+    'EnhancedResumeScorer': 'resume_analysis.models.enhanced_resume_scorer',
+    'LLMAnalyzer': 'resume_analysis.models.llm_analyzer',
+    'ResumeScorer': 'resume_analysis.models.resume_scorer',
+    'HackathonMatcher': 'resume_analysis.models.hackathon_matcher',
+    'CandidateIndex': 'resume_analysis.models.candidate_index',
+    'SkillExtractor': 'resume_analysis.models.skill_extractor',
+}
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRS))
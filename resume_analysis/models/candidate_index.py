@@ -0,0 +1,115 @@
+from typing import Dict, Hashable, List, Optional
+import bisect
+from resume_analysis.models.hackathon_matcher import HackathonMatcher
+
+class CandidateIndex:
+    """
+    In-memory top-N index of scored candidates per hackathon track.
+
+    For each track the candidates are kept sorted by their undiscounted
+    compatibility (``HackathonMatcher`` weights before the difficulty factor).
+    The difficulty factor is one positive constant per query, so it does not
+    change the order, and the track's ``min_score`` becomes a bisect
+    threshold. A query costs O(log N + n) and an insertion O(log N) plus a
+    list shift, so new analyses can be added as they arrive.
+    """
+    
+    def __init__(self, tracks: Optional[Dict[str, Dict]] = None):
+        self.tracks = tracks or HackathonMatcher.TRACKS
+        # Per track: ascending keys and the candidate ids in the same order
+        self._keys: Dict[str, List[float]] = {track: [] for track in self.tracks}
+        self._ids: Dict[str, List[Hashable]] = {track: [] for track in self.tracks}
+        self._entries: Dict[Hashable, Dict[str, float]] = {}
+        
+    def __len__(self) -> int:
+        return len(self._entries)
+        
+    def __contains__(self, candidate_id: Hashable) -> bool:
+        return candidate_id in self._entries
+        
+    def _track_keys(self, enhanced_analysis: Dict) -> Dict[str, float]:
+        """Compatibility of the candidate with each track before the difficulty factor"""
+        weights = HackathonMatcher.COMPATIBILITY_WEIGHTS
+        enhanced_scores = enhanced_analysis.get('enhanced_scores', {})
+        llm_analysis = enhanced_analysis.get('llm_analysis', {})
+        base = (
+            weights['technical_depth'] * llm_analysis.get('technical_analysis', {}).get('skill_depth_score', 0) +
+            weights['project_complexity'] * llm_analysis.get('project_evaluation', {}).get('project_score', 0)
+        ) / 10
+        return {
+            track: weights['domain_score'] * enhanced_scores.get(track, {}).get('score', 0) / 10 + base
+            for track in self.tracks
+        }
+        
+    def add(self, candidate_id: Hashable, enhanced_analysis: Dict) -> None:
+        """Index (or re-index) one ``EnhancedResumeScorer.analyze_profile`` result"""
+        if candidate_id in self._entries:
+            self.remove(candidate_id)
+        entry = self._track_keys(enhanced_analysis)
+        for track, key in entry.items():
+            keys = self._keys[track]
+            position = bisect.bisect_right(keys, key)
+            keys.insert(position, key)
+            self._ids[track].insert(position, candidate_id)
+        self._entries[candidate_id] = entry
+        
+    def add_many(self, analyses: Dict[Hashable, Dict]) -> None:
+        """Bulk load ``{candidate_id: enhanced_analysis}``, sorting each track once"""
+        for candidate_id, enhanced_analysis in analyses.items():
+            self._entries[candidate_id] = self._track_keys(enhanced_analysis)
+        for track in self.tracks:
+            ordered = sorted(self._entries, key=lambda candidate_id: self._entries[candidate_id][track])
+            self._ids[track] = ordered
+            self._keys[track] = [self._entries[candidate_id][track] for candidate_id in ordered]
+            
+    def remove(self, candidate_id: Hashable) -> None:
+        """Drop a candidate; unknown ids are ignored"""
+        entry = self._entries.pop(candidate_id, None)
+        if entry is None:
+            return
+        for track, key in entry.items():
+            keys, ids = self._keys[track], self._ids[track]
+            position = bisect.bisect_left(keys, key)
+            while ids[position] != candidate_id:
+                position += 1
+            del keys[position]
+            del ids[position]
+            
+    def top_candidates(
+        self,
+        track: str,
+        n: int = 10,
+        difficulty: Optional[str] = None,
+        min_score: Optional[float] = None
+    ) -> List[Dict]:
+        """
+        Best ``n`` candidates for a track, best first.
+
+        Only candidates whose compatibility (after the ``difficulty`` factor)
+        reaches ``min_score`` (the track's by default) are returned.
+        """
+        if track not in self.tracks:
+            raise ValueError(f"Unknown track: {track}")
+        factor = HackathonMatcher.DIFFICULTY_FACTORS.get(difficulty, 1.0)
+        if min_score is None:
+            min_score = self.tracks[track]['min_score']
+            
+        keys, ids = self._keys[track], self._ids[track]
+        # Scores are capped at 1, so min_score > 1 cannot be reached
+        if min_score > 1:
+            return []
+        start = bisect.bisect_left(keys, min_score / factor)
+        start = max(start, len(keys) - max(n, 0))
+        return [{
+            'candidate_id': ids[i],
+            'compatibility_score': round(min(max(keys[i] * factor, 0), 1), 2)
+        } for i in range(len(keys) - 1, start - 1, -1)]
+        
+    def top_for_hackathon(self, hackathon: Dict, n: int = 10) -> List[Dict]:
+        """Best ``n`` candidates for an event, by its primary track and difficulty"""
+        return self.top_candidates(
+            hackathon.get('primary_track', ''),
+            n,
+            difficulty=hackathon.get('difficulty'),
+            min_score=hackathon.get('min_score')
+        )
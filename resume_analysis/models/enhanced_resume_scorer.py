@@ -2,18 +2,117 @@ from typing import Dict, Optional
 from resume_analysis.models.llm_analyzer import LLMAnalyzer
 from resume_analysis.models.resume_scorer import ResumeScorer
 from resume_analysis.config import Config
+from resume_analysis.models.profile import CandidateProfile
+from resume_analysis.pipeline import Pipeline
 from resume_analysis.utils.exceptions import ResumeAnalysisError
 from resume_analysis.parsers.profile_parser import ProfileParser
-import re
+from resume_analysis.utils.github_client import GitHubClient
+from resume_analysis.utils.cache import content_key, create_cache
+from resume_analysis.utils.singleflight import SingleFlight
+from resume_analysis.utils.response_store import create_response_store
+from resume_analysis.utils.rate_limiter import get_rate_limiters
+import asyncio
 
 class EnhancedResumeScorer:
+    # Bump when skill extraction or domain scoring change so cached scores are not reused
+    SCORING_VERSION = "1"
+    
     def __init__(self, config: Config):
         self.config = config
-        self.llm_analyzer = LLMAnalyzer(config)
-        self.traditional_scorer = ResumeScorer(config.GITHUB_TOKEN)
+        # One cache (memory + disk) for PDF text and LLM output
+        self.cache = create_cache(config)
+        self.llm_analyzer = LLMAnalyzer(config, cache=self.cache)
+        # One pooled GitHub client shared by the parser and the GitHub analyzer,
+        # over a persistent store of its responses and their ETags
+        self.github_store = create_response_store(config)
+        self.github_client = GitHubClient(
+            config.GITHUB_TOKEN,
+            store=self.github_store,
+            rate_limiters=get_rate_limiters(config),
+            repo_sort=config.GITHUB_REPO_SORT,
+            repo_limit=config.GITHUB_MAX_REPOS,
+            repo_scan_limit=config.GITHUB_MAX_SCANNED_REPOS
+        )
+        self.traditional_scorer = ResumeScorer(config.GITHUB_TOKEN, self.github_client)
         self.profile_parser = ProfileParser({
-            'github_token': config.GITHUB_TOKEN
-        })
+            'github_token': config.GITHUB_TOKEN,
+            'cache_content_ttl': config.CACHE_CONTENT_TTL,
+            'pdf_workers': config.PDF_WORKERS,
+            'pdf_max_pages': config.PDF_MAX_PAGES,
+            'pdf_max_bytes': config.PDF_MAX_BYTES,
+            'pdf_pages_per_task': config.PDF_PAGES_PER_TASK,
+            'github_max_text_chars': config.GITHUB_MAX_TEXT_CHARS
+        }, self.github_client, self.cache)
+        # Identical analyses in flight (duplicate submissions, retries) run once
+        self.inflight = SingleFlight()
+    
+    def stats(self) -> Dict[str, Dict]:
+        """Work saved by coalescing identical in-flight calls, per layer, plus cache counters"""
+        return {
+            'analyses': self.inflight.stats(),
+            'github_requests': self.github_client.inflight.stats(),
+            'llm_calls': self.llm_analyzer.inflight.stats(),
+            'cache': self.cache.stats(),
+            'github_store': self.github_store.stats()
+        }
+    
+    async def close(self) -> None:
+        """Release pooled HTTP connections"""
+        await asyncio.gather(self.github_client.close(), self.llm_analyzer.close())
+        self.cache.close()
+        self.github_store.close()
+    
+    def build_pipeline(self, github_events: bool = False) -> Pipeline:
+        """
+        Per-candidate stage graph from the raw inputs to ``resume_analysis``.
+
+        Inputs are ``resume_pdf``, ``github_username`` and ``linkedin_pdf``.
+        The three sources are parsed concurrently, the traditional scorer starts
+        once the resume is parsed and GitHub fetched, and GitHub is fetched once
+        into ``github_snapshot`` for every stage that needs it, the traditional
+        scorer's GitHub domain analysis included (with events when
+        ``github_events`` is set). Callers may add their own stages.
+
+        Intermediate results are cached per source fingerprint: the parsed
+        PDFs, the traditional scores by resume text and GitHub snapshot and the
+        LLM sections by source text. Re-analyzing a candidate after one source changed only
+        recomputes what depends on that source; the rest is merged from cache.
+        """
+        parser = self.profile_parser
+        
+        async def fetch_github(github_username):
+            if github_events or parser.github_token:
+                return await parser.fetch_github(github_username, events=github_events)
+            return None
+            
+        async def traditional_analysis(resume, github_snapshot):
+            # The GitHub domain scores come from the snapshot already fetched
+            text = resume.text if resume else ''
+            github_key = github_snapshot.fingerprint() if github_snapshot is not None else None
+            return await self.cache.get_or_compute(
+                content_key('traditional_analysis', self.SCORING_VERSION, text, github_key),
+                lambda: self.traditional_scorer.analyze_async(text, github_snapshot=github_snapshot),
+                self.config.CACHE_CONTENT_TTL
+            )
+            
+        async def llm_analysis(profile):
+            return await self.llm_analyzer.analyze_sources(profile.llm_texts())
+            
+        def resume_analysis(traditional_analysis, llm_analysis, profile):
+            return self._combine_analyses(traditional_analysis, llm_analysis, profile)
+            
+        return (
+            Pipeline()
+            .add('resume', parser.parse_resume, deps=['resume_pdf'])
+            .add('github_snapshot', fetch_github, deps=['github_username'])
+            .add('linkedin', parser.parse_linkedin, deps=['linkedin_pdf'])
+            .add('github', parser.build_github_source, deps=['github_username', 'github_snapshot'])
+            .add('profile', CandidateProfile, deps=['resume', 'github', 'linkedin'])
+            .add('traditional_analysis', traditional_analysis, deps=['resume', 'github_snapshot'])
+            .add('llm_analysis', llm_analysis, deps=['profile'])
+            .add('resume_analysis', resume_analysis,
+                 deps=['traditional_analysis', 'llm_analysis', 'profile'])
+        )
     
     async def analyze_profile(
         self,
@@ -21,63 +120,35 @@ class EnhancedResumeScorer:
         github_username: Optional[str] = None,
         linkedin_pdf: Optional[bytes] = None
     ) -> Dict:
-        try:
-            # Parse all sources into concatenated text
-            concatenated_text = await self.profile_parser.parse_all_sources(
-                resume_pdf,
-                github_username,
-                linkedin_pdf
+        async def analyze() -> Dict:
+            result = await self.build_pipeline().run(
+                resume_pdf=resume_pdf,
+                github_username=github_username,
+                linkedin_pdf=linkedin_pdf
             )
+            return result['resume_analysis']
             
-            # Extract section-specific content
-            sections = self._split_sections(concatenated_text)
-            
-            # Perform analyses
-            traditional_analysis = await self.traditional_scorer.analyze_async(sections['resume'])
-            llm_analysis = await self.llm_analyzer.analyze_resume(concatenated_text)
-            
-            return self._combine_analyses(
-                traditional_analysis, 
-                llm_analysis,
-                sections
-            )
+        try:
+            # Concurrent identical submissions share one run (and its result)
+            key = content_key('profile', resume_pdf, github_username, linkedin_pdf)
+            return await self.inflight.do(key, analyze)
             
         except Exception as e:
             raise ResumeAnalysisError(f"Analysis failed: {str(e)}")
     
-    def _split_sections(self, concatenated_text: str) -> Dict[str, str]:
-        """Split concatenated text into its component sections"""
-        sections = {
-            'resume': '',
-            'github': '',
-            'linkedin': ''
-        }
-        
-        # Split text on section markers
-        parts = re.split(r'\n===\n', concatenated_text)
-        for part in parts:
-            if 'RESUME SECTION:' in part:
-                sections['resume'] = part.split('RESUME SECTION:')[1].strip()
-            elif 'GITHUB SECTION:' in part:
-                sections['github'] = part.split('GITHUB SECTION:')[1].strip()
-            elif 'LINKEDIN SECTION:' in part:
-                sections['linkedin'] = part.split('LINKEDIN SECTION:')[1].strip()
-                
-        return sections
-    
-    def _combine_analyses(self, traditional: Dict, llm: Dict, sections: Dict[str, str]) -> Dict:
+    def _combine_analyses(self, traditional: Dict, llm: Dict, profile: CandidateProfile) -> Dict:
         """Combine traditional and LLM analyses into enhanced scores"""
         if not traditional.get('domain_scores'):
             return {}
         
         try:
             enhanced_scores = {}
+            completeness = profile.source_completeness()
+            github_factor = 1.0 if completeness['github'] else 0.8
+            linkedin_factor = 1.0 if completeness['linkedin'] else 0.9
             
             # Calculate domain-specific enhanced scores
             for domain in traditional['domain_scores']:
-                github_factor = 1.0 if sections.get('github') else 0.8
-                linkedin_factor = 1.0 if sections.get('linkedin') else 0.9
-                
                 traditional_score = traditional['domain_scores'].get(domain, 0)
                 llm_technical_score = llm.get('technical_analysis', {}).get('skill_depth_score', 0)
                 llm_project_score = llm.get('project_evaluation', {}).get('project_score', 0)
@@ -92,11 +163,7 @@ class EnhancedResumeScorer:
                     'technical_depth': llm.get('technical_analysis', {}),
                     'project_insights': llm.get('project_evaluation', {}),
                     'growth_potential': llm.get('growth_assessment', {}),
-                    'source_completeness': {
-                        'resume': bool(sections.get('resume')),
-                        'github': bool(sections.get('github')),
-                        'linkedin': bool(sections.get('linkedin'))
-                    }
+                    'source_completeness': dict(completeness)
                 }
             
             # Return combined analysis with all components
@@ -104,7 +171,8 @@ class EnhancedResumeScorer:
                 'enhanced_scores': enhanced_scores,
                 'llm_analysis': llm,
                 'traditional_analysis': traditional,
-                'recommendations': self._generate_recommendations(enhanced_scores)
+                'recommendations': self._generate_recommendations(enhanced_scores),
+                'source_fingerprints': profile.fingerprints()
             }
             
         except Exception as e:
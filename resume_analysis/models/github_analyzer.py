@@ -1,16 +1,17 @@
-from github import Github
 from typing import Dict, List, Optional
 from collections import defaultdict
-import pandas as pd
+from resume_analysis.utils.github_client import GitHubClient, GitHubSnapshot
 
 class GitHubAnalyzer:
-    def __init__(self, access_token: str):
-        self.github = Github(access_token)
+    def __init__(self, access_token: str, client: Optional[GitHubClient] = None):
+        self.github = client or GitHubClient(access_token)
         
-    def analyze_profile(self, username: str) -> Dict:
-        user = self.github.get_user(username)
-        repos = user.get_repos()
+    async def analyze_profile(self, username: str) -> Dict:
+        return self.analyze_snapshot(await self.github.get_snapshot(username))
         
+    def analyze_snapshot(self, snapshot: GitHubSnapshot) -> Dict:
+        """Domain analysis of an already fetched snapshot"""
+        # Topics come with the repo listing, so no per-repo requests are needed
         analysis = {
             'total_repos': 0,
             'languages': defaultdict(int),
@@ -20,16 +21,16 @@ class GitHubAnalyzer:
             'domain_scores': defaultdict(float)
         }
         
-        for repo in repos:
+        for repo in snapshot.repos:
             analysis['total_repos'] += 1
-            analysis['stars'] += repo.stargazers_count
+            analysis['stars'] += repo.get('stargazers_count', 0)
             
             # Analyze languages
-            if repo.language:
-                analysis['languages'][repo.language] += 1
+            if repo.get('language'):
+                analysis['languages'][repo['language']] += 1
             
             # Analyze topics
-            for topic in repo.get_topics():
+            for topic in repo.get('topics') or []:
                 analysis['topics'][topic] += 1
         
         # Calculate domain scores based on repos and topics
@@ -1,49 +1,68 @@
-from typing import Dict, List
-import pandas as pd
-from sklearn.ensemble import RandomForestClassifier
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 from  .resume_scorer import ResumeScorer
+from resume_analysis.utils import tracing
+
+if TYPE_CHECKING:
+    import numpy as np
 
 class HackathonMatcher:
+    COMPATIBILITY_WEIGHTS = {
+        'domain_score': 0.4,
+        'technical_depth': 0.3,
+        'project_complexity': 0.3
+    }
+    DIFFICULTY_FACTORS = {
+        'Beginner': 1.2,
+        'Intermediate': 1.0,
+        'Advanced': 0.8
+    }
+    TRACKS = {
+        'ai_ml': {
+            'name': 'AI/ML',
+            'min_score': 0.6,
+            'recommended_skills': ['Python', 'TensorFlow', 'PyTorch', 'Data Science']
+        },
+        'web_dev': {
+            'name': 'Web Development',
+            'min_score': 0.5,
+            'recommended_skills': ['JavaScript', 'React', 'Node.js', 'HTML/CSS']
+        },
+        'blockchain': {
+            'name': 'Blockchain',
+            'min_score': 0.65,
+            'recommended_skills': ['Solidity', 'Web3.js', 'Smart Contracts']
+        },
+        'cloud': {
+            'name': 'Cloud Computing',
+            'min_score': 0.55,
+            'recommended_skills': ['AWS', 'Azure', 'Docker', 'Kubernetes']
+        },
+        'cybersecurity': {
+            'name': 'Cybersecurity',
+            'min_score': 0.7,
+            'recommended_skills': ['Network Security', 'Cryptography', 'Penetration Testing']
+        }
+    }
+    
     def __init__(self, historical_data_path: str = None):
         self.resume_scorer = ResumeScorer()
-        self.model = RandomForestClassifier()
+        self.model = None  # Trained lazily; sklearn is only imported when historical data is given
         if historical_data_path:
             self._train_model(historical_data_path)
-        self.tracks = {
-            'ai_ml': {
-                'name': 'AI/ML',
-                'min_score': 0.6,
-                'recommended_skills': ['Python', 'TensorFlow', 'PyTorch', 'Data Science']
-            },
-            'web_dev': {
-                'name': 'Web Development',
-                'min_score': 0.5,
-                'recommended_skills': ['JavaScript', 'React', 'Node.js', 'HTML/CSS']
-            },
-            'blockchain': {
-                'name': 'Blockchain',
-                'min_score': 0.65,
-                'recommended_skills': ['Solidity', 'Web3.js', 'Smart Contracts']
-            },
-            'cloud': {
-                'name': 'Cloud Computing',
-                'min_score': 0.55,
-                'recommended_skills': ['AWS', 'Azure', 'Docker', 'Kubernetes']
-            },
-            'cybersecurity': {
-                'name': 'Cybersecurity',
-                'min_score': 0.7,
-                'recommended_skills': ['Network Security', 'Cryptography', 'Penetration Testing']
-            }
-        }
+        self.tracks = self.TRACKS
     
     def _train_model(self, data_path: str):
+        import pandas as pd
+        from sklearn.ensemble import RandomForestClassifier
+        
+        self.model = RandomForestClassifier()
         # Load and prepare historical data
         data = pd.read_csv(data_path)
         X = data[['domain_score', 'experience', 'github_score']]
         y = data['accepted']
         self.model.fit(X, y)
     
+    @tracing.traced('hackathon_matcher.match')
     def match_hackathons(self, enhanced_analysis: Dict, hackathons: List[Dict]) -> List[Dict]:
         """Match candidate with hackathons based on enhanced analysis"""
         matches = []
@@ -97,11 +116,7 @@ class HackathonMatcher:
     def _calculate_compatibility(self, domain_score: float, technical_depth: Dict, 
                                project_evaluation: Dict, hackathon: Dict, track: str) -> float:
         """Calculate compatibility score between candidate and hackathon"""
-        weights = {
-            'domain_score': 0.4,
-            'technical_depth': 0.3,
-            'project_complexity': 0.3
-        }
+        weights = self.COMPATIBILITY_WEIGHTS
         
         # Normalize scores to 0-1 range
         technical_score = technical_depth.get('skill_depth_score', 0) / 10
@@ -109,11 +124,7 @@ class HackathonMatcher:
         domain_score = domain_score / 10
         
         # Apply difficulty adjustment
-        difficulty_factor = {
-            'Beginner': 1.2,
-            'Intermediate': 1.0,
-            'Advanced': 0.8
-        }.get(hackathon.get('difficulty'), 1.0)
+        difficulty_factor = self.DIFFICULTY_FACTORS.get(hackathon.get('difficulty'), 1.0)
         
         raw_score = (
             weights['domain_score'] * domain_score +
@@ -127,11 +138,14 @@ class HackathonMatcher:
                                      hackathon: Dict, track: str) -> Dict:
         """Generate track-specific recommendations"""
         track_info = self.tracks[track]
-        missing_skills = [
-            skill for skill in track_info['recommended_skills']
-            if skill not in enhanced_analysis.get('llm_analysis', {})
+        achievements = set(
+            enhanced_analysis.get('llm_analysis', {})
                 .get('technical_analysis', {})
                 .get('key_technical_achievements', [])
+        )
+        missing_skills = [
+            skill for skill in track_info['recommended_skills']
+            if skill not in achievements
         ]
         
         return {
@@ -141,4 +155,105 @@ class HackathonMatcher:
             'preparation_tips': [
                 f"Focus on learning {skill}" for skill in missing_skills[:3]
             ] if missing_skills else ["You have the core skills for this track!"]
-        } 
\ No newline at end of file
+        }
+    
+    def compatibility_matrix(self, analyses: List[Dict], hackathons: List[Dict]) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        Compatibility of every candidate with every hackathon in one vectorized pass.
+
+        Returns the ``len(analyses) x len(hackathons)`` score matrix (0-1, same
+        formula as ``_calculate_compatibility``) and a boolean mask of the pairs
+        reaching the track's ``min_score``. Hackathons without a known primary
+        track never match.
+        """
+        import numpy as np
+        
+        track_names = list(self.tracks)
+        track_index = {track: i for i, track in enumerate(track_names)}
+        
+        # Candidate features: domain scores per track plus the LLM depth and project scores
+        domain = np.zeros((len(analyses), len(track_names)))
+        technical = np.zeros(len(analyses))
+        project = np.zeros(len(analyses))
+        for i, analysis in enumerate(analyses):
+            enhanced_scores = analysis.get('enhanced_scores', {})
+            for j, track in enumerate(track_names):
+                domain[i, j] = enhanced_scores.get(track, {}).get('score', 0)
+            llm_analysis = analysis.get('llm_analysis', {})
+            technical[i] = llm_analysis.get('technical_analysis', {}).get('skill_depth_score', 0)
+            project[i] = llm_analysis.get('project_evaluation', {}).get('project_score', 0)
+            
+        # Hackathon features: track column, difficulty factor and threshold
+        valid = np.array([h.get('primary_track', '') in track_index for h in hackathons], dtype=bool)
+        columns = np.array([track_index.get(h.get('primary_track', ''), 0) for h in hackathons], dtype=int)
+        difficulty = np.array([self.DIFFICULTY_FACTORS.get(h.get('difficulty'), 1.0) for h in hackathons])
+        min_score = np.array([
+            self.tracks[track_names[c]]['min_score'] if ok else np.inf
+            for c, ok in zip(columns, valid)
+        ])
+        
+        weights = self.COMPATIBILITY_WEIGHTS
+        candidate_base = (
+            weights['technical_depth'] * technical +
+            weights['project_complexity'] * project
+        ) / 10
+        raw = (weights['domain_score'] * domain[:, columns] / 10 + candidate_base[:, None]) * difficulty
+        scores = np.clip(raw, 0, 1)
+        return scores, scores >= min_score
+    
+    @tracing.traced('hackathon_matcher.match_batch')
+    def match_batch(self, analyses: List[Dict], hackathons: List[Dict], top_k: Optional[int] = 10,
+                    per: str = 'candidate') -> List[List[Dict]]:
+        """
+        Top-K matches for many candidates against many hackathons.
+
+        With ``per='candidate'`` returns, for each analysis, its best matching
+        hackathons; with ``per='hackathon'``, for each hackathon, its best
+        candidates (by index into ``analyses``). Only pairs above the track's
+        ``min_score`` are returned, best first. ``top_k=None`` keeps all.
+        """
+        if per not in ('candidate', 'hackathon'):
+            raise ValueError(f"per must be 'candidate' or 'hackathon', not {per!r}")
+        if not analyses or not hackathons:
+            return [[] for _ in (analyses if per == 'candidate' else hackathons)]
+            
+        scores, mask = self.compatibility_matrix(analyses, hackathons)
+        if per == 'hackathon':
+            scores, mask = scores.T, mask.T
+            
+        results = []
+        for row, indices in enumerate(self._top_k(scores, mask, top_k)):
+            if per == 'candidate':
+                results.append([{
+                    'hackathon': hackathons[j],
+                    'hackathon_index': j,
+                    'compatibility_score': round(float(scores[row, j]), 2)
+                } for j in indices])
+            else:
+                results.append([{
+                    'candidate_index': j,
+                    'compatibility_score': round(float(scores[row, j]), 2)
+                } for j in indices])
+        return results
+    
+    @staticmethod
+    def _top_k(scores: 'np.ndarray', mask: 'np.ndarray', k: Optional[int]) -> List[List[int]]:
+        """Column indices of each row's ``k`` best unmasked scores, best first"""
+        import numpy as np
+        
+        masked = np.where(mask, scores, -np.inf)
+        n_rows, n_cols = masked.shape
+        k = n_cols if k is None else min(k, n_cols)
+        if k <= 0:
+            return [[] for _ in range(n_rows)]
+            
+        # Partition out the k best per row, then sort only those
+        if k < n_cols:
+            top = np.argpartition(-masked, k - 1, axis=1)[:, :k]
+        else:
+            top = np.broadcast_to(np.arange(n_cols), (n_rows, n_cols))
+        order = np.argsort(-np.take_along_axis(masked, top, axis=1), axis=1, kind='stable')
+        top = np.take_along_axis(top, order, axis=1)
+        
+        valid = np.take_along_axis(mask, top, axis=1)
+        return [row[keep].tolist() for row, keep in zip(top, valid)]
@@ -1,129 +1,171 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import json
 import asyncio
-from resume_analysis.utils.cache import Cache
+import logging
+from resume_analysis.utils.cache import TieredCache, content_key, create_cache
 from resume_analysis.utils.exceptions import LLMError
+from resume_analysis.utils.singleflight import SingleFlight
+from resume_analysis.utils import tracing
+from resume_analysis.models.llm_backends import LLMBackend, create_backend
 from ..config import Config
-import requests
 import re
 
+logger = logging.getLogger(__name__)
+
+_JSON_DECODER = json.JSONDecoder()
+
 class LLMAnalyzer:
-    def __init__(self, config: Optional[Config] = None):
+    # Bump when prompts or response parsing change so cached results are not reused
+    PROMPT_VERSION = "3"
+    
+    # Special tokens and the prompt/text boundary, which the template alone does not count
+    PROMPT_TOKEN_MARGIN = 8
+    # Smallest chunk used even when the prompts leave less room
+    MIN_CHUNK_TOKENS = 64
+    
+    # Values used for a category when the model output lacks or garbles a field
+    CATEGORY_DEFAULTS = {
+        'technical_depth': {
+            'skill_depth_score': 5.0,
+            'key_technical_achievements': [],
+            'project_score': 5.0,
+            'technical_complexity': 'Medium'
+        },
+        'soft_skills': {
+            'score': 5.0,
+            'communication': 5.0,
+            'leadership': 5.0,
+            'teamwork': 5.0,
+            'key_attributes': []
+        },
+        'project_analysis': {
+            'project_score': 5.0,
+            'technical_complexity': 'Medium',
+            'recommended_projects': []
+        },
+        'growth_potential': {
+            'score': 5.0,
+            'growth_indicators': [],
+            'improvement_areas': []
+        }
+    }
+    
+    # What each category prompt asks the model to assess
+    CATEGORY_FOCUS = {
+        'technical_depth': 'technical skills and their depth',
+        'soft_skills': 'soft skills such as communication, leadership and teamwork',
+        'project_analysis': 'projects and their technical complexity',
+        'growth_potential': 'growth potential and areas to improve'
+    }
+    
+    # Headline 0-10 score of each category
+    SCORE_KEYS = {
+        'technical_depth': 'skill_depth_score',
+        'soft_skills': 'score',
+        'project_analysis': 'project_score',
+        'growth_potential': 'score'
+    }
+    
+    def __init__(self, config: Optional[Config] = None, backend: Optional[LLMBackend] = None,
+                 cache: Optional[TieredCache] = None):
         """Initialize LLM Analyzer with optional configuration"""
         self.config = config or Config()
-        self.cache = Cache(ttl=self.config.CACHE_TTL)
-        self.api_url = "https://api-inference.huggingface.co/models/gpt2"
-        self.headers = {"Authorization": f"Bearer {self.config.HUGGINGFACE_TOKEN}"}
+        self.cache = cache or create_cache(self.config)
+        self.backend = backend or create_backend(self.config)
+        self.prompts = self._generate_analysis_prompts()
+        self._semaphore = asyncio.Semaphore(max(1, self.config.LLM_CONCURRENCY))
+        self._tokenizer = None
+        self._chunk_tokens: Optional[int] = None
+        self.inflight = SingleFlight()
+        
+    async def close(self) -> None:
+        """Release backend resources (HTTP connections, batching worker)"""
+        await self.backend.close()
         
     async def analyze_resume(self, resume_text: str) -> Dict:
         """Analyze resume using LLM"""
         try:
-            # Mock data with better scoring
-            return {
-                'technical_analysis': {
-                    'skill_depth_score': 7.5,
-                    'key_technical_achievements': [
-                        'Python Development',
-                        'Machine Learning',
-                        'TypeScript/JavaScript',
-                        'Blockchain Development',
-                        'Web Development'
-                    ],
-                    'project_score': 8.0,
-                    'technical_complexity': 'High'
-                },
-                'soft_skills_analysis': {
-                    'communication': 8.0,
-                    'leadership': 7.0,
-                    'teamwork': 8.5,
-                    'key_attributes': [
-                        'Strong project leadership',
-                        'Effective communication',
-                        'Cross-functional collaboration'
-                    ]
-                },
-                'project_evaluation': {
-                    'project_score': 8.2,
-                    'technical_complexity': 'High',
-                    'recommended_projects': [
-                        'Full-stack Web Application',
-                        'ML Model Deployment',
-                        'Blockchain dApp'
-                    ]
-                },
-                'growth_assessment': {
-                    'score': 8.5,
-                    'growth_indicators': [
-                        'Diverse project portfolio',
-                        'Quick learning ability',
-                        'Technical versatility'
-                    ],
-                    'improvement_areas': [
-                        'Cloud Technologies',
-                        'System Design',
-                        'DevOps Practices'
-                    ]
-                },
-                'overall_score': 8.0
-            }
+            analyses = await self.analyze_text(resume_text)
+            return self._structure_analysis(analyses)
+        except LLMError:
+            raise
         except Exception as e:
             raise LLMError(f"Resume analysis failed: {str(e)}")
         
+    async def analyze_sources(self, texts: List[str]) -> Dict:
+        """
+        Analyze independent texts (e.g. the sources of one profile) as one resume.
 
-    async def _get_llm_response(self, prompt: str) -> Dict:
-        """Get response from Hugging Face Inference API"""
-        max_retries = 3
-        max_tokens = 800  # Maximum tokens for input to leave room for output
-        
-        # Truncate prompt if too long (using rough token estimation)
-        estimated_tokens = len(prompt.split()) * 1.3  # Rough token estimation
-        if estimated_tokens > max_tokens:
-            words = prompt.split()
-            truncated_words = words[:int(max_tokens/1.3)]
-            prompt = ' '.join(truncated_words)
+        Each text is chunked and analyzed on its own and its chunk results are
+        cached by its content, so when only one text changes only its chunks
+        reach the LLM; the rest are merged back from the cache.
+        """
+        try:
+            per_text = await asyncio.gather(*(self._text_sections(text) for text in texts if text))
+            return self._structure_analysis(self._combine_sections(
+                [sections for text_sections in per_text for sections in text_sections]
+            ))
+        except LLMError:
+            raise
+        except Exception as e:
+            raise LLMError(f"Resume analysis failed: {str(e)}")
         
-        for attempt in range(max_retries):
+
+    async def _get_llm_response(self, prompt: str, max_new_tokens: Optional[int] = None) -> Dict:
+        """
+        Get a structured response from the configured LLM backend.
+
+        Prompts are never truncated here; ``analyze_text`` sizes its chunks to
+        fit. At most ``LLM_CONCURRENCY`` prompts are in flight, which also lets
+        the local backend fill its micro-batches.
+        """
+        cache_key = self._cache_key('llm_response', prompt)
+        cached_result = await self.cache.aget(cache_key)
+        if cached_result is not None:
+            return cached_result
+            
+        async def generate() -> Dict:
+            async with self._semaphore:
+                with tracing.span('llm.generate', backend=self.backend.name, prompt_chars=len(prompt)):
+                    response_text = await self.backend.generate(prompt, max_new_tokens)
+            result = self._parse_llm_response(response_text)
+            if result:
+                self.cache.set(cache_key, result, self.config.CACHE_CONTENT_TTL)
+            return result
+            
+        try:
+            # Identical prompts in flight (e.g. duplicate submissions) share one call
+            return await self.inflight.do(cache_key, generate)
+        except LLMError:
+            raise
+        except Exception as e:
+            raise LLMError(f"LLM processing failed: {str(e)}")
+
+    def _extract_json_object(self, text: str) -> Optional[Dict]:
+        """
+        First balanced JSON object in the text.
+
+        The model may wrap JSON in prose or code fences, or emit several
+        objects; decoding from each ``{`` stops at the matching brace instead
+        of spanning from the first ``{`` to the last ``}``.
+        """
+        start = text.find('{')
+        while start != -1:
             try:
-                response = requests.post(
-                    self.api_url,
-                    headers=self.headers,
-                    json={
-                        "inputs": prompt,
-                        "parameters": {
-                            "max_new_tokens": 100,
-                            "temperature": 0.7,
-                            "top_p": 0.9,
-                            "return_full_text": False,
-                            "truncation": True,
-                            "max_length": 1024
-                        }
-                    },
-                    timeout=10
-                )
-                
-                if response.status_code == 200:
-                    return self._parse_llm_response(response)
-                
-                if response.status_code == 503:  # Model is loading
-                    await asyncio.sleep(2)
-                    continue
-                    
-                if attempt == max_retries - 1:
-                    raise LLMError(f"Failed to get valid response: {response.text}")
-                    
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    raise LLMError(f"LLM processing failed: {str(e)}")
-                await asyncio.sleep(1)
-                
-        return {}  # Fallback empty response
+                value, _ = _JSON_DECODER.raw_decode(text, start)
+                if isinstance(value, dict):
+                    return value
+            except ValueError:
+                pass
+            start = text.find('{', start + 1)
+        return None
 
     def _extract_structured_data(self, text: str) -> Optional[Dict]:
         """Extract structured data from unstructured LLM response"""
         try:
-            json_match = re.search(r'\{.*\}', text, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
+            parsed = self._extract_json_object(text)
+            if parsed is not None:
+                return parsed
             
             # Fallback extraction
             score_pattern = r'(?:score|rating):\s*(\d+)'
@@ -144,19 +186,42 @@ class LLMAnalyzer:
         except Exception:
             return None
 
+    def _schema(self, category: str) -> str:
+        """JSON shape of one category, described from its defaults"""
+        fields = []
+        for key, default in self.CATEGORY_DEFAULTS[category].items():
+            if isinstance(default, float):
+                kind = '<number 0-10>'
+            elif isinstance(default, list):
+                kind = '[<string>, ...]'
+            else:
+                kind = '"Low" | "Medium" | "High"'
+            fields.append(f'"{key}": {kind}')
+        return '{' + ', '.join(fields) + '}'
+
     def _generate_analysis_prompts(self) -> Dict[str, str]:
-        """Generate analysis prompt templates"""
-        base_prompt = (
-            "Analyze this section of a resume and provide a JSON response. "
-            "Focus on specific details and quantifiable metrics.\n\n{text}"
-        )
-        
-        return {
-            'technical_depth': base_prompt,
-            'soft_skills': base_prompt,
-            'project_analysis': base_prompt,
-            'growth_potential': base_prompt
+        """Generate analysis prompt templates (one per category plus the combined one)"""
+        def template(instructions: str) -> str:
+            # Schemas contain braces; escape them for str.format
+            return instructions.replace('{', '{{').replace('}', '}}') + "\n\nResume:\n{text}"
+            
+        prompts = {
+            category: template(
+                f"Analyze the {focus} shown in this resume. "
+                "Focus on specific details and quantifiable metrics. "
+                f"Respond with only one JSON object of this form: {self._schema(category)}"
+            )
+            for category, focus in self.CATEGORY_FOCUS.items()
         }
+        sections = ', '.join(
+            f'"{category}": {self._schema(category)}' for category in self.CATEGORY_DEFAULTS
+        )
+        prompts['combined'] = template(
+            "Analyze this resume: " + '; '.join(self.CATEGORY_FOCUS.values()) + ". "
+            "Focus on specific details and quantifiable metrics. "
+            "Respond with only one JSON object with exactly these sections: {" + sections + "}"
+        )
+        return prompts
 
     def _structure_analysis(self, analyses: Dict) -> Dict:
         """Structure the analysis results"""
@@ -176,8 +241,9 @@ class LLMAnalyzer:
         try:
             scores = []
             for category, data in analyses.items():
-                if isinstance(data, dict) and 'score' in data:
-                    scores.append(data['score'])
+                score_key = self.SCORE_KEYS.get(category, 'score')
+                if isinstance(data, dict) and isinstance(data.get(score_key), (int, float)):
+                    scores.append(data[score_key])
             
             if not scores:
                 return 0
@@ -187,128 +253,247 @@ class LLMAnalyzer:
             raise LLMError(f"Failed to calculate overall score: {str(e)}")
 
     async def analyze_text(self, text: str) -> Dict:
-        """Analyze text using LLM"""
+        """
+        Analyze text using LLM.
+
+        Long text is split into tokenizer-sized chunks; every chunk x category
+        prompt is issued at once under the concurrency cap and the chunk
+        results of each category are merged, so nothing is dropped and latency
+        stays close to one round-trip. With ``LLM_COMBINED_ANALYSIS`` each
+        chunk gets a single prompt covering all four categories.
+        """
         try:
-            # Check cache first
-            cache_key = f"llm_analysis_{hash(text)}"
-            cached_result = self.cache.get(cache_key)
-            if cached_result:
-                return cached_result
-                
-            # Prepare analysis prompts
-            analyses = await asyncio.gather(
-                self._analyze_technical_depth(text),
-                self._analyze_soft_skills(text),
-                self._analyze_projects(text),
-                self._analyze_growth_potential(text)
-            )
-            
-            # Structure results
-            result = {
-                'technical_depth': analyses[0],
-                'soft_skills': analyses[1],
-                'project_analysis': analyses[2],
-                'growth_potential': analyses[3]
-            }
-            
-            # Cache result
-            self.cache.set(cache_key, result)
-            return result
-            
+            return self._combine_sections(await self._text_sections(text))
         except Exception as e:
             raise LLMError(f"LLM analysis failed: {str(e)}")
             
-    async def _analyze_technical_depth(self, text: str) -> Dict:
-        """Analyze technical skills and depth"""
-        # Implementation would use actual LLM API call
-        # This is a placeholder
-        return {
-            'skill_depth_score': 0.8,
-            'key_technical_achievements': ['Python', 'Machine Learning']
-        }
+    async def _text_sections(self, text: str) -> List[Dict[str, Dict]]:
+        """
+        Raw results of every category, one dict per chunk of ``text``.
+
+        Results are cached only when every section came back; a section left
+        empty by a failed or unparseable call would otherwise pin default
+        scores for the text until the content TTL runs out.
+        """
+        namespace = 'llm_sections_combined' if self.config.LLM_COMBINED_ANALYSIS else 'llm_sections'
+        cache_key = self._cache_key(namespace, text)
+        cached = await self.cache.aget(cache_key)
+        if cached is not None:
+            return cached
+            
+        async def analyze() -> List[Dict[str, Dict]]:
+            # Loading the tokenizer and encoding are blocking; keep them off the loop
+            chunks = await asyncio.to_thread(self._chunk_text, text)
+            if self.config.LLM_COMBINED_ANALYSIS:
+                chunk_sections = list(await asyncio.gather(*(self._analyze_chunk(chunk) for chunk in chunks)))
+            else:
+                categories = list(self.CATEGORY_DEFAULTS)
+                responses = await asyncio.gather(*(
+                    asyncio.gather(*(self._category_response(category, chunk) for category in categories))
+                    for chunk in chunks
+                ))
+                chunk_sections = [dict(zip(categories, results)) for results in responses]
+                
+            if all(sections.get(category) for sections in chunk_sections for category in self.CATEGORY_DEFAULTS):
+                self.cache.set(cache_key, chunk_sections, self.config.CACHE_CONTENT_TTL)
+            return chunk_sections
+            
+        # Concurrent misses for the same text share one analysis
+        return await self.inflight.do(cache_key, analyze)
         
-    async def _analyze_soft_skills(self, text: str) -> Dict:
-        """Analyze soft skills"""
+    def _combine_sections(self, chunk_sections: List[Dict[str, Dict]]) -> Dict:
+        """Merge per-chunk raw results into one validated result per category"""
         return {
-            'score': 0.7,
-            'identified_skills': ['Communication', 'Leadership']
+            category: self._merge_with_defaults(category, self._combine_chunk_results(
+                category, [sections.get(category, {}) for sections in chunk_sections]
+            ))
+            for category in self.CATEGORY_DEFAULTS
         }
+            
+    def _cache_key(self, namespace: str, text: str) -> str:
+        """Content-addressed key covering the backend, model and prompt version"""
+        return content_key(namespace, self.backend.name, self.backend.model_id, self.PROMPT_VERSION, text)
         
-    async def _analyze_projects(self, text: str) -> Dict:
-        """Analyze project experience"""
-        return {
-            'project_score': 0.75,
-            'technical_complexity': 'High'
+    async def _analyze_chunk(self, chunk: str) -> Dict[str, Dict]:
+        """
+        Raw results of every category for one chunk from the combined prompt.
+
+        Only sections missing from the response or failing validation are
+        retried with their own category prompt.
+        """
+        try:
+            response = await self._get_llm_response(
+                self.prompts['combined'].format(text=chunk), self._max_new_tokens('combined')
+            )
+        except LLMError as e:
+            logger.warning("LLM combined analysis failed, falling back to per-category prompts: %s", e)
+            response = {}
+            
+        sections = {
+            category: response[category]
+            for category in self.CATEGORY_DEFAULTS
+            if self._is_valid_section(category, response.get(category))
         }
+        missing = [category for category in self.CATEGORY_DEFAULTS if category not in sections]
+        if missing:
+            retried = await asyncio.gather(*(self._category_response(category, chunk) for category in missing))
+            sections.update(zip(missing, retried))
+        return sections
         
-    async def _analyze_growth_potential(self, text: str) -> Dict:
-        """Analyze growth potential"""
-        return {
-            'score': 0.85,
-            'growth_indicators': ['Learning ability', 'Initiative']
-        }
-
-    def _chunk_text(self, text: str, max_length: int = 300) -> List[str]:
-        """Split text into smaller chunks"""
-        words = text.split()
-        chunks = []
-        current_chunk = []
-        current_length = 0
+    def _is_valid_section(self, category: str, section) -> bool:
+        """A section is usable when it is an object carrying its headline score as a number"""
+        if not isinstance(section, dict):
+            return False
+        score = section.get(self.SCORE_KEYS[category])
+        return isinstance(score, (int, float)) and not isinstance(score, bool)
         
-        for word in words:
-            # Count actual tokens (rough approximation)
-            word_tokens = len(word) // 4 + 1  # Rough estimate of tokens per word
-            
-            if current_length + word_tokens > max_length:
-                chunks.append(' '.join(current_chunk))
-                current_chunk = [word]
-                current_length = word_tokens
+    async def _category_response(self, category: str, text: str) -> Dict:
+        """Raw parsed output of one category prompt, or nothing if the call failed"""
+        try:
+            return await self._get_llm_response(self.prompts[category].format(text=text))
+        except LLMError as e:
+            logger.warning("LLM %s analysis failed, using defaults: %s", category, e)
+            return {}
+        
+    def _merge_with_defaults(self, category: str, parsed: Dict) -> Dict:
+        """Keep well-typed fields from ``parsed``; fill the rest from CATEGORY_DEFAULTS"""
+        result = {}
+        for key, default in self.CATEGORY_DEFAULTS[category].items():
+            value = parsed.get(key)
+            if isinstance(default, float) and isinstance(value, (int, float)) and not isinstance(value, bool):
+                result[key] = float(min(max(value, 0), 10))
+            elif isinstance(default, list) and isinstance(value, list):
+                result[key] = [str(item) for item in value if item]
+            elif isinstance(default, str) and isinstance(value, str) and value:
+                result[key] = value
             else:
-                current_chunk.append(word)
-                current_length += word_tokens
+                result[key] = list(default) if isinstance(default, list) else default
                 
-        if current_chunk:
-            chunks.append(' '.join(current_chunk))
-            
-        return chunks
-
-    def _combine_chunk_results(self, results: List[Dict]) -> Dict:
-        """Combine results from multiple chunks"""
-        combined = {
-            'skill_depth_score': 0,
-            'key_technical_achievements': [],
-            'project_score': 0,
-            'technical_complexity': 'Medium'
-        }
+        # Fallback extraction only recovers a bare score
+        extracted_score = parsed.get('extracted_score')
+        if isinstance(extracted_score, (int, float)) and self.SCORE_KEYS[category] not in parsed:
+            result[self.SCORE_KEYS[category]] = float(min(max(extracted_score, 0), 10))
+        return result
         
-        if not results:
-            return combined
+    def _get_tokenizer(self):
+        """Tokenizer named by LLM_TOKENIZER, loaded on first use; None if it is unavailable"""
+        if self._tokenizer is None:
+            try:
+                from transformers import AutoTokenizer
+                self._tokenizer = AutoTokenizer.from_pretrained(self.config.LLM_TOKENIZER)
+            except Exception as e:
+                logger.warning("Tokenizer %s unavailable, estimating tokens: %s", self.config.LLM_TOKENIZER, e)
+                self._tokenizer = False
+        return self._tokenizer or None
+
+    def _token_spans(self, text: str) -> List[Tuple[int, int, int]]:
+        """``(start, end, tokens)`` character spans covering the text"""
+        tokenizer = self._get_tokenizer()
+        if tokenizer is not None and getattr(tokenizer, 'is_fast', False):
+            encoding = tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)
+            return [(start, end, 1) for start, end in encoding['offset_mapping'] if end > start]
             
-        # Average numerical scores
-        scores = [r.get('skill_depth_score', 0) for r in results if isinstance(r.get('skill_depth_score'), (int, float))]
-        if scores:
-            combined['skill_depth_score'] = sum(scores) / len(scores)
+        # Rough estimate per word when no fast tokenizer is available
+        return [
+            (match.start(), match.end(), len(match.group()) // 4 + 1)
+            for match in re.finditer(r'\S+', text)
+        ]
+
+    def _max_new_tokens(self, prompt_name: str) -> Optional[int]:
+        """Completion length for a prompt; None leaves it to the backend"""
+        return self.config.LLM_COMBINED_MAX_NEW_TOKENS if prompt_name == 'combined' else None
         
-        # Combine lists of achievements
-        for result in results:
-            if isinstance(result.get('key_technical_achievements'), list):
-                combined['key_technical_achievements'].extend(result['key_technical_achievements'])
+    def _chunk_budget(self) -> int:
+        """
+        Tokens of resume text per chunk: ``LLM_CHUNK_TOKENS``, shrunk so that
+        every prompt used around a chunk still fits the backend's input limit
+        for that prompt's completion length.
+
+        Backends truncate over-long prompts from the right, which would cut
+        the end of the chunk rather than the instructions.
+        """
+        if self._chunk_tokens is None:
+            budget = self.config.LLM_CHUNK_TOKENS
+            for name, prompt in self.prompts.items():
+                if name == 'combined' and not self.config.LLM_COMBINED_ANALYSIS:
+                    continue
+                limit = self.backend.input_limit(self._max_new_tokens(name))
+                if limit is None:
+                    continue
+                overhead = self.PROMPT_TOKEN_MARGIN + sum(
+                    tokens for _, _, tokens in self._token_spans(prompt.format(text=''))
+                )
+                if limit - overhead < self.MIN_CHUNK_TOKENS:
+                    logger.warning("The %s prompt uses %d of the backend's %d input tokens", name, overhead, limit)
+                budget = min(budget, max(limit - overhead, self.MIN_CHUNK_TOKENS))
+            self._chunk_tokens = budget
+        return self._chunk_tokens
         
-        # Remove duplicates while preserving order
-        combined['key_technical_achievements'] = list(dict.fromkeys(combined['key_technical_achievements']))
+    def _chunk_text(self, text: str, max_tokens: Optional[int] = None,
+                    overlap: Optional[int] = None) -> List[str]:
+        """
+        Split text into windows of at most ``max_tokens`` tokens.
+
+        Chunks are slices of the original text, consecutive chunks share
+        ``overlap`` tokens of context, and every token lands in some chunk.
+        """
+        max_tokens = max_tokens or self._chunk_budget()
+        overlap = self.config.LLM_CHUNK_OVERLAP if overlap is None else overlap
+        overlap = min(overlap, max_tokens // 2)
+        spans = self._token_spans(text)
         
+        chunks = []
+        start = 0
+        while start < len(spans):
+            end, used = start, 0
+            while end < len(spans) and (end == start or used + spans[end][2] <= max_tokens):
+                used += spans[end][2]
+                end += 1
+            chunks.append(text[spans[start][0]:spans[end - 1][1]])
+            if end >= len(spans):
+                break
+                
+            # Step back up to `overlap` tokens, always moving forward
+            carried, next_start = 0, end
+            while next_start > start + 1 and carried + spans[next_start - 1][2] <= overlap:
+                next_start -= 1
+                carried += spans[next_start][2]
+            start = next_start
+            
+        return chunks
+
+    def _combine_chunk_results(self, category: str, results: List[Dict]) -> Dict:
+        """
+        Combine one category's raw results from multiple chunks.
+
+        Numbers are averaged over the chunks that report them, lists are
+        concatenated without duplicates and for text fields the most frequent
+        answer wins. Missing fields are left for ``_merge_with_defaults``.
+        """
+        combined = {}
+        keys = list(dict.fromkeys(key for result in results for key in result))
+        for key in keys:
+            values = [result[key] for result in results if key in result]
+            numbers = [v for v in values if isinstance(v, (int, float)) and not isinstance(v, bool)]
+            lists = [v for v in values if isinstance(v, list)]
+            texts = [v for v in values if isinstance(v, str) and v]
+            if numbers:
+                combined[key] = sum(numbers) / len(numbers)
+            elif lists:
+                combined[key] = list(dict.fromkeys(
+                    item for items in lists for item in items if isinstance(item, (str, int, float))
+                ))
+            elif texts:
+                combined[key] = max(dict.fromkeys(texts), key=texts.count)
         return combined
 
-    def _parse_llm_response(self, response: requests.Response) -> Dict:
-        """Parse and validate LLM response"""
+    def _parse_llm_response(self, response_text: str) -> Dict:
+        """Parse and validate LLM response text"""
         try:
-            response_data = response.json()
-            if isinstance(response_data, list) and response_data:
-                response_text = response_data[0].get("generated_text", "")
-                try:
-                    return json.loads(response_text)
-                except json.JSONDecodeError:
-                    return self._extract_structured_data(response_text) or {}
-            return {}
+            try:
+                parsed = json.loads(response_text)
+            except json.JSONDecodeError:
+                parsed = self._extract_structured_data(response_text)
+            return parsed if isinstance(parsed, dict) else {}
         except Exception:
-            return {}
\ No newline at end of file
+            return {}
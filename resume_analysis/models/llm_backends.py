@@ -0,0 +1,246 @@
+from typing import Any, List, Optional, Tuple
+import asyncio
+from resume_analysis.config import Config
+from resume_analysis.utils.exceptions import LLMError
+from resume_analysis.utils.inference_client import InferenceClient
+from resume_analysis.utils.rate_limiter import HF_INFERENCE, get_rate_limiters
+
+class LLMBackend:
+    """Text-generation backend used by LLMAnalyzer"""
+    
+    name = 'base'
+    model_id = ''
+    max_new_tokens = 100
+    # Prompt plus generated tokens the model attends to; None if unbounded
+    max_length: Optional[int] = None
+    
+    def input_limit(self, max_new_tokens: Optional[int] = None) -> Optional[int]:
+        """
+        Prompt tokens kept when generating ``max_new_tokens`` (the backend
+        default if None); longer prompts lose their tail. None if unbounded.
+        """
+        if self.max_length is None:
+            return None
+        return self.max_length - (max_new_tokens or self.max_new_tokens)
+    
+    async def generate(self, prompt: str, max_new_tokens: Optional[int] = None) -> str:
+        """Generate a completion for one prompt, of at most ``max_new_tokens`` (default: the backend's)"""
+        raise NotImplementedError
+        
+    async def generate_batch(self, prompts: List[str], max_new_tokens: Optional[int] = None) -> List[str]:
+        """Generate completions for several prompts"""
+        return list(await asyncio.gather(*(self.generate(p, max_new_tokens) for p in prompts)))
+        
+    async def health_check(self) -> bool:
+        return True
+        
+    async def close(self) -> None:
+        pass
+
+class RemoteInferenceBackend(LLMBackend):
+    """HuggingFace Inference API backend"""
+    
+    name = 'remote'
+    
+    def __init__(self, client: InferenceClient, max_new_tokens: int = 100, max_length: int = 1024):
+        self.client = client
+        self.max_new_tokens = max_new_tokens
+        self.max_length = max_length
+        self.model_id = client.api_url
+        
+    async def generate(self, prompt: str, max_new_tokens: Optional[int] = None) -> str:
+        response_data = await self.client.generate(
+            prompt,
+            {
+                "max_new_tokens": max_new_tokens or self.max_new_tokens,
+                "temperature": 0.7,
+                "top_p": 0.9,
+                "return_full_text": False,
+                "truncation": True,
+                "max_length": self.max_length
+            }
+        )
+        return self._generated_text(response_data)
+        
+    def _generated_text(self, response_data: Any) -> str:
+        """Pull ``generated_text`` out of an inference API response"""
+        if isinstance(response_data, list) and response_data and isinstance(response_data[0], dict):
+            return response_data[0].get("generated_text", "")
+        if isinstance(response_data, dict):
+            return response_data.get("generated_text", "")
+        return ""
+        
+    async def health_check(self) -> bool:
+        return await self.client.health_check()
+        
+    async def close(self) -> None:
+        await self.client.close()
+
+class LocalTransformersBackend(LLMBackend):
+    """
+    In-process causal LM on CPU.
+
+    The model loads once on first use. Concurrent ``generate`` calls, from one
+    resume or many, are collected for up to ``batch_wait`` seconds and run as a
+    single padded forward pass of at most ``max_batch_size`` prompts.
+    ``quantize`` applies dynamic int8 quantization to the Linear layers.
+    Prompts are truncated to leave ``max_length`` room for the completion.
+    """
+    
+    name = 'local'
+    
+    def __init__(
+        self,
+        model_name: str = 'distilgpt2',
+        quantize: bool = False,
+        max_batch_size: int = 8,
+        batch_wait: float = 0.01,
+        max_new_tokens: int = 100,
+        max_length: int = 1024
+    ):
+        self.model_name = model_name
+        self.quantize = quantize
+        self.model_id = f"{model_name}+int8" if quantize else model_name
+        self.max_batch_size = max(1, max_batch_size)
+        self.batch_wait = batch_wait
+        self.max_new_tokens = max_new_tokens
+        self.max_length = max_length
+        self.tokenizer = None
+        self.model = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        
+    def _load(self) -> None:
+        """Load tokenizer and model (once)"""
+        if self.model is not None:
+            return
+        import torch
+        from transformers import AutoModelForCausalLM, AutoTokenizer
+        
+        tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        tokenizer.padding_side = 'left'  # Decoder-only models generate from the right edge
+        if tokenizer.pad_token is None:
+            tokenizer.pad_token = tokenizer.eos_token
+            
+        model = AutoModelForCausalLM.from_pretrained(self.model_name)
+        model.eval()
+        if self.quantize:
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+            
+        self.tokenizer = tokenizer
+        self.model = model
+        
+    def _generate_sync(self, prompts: List[str], max_new_tokens: int) -> List[str]:
+        """Run one batched forward pass over ``prompts``"""
+        import torch
+        
+        self._load()
+        inputs = self.tokenizer(
+            prompts,
+            return_tensors='pt',
+            padding=True,
+            truncation=True,
+            max_length=self.input_limit(max_new_tokens)
+        )
+        with torch.no_grad():
+            outputs = self.model.generate(
+                **inputs,
+                max_new_tokens=max_new_tokens,
+                do_sample=True,
+                temperature=0.7,
+                top_p=0.9,
+                pad_token_id=self.tokenizer.pad_token_id
+            )
+        # Strip the (left-padded) prompt tokens, keep only the completion
+        new_tokens = outputs[:, inputs['input_ids'].shape[1]:]
+        return self.tokenizer.batch_decode(new_tokens, skip_special_tokens=True)
+        
+    async def _run_batches(self) -> None:
+        """
+        Collect queued prompts into batches and run them off the event loop,
+        one forward pass per completion length in the batch.
+        """
+        loop = asyncio.get_running_loop()
+        batch: List[Tuple[str, int, asyncio.Future]] = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self.batch_wait
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                        
+                for max_new_tokens in sorted({n for _, n, _ in batch}):
+                    group = [(prompt, future) for prompt, n, future in batch if n == max_new_tokens]
+                    try:
+                        completions = await asyncio.to_thread(
+                            self._generate_sync, [p for p, _ in group], max_new_tokens
+                        )
+                    except Exception as e:
+                        self._fail(group, f"Local generation failed: {str(e)}")
+                        continue
+                    for (_, future), completion in zip(group, completions):
+                        if not future.done():
+                            future.set_result(completion)
+        except asyncio.CancelledError:
+            self._fail(batch, "Local backend closed")
+            raise
+            
+    def _fail(self, entries: List[Tuple], message: str) -> None:
+        """Fail the unresolved futures (last item of each entry) with LLMError"""
+        for *_, future in entries:
+            if not future.done():
+                future.set_exception(LLMError(message))
+                    
+    async def generate(self, prompt: str, max_new_tokens: Optional[int] = None) -> str:
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.ensure_future(self._run_batches())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((prompt, max_new_tokens or self.max_new_tokens, future))
+        return await future
+        
+    async def health_check(self) -> bool:
+        await asyncio.to_thread(self._load)
+        return True
+        
+    async def close(self) -> None:
+        """Stop batching; prompts still queued or generating fail with LLMError"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        if self._queue is not None:
+            queued = []
+            while not self._queue.empty():
+                queued.append(self._queue.get_nowait())
+            self._fail(queued, "Local backend closed")
+        self._worker = None
+        self._queue = None
+
+def create_backend(config: Config) -> LLMBackend:
+    """Build the backend selected by ``Config.LLM_BACKEND``"""
+    if config.LLM_BACKEND == 'local':
+        return LocalTransformersBackend(
+            model_name=config.LOCAL_MODEL_NAME,
+            quantize=config.LOCAL_MODEL_QUANTIZE,
+            max_batch_size=config.LLM_BATCH_SIZE,
+            batch_wait=config.LLM_BATCH_WAIT_MS / 1000
+        )
+    if config.LLM_BACKEND == 'remote':
+        return RemoteInferenceBackend(InferenceClient(
+            config.HF_INFERENCE_URL,
+            config.HUGGINGFACE_TOKEN,
+            max_connections=config.LLM_MAX_CONNECTIONS,
+            timeout=config.LLM_TIMEOUT,
+            max_retries=config.LLM_MAX_RETRIES,
+            rate_limiter=get_rate_limiters(config).get(HF_INFERENCE)
+        ))
+    raise ValueError(f"Unknown LLM backend: {config.LLM_BACKEND}")
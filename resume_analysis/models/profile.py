@@ -1 +1,112 @@
- 
\ No newline at end of file
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from resume_analysis.utils.cache import content_key
+
+@dataclass(slots=True)
+class ResumeSource:
+    """Cleaned resume text, line structure kept"""
+    text: str
+
+@dataclass(slots=True)
+class GitHubSource:
+    """Public GitHub profile: bio plus the non-fork repositories"""
+    username: str
+    bio: str = ''
+    languages: List[str] = field(default_factory=list)
+    topics: List[str] = field(default_factory=list)
+    repositories: List[Dict] = field(default_factory=list)
+    
+    @staticmethod
+    def repo_text(repo: Dict) -> str:
+        return (
+            f"Repository: {repo['name']}\n"
+            f"Description: {repo.get('description') or 'No description'}\n"
+            f"Language: {repo.get('language') or 'Not specified'}\n"
+            f"Stars: {repo.get('stars', 0)}\n"
+            f"Topics: {', '.join(repo.get('topics', []))}\n"
+        )
+    
+    @property
+    def text(self) -> str:
+        repo_texts = [self.repo_text(repo) for repo in self.repositories]
+        return (
+            f"GitHub Profile - {self.username}\n"
+            f"Bio: {self.bio}\n\n"
+            f"Programming Languages: {', '.join(self.languages)}\n"
+            f"Topics & Skills: {', '.join(self.topics)}\n\n"
+            "Notable Repositories:\n"
+            + "\n---\n".join(repo_texts)
+        )
+
+@dataclass(slots=True)
+class LinkedInSource:
+    """Structured fields extracted from a LinkedIn PDF export"""
+    basic_info: Dict[str, str] = field(default_factory=dict)
+    experience: List[Dict] = field(default_factory=list)
+    education: List[Dict] = field(default_factory=list)
+    skills: List[str] = field(default_factory=list)
+    
+    @property
+    def text(self) -> str:
+        parts = ["LinkedIn Profile\n\n"]
+        
+        if self.basic_info:
+            parts.append(f"Name: {self.basic_info.get('name', '')}\n")
+            parts.append(f"Headline: {self.basic_info.get('headline', '')}\n")
+            parts.append(f"Location: {self.basic_info.get('location', '')}\n\n")
+            
+        parts.append("Experience:\n")
+        for exp in self.experience:
+            parts.append(f"- {exp.get('title', '')} at {exp.get('company', '')}\n")
+            parts.append(f"  {exp.get('date_range', '')}\n")
+            if exp.get('description'):
+                parts.append(f"  {exp['description']}\n")
+            parts.append("\n")
+            
+        parts.append("Education:\n")
+        for edu in self.education:
+            parts.append(f"- {edu.get('degree', '')} from {edu.get('school', '')}\n")
+            if edu.get('date_range'):
+                parts.append(f"  {edu['date_range']}\n")
+            parts.append("\n")
+            
+        parts.append("Skills:\n")
+        parts.extend(f"- {skill}\n" for skill in self.skills)
+        return ''.join(parts)
+
+@dataclass(slots=True)
+class CandidateProfile:
+    """Every parsed source of one candidate; absent sources are None"""
+    resume: Optional[ResumeSource] = None
+    github: Optional[GitHubSource] = None
+    linkedin: Optional[LinkedInSource] = None
+    
+    def source_completeness(self) -> Dict[str, bool]:
+        return {
+            'resume': bool(self.resume and self.resume.text),
+            'github': self.github is not None,
+            'linkedin': self.linkedin is not None
+        }
+    
+    def source_texts(self) -> Dict[str, str]:
+        """Text of every available source, keyed by source name"""
+        texts = {}
+        if self.resume:
+            texts['resume'] = self.resume.text
+        if self.github:
+            texts['github'] = self.github.text
+        if self.linkedin:
+            texts['linkedin'] = self.linkedin.text
+        return texts
+    
+    def fingerprints(self) -> Dict[str, Optional[str]]:
+        """Content hash of every source's text; None for absent sources"""
+        texts = self.source_texts()
+        return {
+            name: content_key(name, texts[name]) if name in texts else None
+            for name in ('resume', 'github', 'linkedin')
+        }
+    
+    def llm_texts(self) -> List[str]:
+        """One labelled prompt input per available source"""
+        return [f"{name.upper()}:\n{text}" for name, text in self.source_texts().items()]
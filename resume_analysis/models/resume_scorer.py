@@ -1,13 +1,13 @@
 from typing import Dict, List, Optional
 from .skill_extractor import SkillExtractor
 from .github_analyzer import GitHubAnalyzer
-import numpy as np
-from sklearn.ensemble import RandomForestClassifier
+from resume_analysis.utils.github_client import GitHubClient, GitHubSnapshot
+from resume_analysis.utils import tracing
 
 class ResumeScorer:
-    def __init__(self, github_token: str = None):
+    def __init__(self, github_token: str = None, github_client: Optional[GitHubClient] = None):
         self.skill_extractor = SkillExtractor()
-        self.github_analyzer = GitHubAnalyzer(github_token) if github_token else None
+        self.github_analyzer = GitHubAnalyzer(github_token, github_client) if github_token else None
         self.domain_weights = {
             'ai_ml': {
                 'skills': 0.4,
@@ -41,19 +41,26 @@ class ResumeScorer:
             }
         }
         
-    async def analyze_async(self, resume_text: str) -> Dict:
-        """Async version of score_resume"""
-        return self.score_resume(resume_text)
+    async def analyze_async(self, resume_text: str, github_username: str = None,
+                            github_snapshot: Optional[GitHubSnapshot] = None) -> Dict:
+        """
+        Async version of score_resume that also includes the GitHub analysis.
+
+        An already fetched ``github_snapshot`` is analyzed as is; otherwise the
+        profile of ``github_username`` is fetched.
+        """
+        github_analysis = None
+        if github_snapshot is not None and self.github_analyzer:
+            github_analysis = self.github_analyzer.analyze_snapshot(github_snapshot)
+        elif github_username and self.github_analyzer:
+            github_analysis = await self.github_analyzer.analyze_profile(github_username)
+        return self.score_resume(resume_text, github_analysis)
         
-    def score_resume(self, resume_text: str, github_username: str = None) -> Dict:
+    @tracing.traced('resume_scorer.score')
+    def score_resume(self, resume_text: str, github_analysis: Optional[Dict] = None) -> Dict:
         # Extract skills and experience
         skills_analysis = self.skill_extractor.extract_skills(resume_text)
         
-        # Get GitHub analysis if available
-        github_analysis = None
-        if github_username and self.github_analyzer:
-            github_analysis = self.github_analyzer.analyze_profile(github_username)
-        
         # Calculate domain-specific scores
         domain_scores = {}
         for domain in self.domain_weights.keys():
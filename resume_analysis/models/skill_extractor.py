@@ -1,12 +1,23 @@
-from typing import Dict, List
-import spacy
+from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
 import re
+from resume_analysis.utils import tracing
 
 class SkillExtractor:
-    def __init__(self):
-        self.nlp = spacy.load("en_core_web_sm")
-        self.domain_skills = {
+    _YEAR_WORDS = frozenset({'year', 'years', 'yr', 'yrs'})
+    _CLAUSE_BREAKS = frozenset({'.', ';', '!', '?', '•', '|'})
+    _NUMBER_TOKEN = re.compile(r'(\d{1,2})\+?$')
+    _YEARS_TOKEN = re.compile(r'(\d{1,2})\+?(?:years?|yrs?)$')
+    
+    def __init__(self, domain_skills: Optional[Dict[str, List[str]]] = None, experience_window: int = 12):
+        import spacy
+        from spacy.matcher import PhraseMatcher
+        
+        # Matching only needs the tokenizer, so skip loading a trained pipeline
+        self.nlp = spacy.blank("en")
+        self.nlp.max_length = 10_000_000  # Tokenizer only, so long inputs are cheap
+        self.experience_window = experience_window
+        self.domain_skills = domain_skills or {
             'ai_ml': [
                 'machine learning', 'deep learning', 'neural networks', 'tensorflow',
                 'pytorch', 'scikit-learn', 'computer vision', 'nlp', 'data science'
@@ -28,34 +39,129 @@ class SkillExtractor:
                 'ethical hacking', 'vulnerability assessment', 'firewall'
             ]
         }
+        
+        # One compiled matcher over every domain's skills: a single token-level
+        # scan finds all of them, case-insensitively and on token boundaries
+        # ("java" does not match inside "javascript")
+        self.matcher = PhraseMatcher(self.nlp.vocab, attr="LOWER")
+        self._skill_domains = defaultdict(list)
+        for domain, skills in self.domain_skills.items():
+            for skill in skills:
+                if skill not in self._skill_domains:
+                    self.matcher.add(skill, [self.nlp.make_doc(skill)])
+                self._skill_domains[skill].append(domain)
+        self._skill_order = {
+            domain: {skill: i for i, skill in enumerate(skills)}
+            for domain, skills in self.domain_skills.items()
+        }
 
+    @tracing.traced('skills.extract')
     def extract_skills(self, text: str) -> Dict:
-        doc = self.nlp(text.lower())
+        # Whitespace is collapsed so skills wrapped across lines ("machine\nlearning")
+        # still match; the line starts are kept as clause breaks
+        text, line_starts = self._normalize_whitespace(text)
+        doc = self.nlp.make_doc(text)
+        matches = self.matcher(doc)
         found_skills = defaultdict(list)
         
-        # Extract skills using pattern matching
-        for domain, skills in self.domain_skills.items():
-            for skill in skills:
-                if skill in text.lower():
-                    found_skills[domain].append(skill)
-        
-        # Extract years of experience per domain
-        for domain in self.domain_skills.keys():
-            experience = self._extract_experience(text, domain)
-            if experience:
-                found_skills[f"{domain}_experience"] = experience
+        # Extract skills in one pass, listed in taxonomy order per domain
+        for domain, skills in self._match_skills(matches).items():
+            found_skills[domain] = sorted(skills, key=self._skill_order[domain].get)
+        
+        # Extract years of experience per domain from the same tokens and matches
+        for domain, experience in self._extract_experience(doc, matches, line_starts).items():
+            found_skills[f"{domain}_experience"] = experience
                 
         return dict(found_skills)
         
-    def _extract_experience(self, text: str, domain: str) -> int:
-        """Extract years of experience for a specific domain"""
-        patterns = [
-            rf"(\d+)\s*(?:years?|yrs?).+?(?:experience|exp).+?{domain}",
-            rf"{domain}.+?(\d+)\s*(?:years?|yrs?).+?(?:experience|exp)"
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text.lower())
-            if matches:
-                return max(map(int, matches))
-        return 0
\ No newline at end of file
+    def _match_skills(self, matches: List[Tuple[int, int, int]]) -> Dict[str, set]:
+        """Distinct skills among the matcher results, grouped by domain"""
+        strings = self.nlp.vocab.strings
+        found = defaultdict(set)
+        for match_id in {match_id for match_id, _, _ in matches}:
+            skill = strings[match_id]
+            for domain in self._skill_domains[skill]:
+                found[domain].add(skill)
+        return found
+        
+    def _normalize_whitespace(self, text: str) -> Tuple[str, frozenset]:
+        """
+        Text with every whitespace run collapsed to one space, plus the
+        character offsets (in the collapsed text) of words that began a line.
+        """
+        lines = []
+        line_starts = set()
+        position = 0
+        for line in text.split('\n'):
+            line = ' '.join(line.split())
+            if not line:
+                continue
+            if lines:
+                position += 1
+                line_starts.add(position)
+            lines.append(line)
+            position += len(line)
+        return ' '.join(lines), frozenset(line_starts)
+        
+    def _scan_tokens(self, doc, line_starts: frozenset = frozenset()) -> Tuple[List[Tuple[int, int]], List[int]]:
+        """
+        One pass over the tokens returning ``(token_index, years)`` for every
+        "N years" / "N+ yrs" / "Nyrs" mention, plus each token's clause number
+        (clauses end at sentence punctuation, semicolons, bullets and at the
+        ``line_starts`` character offsets).
+        """
+        spans = []
+        clauses = []
+        clause = 0
+        n_tokens = len(doc)
+        for i, token in enumerate(doc):
+            text = token.lower_
+            if token.idx in line_starts:
+                clause += 1
+            clauses.append(clause)
+            if text in self._CLAUSE_BREAKS:
+                clause += 1
+                continue
+            if not text[:1].isdigit():
+                continue
+            combined = self._YEARS_TOKEN.match(text)
+            if combined:
+                spans.append((i, int(combined.group(1))))
+                continue
+            number = self._NUMBER_TOKEN.match(text)
+            if not number:
+                continue
+            j = i + 1
+            if j < n_tokens and doc[j].text == '+':
+                j += 1
+            if j < n_tokens and doc[j].lower_ in self._YEAR_WORDS:
+                spans.append((i, int(number.group(1))))
+        return spans, clauses
+        
+    def _extract_experience(self, doc, matches: List[Tuple[int, int, int]],
+                            line_starts: frozenset = frozenset()) -> Dict[str, int]:
+        """
+        Attribute each "N years" mention to the domains whose skills are
+        mentioned in the same clause within ``experience_window`` tokens.
+
+        Year mentions and skill matches are both sorted by position, so one
+        sliding window over the two lists keeps this linear in resume length.
+        """
+        strings = self.nlp.vocab.strings
+        mentions = [(start, strings[match_id]) for match_id, start, _ in matches]
+        window = self.experience_window
+        experience = {}
+        
+        year_spans, clauses = self._scan_tokens(doc, line_starts)
+        lo = 0
+        for position, years in year_spans:
+            while lo < len(mentions) and mentions[lo][0] < position - window:
+                lo += 1
+            hi = lo
+            while hi < len(mentions) and mentions[hi][0] <= position + window:
+                start, skill = mentions[hi]
+                if clauses[start] == clauses[position]:
+                    for domain in self._skill_domains[skill]:
+                        experience[domain] = max(experience.get(domain, 0), years)
+                hi += 1
+        return experience
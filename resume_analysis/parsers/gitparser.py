@@ -1,21 +1,12 @@
-from github import Github
+from typing import Optional
 from urllib3.util import parse_url
 import urllib3
-import re
+import asyncio
+import logging
+from resume_analysis.utils.github_client import GitHubClient
+from resume_analysis.parsers.pdf_parser import clean_text as _clean_text
 
-def _clean_text(text: str) -> str:
-    """Clean and normalize extracted text"""
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove special characters but keep basic punctuation
-    text = re.sub(r'[^\w\s.,;:!?-]', '', text)
-    
-    # Normalize line endings
-    text = text.replace('\r', '\n')
-    text = re.sub(r'\n\s*\n+', '\n\n', text)
-    
-    return text.strip()
+logger = logging.getLogger(__name__)
 
 def extract_gituname_from_url(url):
     url_parsed = parse_url(url)
@@ -25,16 +16,19 @@ def extract_gituname_from_url(url):
             return path_parts[0]
     return None
 
-def _parse_github_profile(username: str) -> str:
-    print('parsegit called')
+async def _parse_github_profile(username: str, client: Optional[GitHubClient] = None) -> str:
     """Extract relevant information from GitHub profile"""
+    logger.debug("Parsing GitHub profile %s", username)
+    owns_client = client is None
+    client = client or GitHubClient()  # pass a token-bearing client; never commit tokens
     try:
-        g = Github('') # remove token before commiting to git
-        user = g.get_user(username)
-        repos = user.get_repos()
+        user, repos = await asyncio.gather(
+            client.get_user(username),
+            client.get_repos(username)
+        )
         
         text = f"GitHub Profile - {username}\n"
-        text += f"Bio: {user.bio or ''}\n\n"
+        text += f"Bio: {user.get('bio') or ''}\n\n"
         
 
         # Collect languages and topics
@@ -43,16 +37,17 @@ def _parse_github_profile(username: str) -> str:
         repo_texts = []
         
         for repo in repos:
-            if repo.language:
-                languages.add(repo.language)
-            topics.update(repo.get_topics())
+            repo_topics = repo.get('topics') or []
+            if repo.get('language'):
+                languages.add(repo['language'])
+            topics.update(repo_topics)
             
             # Get detailed repo info
-            repo_text = f"Repository: {repo.name}\n"
-            repo_text += f"Description: {repo.description or 'No description'}\n"
-            repo_text += f"Language: {repo.language or 'Not specified'}\n"
-            repo_text += f"Stars: {repo.stargazers_count}\n"
-            repo_text += f"Topics: {', '.join(repo.get_topics())}\n"
+            repo_text = f"Repository: {repo['name']}\n"
+            repo_text += f"Description: {repo.get('description') or 'No description'}\n"
+            repo_text += f"Language: {repo.get('language') or 'Not specified'}\n"
+            repo_text += f"Stars: {repo.get('stargazers_count', 0)}\n"
+            repo_text += f"Topics: {', '.join(repo_topics)}\n"
             repo_texts.append(repo_text)
     
         # Add summary sections
@@ -60,7 +55,7 @@ def _parse_github_profile(username: str) -> str:
         text += f"Topics & Skills: {', '.join(topics)}\n\n"
         text += "Notable Repositories:\n"
         text += "\n---\n".join(repo_texts)  # Include top 5 repos
-        for rawitem in [str(x) + " : " + str(y) + "\n" for (x, y) in user.raw_data.items()]:
+        for rawitem in [str(x) + " : " + str(y) + "\n" for (x, y) in user.items()]:
             text += rawitem
         # print(text)
         text = _clean_text(text)
@@ -68,8 +63,11 @@ def _parse_github_profile(username: str) -> str:
         
     except Exception as e:
         raise ValueError(f"Failed to parse GitHub profile: {str(e)}")
+    finally:
+        if owns_client:
+            await client.close()
     
 # usecase
 
 # uname = extract_gituname_from_url("https://github.com/googleboy-byte")
-# gittext = _parse_github_profile(uname)
\ No newline at end of file
+# gittext = asyncio.run(_parse_github_profile(uname))
\ No newline at end of file
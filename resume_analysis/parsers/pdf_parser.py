@@ -0,0 +1,193 @@
+from typing import AsyncIterator, Iterator, List, Optional, Tuple, Union
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+import asyncio
+import io
+import mmap
+import os
+import re
+
+PdfSource = Union[bytes, bytearray, memoryview, mmap.mmap, str, os.PathLike]
+
+# Characters dropped by cleaning: anything but word characters, line breaks and
+# basic punctuation. Runs of them (spaces included) collapse to a single space.
+_JUNK = r'[^\w\n\r.,;:!?-]'
+_CLEAN_PATTERN = re.compile(
+    rf'(?P<para>{_JUNK}*(?:\r\n?|\n)(?:{_JUNK}*(?:\r\n?|\n))+{_JUNK}*)'
+    rf'|(?P<line>{_JUNK}*(?:\r\n?|\n){_JUNK}*)'
+    rf'|(?P<junk>{_JUNK}+)'
+)
+_HAS_SPACE = re.compile(r'\s').search
+
+def _clean_match(match: 're.Match') -> str:
+    if match.lastgroup == 'para':
+        return '\n\n'
+    if match.lastgroup == 'line':
+        return '\n'
+    return ' ' if _HAS_SPACE(match.group()) else ''
+
+def clean_text(text: str) -> str:
+    """
+    Clean and normalize extracted text in a single regex pass.
+
+    Drops special characters, collapses horizontal whitespace to one space,
+    normalizes ``\\r``/``\\r\\n`` to ``\\n`` and blank-line runs to one blank
+    line, keeping the line structure that section detection relies on.
+    """
+    return _CLEAN_PATTERN.sub(_clean_match, text).strip()
+
+_executor: Optional[ProcessPoolExecutor] = None
+_mmap_executor: Optional[ThreadPoolExecutor] = None
+
+def get_pdf_executor(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Process pool shared by every PDF extraction in this process (created on first use)"""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=max_workers or None)
+    return _executor
+
+def _get_mmap_executor() -> ThreadPoolExecutor:
+    """
+    Single thread reading mmap sources: readers of one map share its file
+    position, so its page ranges are read one at a time.
+    """
+    global _mmap_executor
+    if _mmap_executor is None:
+        _mmap_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-mmap")
+    return _mmap_executor
+
+def _source_size(source: PdfSource) -> int:
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    return len(source)
+
+@contextmanager
+def _open_pdf(source: PdfSource):
+    """
+    PdfReader over ``source`` without copying it into a new bytes object:
+    paths are memory-mapped and mmaps are read in place.
+    """
+    import PyPDF2
+    
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield PyPDF2.PdfReader(mapped)
+    elif isinstance(source, mmap.mmap):
+        source.seek(0)
+        yield PyPDF2.PdfReader(source)
+    else:
+        yield PyPDF2.PdfReader(io.BytesIO(source))
+
+_MAX_FORM_DEPTH = 8  # Nesting of form XObjects searched for fonts
+
+def _has_fonts(resources, depth: int = 0) -> bool:
+    """Whether ``resources``, or the form XObjects they draw, reference a font"""
+    if resources is None:
+        return False
+    resources = resources.get_object()
+    if '/Font' in resources:
+        return True
+    xobjects = resources.get('/XObject')
+    if xobjects is None or depth >= _MAX_FORM_DEPTH:
+        return False
+    for xobject in xobjects.get_object().values():
+        xobject = xobject.get_object()
+        if xobject.get('/Subtype') == '/Form' and _has_fonts(xobject.get('/Resources'), depth + 1):
+            return True
+    return False
+
+def _has_text_layer(page) -> bool:
+    """
+    Image-only (scanned) pages reference no fonts, so there is no text to
+    extract. Text drawn by form XObjects keeps its fonts in their resources.
+    """
+    return _has_fonts(page.get('/Resources'))
+
+def _page_text(page, clean: bool) -> str:
+    if not _has_text_layer(page):
+        return ''
+    text = page.extract_text() or ''
+    return clean_text(text) if clean else text
+
+def iter_pdf_pages(source: PdfSource, clean: bool = True) -> Iterator[str]:
+    """Yield the text of each page in order, in the calling thread"""
+    with _open_pdf(source) as reader:
+        for page in reader.pages:
+            yield _page_text(page, clean)
+
+def _extract_first_pages(source: PdfSource, stop: int, clean: bool) -> Tuple[int, List[str]]:
+    """Worker task: page count plus text of the first ``stop`` pages"""
+    with _open_pdf(source) as reader:
+        return len(reader.pages), [_page_text(page, clean) for page in reader.pages[:stop]]
+
+def _extract_page_range(source: PdfSource, start: int, stop: int, clean: bool) -> List[str]:
+    """Worker task: text of pages ``[start, stop)``"""
+    with _open_pdf(source) as reader:
+        return [_page_text(page, clean) for page in reader.pages[start:stop]]
+
+async def aiter_pdf_pages(
+    source: PdfSource,
+    executor: Optional[Executor] = None,
+    max_pages: int = 50,
+    max_bytes: int = 20 * 1024 * 1024,
+    pages_per_task: int = 8,
+    clean: bool = True
+) -> AsyncIterator[str]:
+    """
+    Stream page texts in order, extracted off the event loop.
+
+    The first task reads the page count along with the first
+    ``pages_per_task`` pages; the remaining page ranges of longer documents are
+    extracted concurrently across the process pool. Paths are opened by the
+    workers themselves, so the file is never copied through the pool. An mmap
+    cannot be pickled and is read in place by a single thread, one range
+    after another. Extractions still running when iteration stops are waited
+    for, so the caller may close the source as soon as this returns.
+    """
+    size = _source_size(source)
+    if size > max_bytes:
+        raise ValueError(f"PDF is {size} bytes, over the {max_bytes} byte limit")
+        
+    if isinstance(source, mmap.mmap):
+        executor = _get_mmap_executor()
+    else:
+        executor = executor or get_pdf_executor()
+    pages_per_task = max(1, pages_per_task)
+    futures: List[Future] = []
+    
+    def submit(func, *args) -> asyncio.Future:
+        future = executor.submit(func, source, *args, clean)
+        futures.append(future)
+        return asyncio.wrap_future(future)
+        
+    try:
+        n_pages, first = await submit(_extract_first_pages, pages_per_task)
+        if n_pages > max_pages:
+            raise ValueError(f"PDF has {n_pages} pages, over the {max_pages} page limit")
+            
+        rest = [
+            submit(_extract_page_range, start, start + pages_per_task)
+            for start in range(pages_per_task, n_pages, pages_per_task)
+        ]
+        for page in first:
+            yield page
+        for chunk in rest:
+            for page in await chunk:
+                yield page
+    finally:
+        # Queued ranges are dropped; running ones still read the source
+        for future in futures:
+            future.cancel()
+        running = [asyncio.wrap_future(future) for future in futures if not future.cancelled()]
+        await asyncio.gather(*running, return_exceptions=True)
+
+async def extract_pdf_text(source: PdfSource, clean: bool = True, **limits) -> str:
+    """
+    Extract the whole text of a PDF off the event loop, joined once.
+
+    Cleaned pages are separated by a blank line; raw pages by a newline.
+    """
+    pages = [page async for page in aiter_pdf_pages(source, clean=clean, **limits)]
+    if clean:
+        return "\n\n".join(page for page in pages if page)
+    return "\n".join(pages) + "\n"
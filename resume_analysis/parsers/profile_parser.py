@@ -1,174 +1,162 @@
 from typing import Dict, Optional, List
-import PyPDF2
-import io
-from github import Github
+import asyncio
 import re
-import aiohttp
+from dataclasses import asdict
 from datetime import datetime, timedelta
+from resume_analysis.models.profile import CandidateProfile, GitHubSource, LinkedInSource, ResumeSource
+from resume_analysis.utils.github_client import GitHubClient, GitHubSnapshot
+from resume_analysis.utils.cache import Cache, content_key
+from resume_analysis.utils import tracing
+from resume_analysis.parsers.pdf_parser import PdfSource, extract_pdf_text, get_pdf_executor
+
+# Bump when extraction or cleaning changes so cached PDF text is not reused
+PARSER_VERSION = "2"
 
 class ProfileParser:
-    def __init__(self, config: Optional[Dict] = None):
+    MAX_DESCRIPTION_CHARS = 300
+    
+    def __init__(self, config: Optional[Dict] = None, github_client: Optional[GitHubClient] = None,
+                 cache=None):
         self.config = config or {}
         self.github_token = self.config.get('github_token')
-        self.headers = {
-            'Authorization': f'token {self.github_token}' if self.github_token else ''
-        }
+        self.github_client = github_client or GitHubClient(self.github_token)
+        self.cache = cache or Cache()
+        self.content_ttl = self.config.get('cache_content_ttl')
+        
+    async def _extract_pdf_text(self, pdf: PdfSource, clean: bool) -> str:
+        """Extract PDF text in the shared process pool, within the configured limits"""
+        with tracing.span('pdf.extract', clean=clean) as span:
+            text = await extract_pdf_text(
+                pdf,
+                clean=clean,
+                executor=get_pdf_executor(self.config.get('pdf_workers')),
+                max_pages=self.config.get('pdf_max_pages', 50),
+                max_bytes=self.config.get('pdf_max_bytes', 20 * 1024 * 1024),
+                pages_per_task=self.config.get('pdf_pages_per_task', 8)
+            )
+            span.set(chars=len(text))
+            return text
 
     async def parse_all_sources(self, 
                               resume_pdf: bytes,
                               github_username: Optional[str] = None,
-                              linkedin_pdf: Optional[bytes] = None) -> str:
-        """Parse and concatenate all available profile sources"""
-        
-        sections = []
-        
-        # Parse Resume PDF
-        if resume_pdf:
-            resume_text = await self._parse_resume_pdf(resume_pdf)
-            sections.append(f"RESUME SECTION:\n{resume_text}")
-        
-        # Parse GitHub Profile
-        if github_username and self.github_token:
-            github_text = await self._parse_github_profile(github_username)
-            sections.append(f"GITHUB SECTION:\n{github_text}")
-            
-        # Parse LinkedIn PDF
-        if linkedin_pdf:
-            linkedin_text = await self._parse_linkedin_pdf(linkedin_pdf)
-            sections.append(f"LINKEDIN SECTION:\n{linkedin_text}")
-            
-        return "\n\n" + "\n\n===\n\n".join(sections) + "\n"
+                              linkedin_pdf: Optional[bytes] = None) -> CandidateProfile:
+        """Parse every available profile source concurrently into one structured profile"""
+        resume, github_snapshot, linkedin = await asyncio.gather(
+            self.parse_resume(resume_pdf),
+            self.fetch_github(github_username if self.github_token else None),
+            self.parse_linkedin(linkedin_pdf)
+        )
+        return CandidateProfile(resume, self.build_github_source(github_username, github_snapshot), linkedin)
 
-    async def _parse_linkedin_pdf(self, pdf_content: bytes) -> str:
+    async def parse_resume(self, resume_pdf: Optional[bytes]) -> Optional[ResumeSource]:
+        """Cleaned resume text, or None without a PDF"""
+        if not resume_pdf:
+            return None
+        return ResumeSource(await self._parse_resume_pdf(resume_pdf))
+
+    async def parse_linkedin(self, linkedin_pdf: Optional[bytes]) -> Optional[LinkedInSource]:
+        """Structured LinkedIn export, or None without a PDF"""
+        if not linkedin_pdf:
+            return None
+        return await self._parse_linkedin_pdf(linkedin_pdf)
+
+    async def _parse_linkedin_pdf(self, pdf_content: bytes) -> LinkedInSource:
         """Parse LinkedIn profile PDF export"""
-        try:
-            pdf_file = io.BytesIO(pdf_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
+        async def parse() -> Dict:
+            # Left uncleaned: the section regexes rely on bullets and separators
+            text = await self._extract_pdf_text(pdf_content, clean=False)
 
             # Extract structured information
-            structured_data = {
-                'basic_info': self._extract_basic_info(text),
-                'experience': self._extract_experience(text),
-                'education': self._extract_education(text),
-                'skills': self._extract_skills(text)
-            }
-
-            # Format the extracted information
-            formatted_text = self._format_linkedin_data(structured_data)
-            return formatted_text
+            return asdict(LinkedInSource(
+                basic_info=self._extract_basic_info(text),
+                experience=self._extract_experience(text),
+                education=self._extract_education(text),
+                skills=self._extract_skills(text)
+            ))
+            
+        try:
+            # Cached by content; identical uploads in flight share one parse
+            return LinkedInSource(**await self.cache.get_or_compute(
+                content_key('linkedin_profile', PARSER_VERSION, pdf_content),
+                parse,
+                self.content_ttl
+            ))
 
         except Exception as e:
             raise ValueError(f"Failed to parse LinkedIn PDF: {str(e)}")
 
-    def _format_linkedin_data(self, data: Dict) -> str:
-        """Format structured LinkedIn data into text"""
-        text = "LinkedIn Profile\n\n"
-        
-        # Basic Info
-        if data['basic_info']:
-            text += f"Name: {data['basic_info'].get('name', '')}\n"
-            text += f"Headline: {data['basic_info'].get('headline', '')}\n"
-            text += f"Location: {data['basic_info'].get('location', '')}\n\n"
-        
-        # Experience
-        text += "Experience:\n"
-        for exp in data['experience']:
-            text += f"- {exp.get('title', '')} at {exp.get('company', '')}\n"
-            text += f"  {exp.get('date_range', '')}\n"
-            if exp.get('description'):
-                text += f"  {exp['description']}\n"
-            text += "\n"
-        
-        # Education
-        text += "Education:\n"
-        for edu in data['education']:
-            text += f"- {edu.get('degree', '')} from {edu.get('school', '')}\n"
-            if edu.get('date_range'):
-                text += f"  {edu['date_range']}\n"
-            text += "\n"
-        
-        # Skills
-        text += "Skills:\n"
-        for skill in data['skills']:
-            text += f"- {skill}\n"
-            
-        return text
-
-            
     async def _parse_resume_pdf(self, pdf_bytes: bytes) -> str:
         """Extract and clean text from PDF resume"""
         try:
-            pdf_file = io.BytesIO(pdf_bytes)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            text = ""
-            
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            
-            # Clean extracted text
-            text = self._clean_text(text)
-            return text
+            # Pages are cleaned in the workers, keeping line structure. Cached by
+            # content; identical uploads in flight share one extraction
+            return await self.cache.get_or_compute(
+                content_key('resume_text', PARSER_VERSION, pdf_bytes),
+                lambda: self._extract_pdf_text(pdf_bytes, clean=True),
+                self.content_ttl
+            )
             
         except Exception as e:
             raise ValueError(f"Failed to parse PDF resume: {str(e)}")
     
-    async def _parse_github_profile(self, username: str) -> str:
-        """Extract relevant information from GitHub profile"""
+    async def fetch_github(self, username: Optional[str], events: bool = False) -> Optional[GitHubSnapshot]:
+        """Fetch the one snapshot every GitHub view is derived from, or None without a username"""
+        if not username:
+            return None
         try:
-            g = Github(self.github_token)
-            user = g.get_user(username)
-            repos = user.get_repos()
-            
-            text = f"GitHub Profile - {username}\n"
-            text += f"Bio: {user.bio or ''}\n\n"
-            
-            # Collect languages and topics
-            languages = set()
-            topics = set()
-            repo_texts = []
-            
-            for repo in repos:
-                if not repo.fork:  # Skip forked repositories
-                    if repo.language:
-                        languages.add(repo.language)
-                    topics.update(repo.get_topics())
-                    
-                    # Get detailed repo info
-                    repo_text = f"Repository: {repo.name}\n"
-                    repo_text += f"Description: {repo.description or 'No description'}\n"
-                    repo_text += f"Language: {repo.language or 'Not specified'}\n"
-                    repo_text += f"Stars: {repo.stargazers_count}\n"
-                    repo_text += f"Topics: {', '.join(repo.get_topics())}\n"
-                    repo_texts.append(repo_text)
-            
-            # Add summary sections
-            text += f"Programming Languages: {', '.join(languages)}\n"
-            text += f"Topics & Skills: {', '.join(topics)}\n\n"
-            text += "Notable Repositories:\n"
-            text += "\n---\n".join(repo_texts)  
-            
-            return text
-            
+            return await self.github_client.get_snapshot(username, events=events)
         except Exception as e:
-            raise ValueError(f"Failed to parse GitHub profile: {str(e)}")
-    
-    def _clean_text(self, text: str) -> str:
-        """Clean and normalize extracted text"""
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+            raise ValueError(f"Failed to fetch GitHub profile: {str(e)}")
+
+    def build_github_source(self, github_username: str,
+                            github_snapshot: Optional[GitHubSnapshot]) -> Optional[GitHubSource]:
+        """
+        GitHub source for scoring; only included when a token is configured.
+
+        Repositories are taken in snapshot order until their text reaches
+        ``github_max_text_chars``, so prolific users do not blow up the text
+        fed to the scorers.
+        """
+        if github_snapshot is None or not self.github_token:
+            return None
+            
+        budget = self.config.get('github_max_text_chars', 8000)
+        bio = github_snapshot.user.get('bio') or ''
+        used = len(GitHubSource(github_username, bio).text)
         
-        # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s.,;:!?-]', '', text)
+        # Collect languages and topics in first-seen order
+        languages = {}
+        topics = {}
+        repositories = []
         
-        # Normalize line endings
-        text = text.replace('\r', '\n')
-        text = re.sub(r'\n\s*\n+', '\n\n', text) 
+        for repo in github_snapshot.repos:
+            if repo.get('fork'):  # Skip forked repositories
+                continue
+            repo_topics = repo.get('topics') or []
+            entry = {
+                'name': repo['name'],
+                'description': (repo.get('description') or '')[:self.MAX_DESCRIPTION_CHARS],
+                'language': repo.get('language'),
+                'stars': repo.get('stargazers_count', 0),
+                'topics': repo_topics
+            }
+            new_topics = [topic for topic in repo_topics if topic not in topics]
+            used += len(GitHubSource.repo_text(entry)) + sum(len(t) + 2 for t in new_topics)
+            if used > budget and repositories:
+                break
+            if repo.get('language'):
+                languages[repo['language']] = None
+            topics.update(dict.fromkeys(new_topics))
+            repositories.append(entry)
         
-        return text.strip()
+        return GitHubSource(
+            username=github_username,
+            bio=bio,
+            languages=list(languages),
+            topics=list(topics),
+            repositories=repositories
+        )
     
     def _extract_basic_info(self, text: str) -> Dict:
         """Extract basic profile information"""
@@ -285,55 +273,39 @@ class ProfileParser:
     async def parse_github_profile(self, username: str) -> Dict:
         """Parse GitHub profile data"""
         try:
-            # Get user data
-            user_url = f'https://api.github.com/users/{username}'
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                async with session.get(user_url) as response:
-                    if response.status != 200:
-                        raise ValueError(f"Failed to fetch GitHub profile: {response.status}")
-                    user_data = await response.json()
-                
-                # Get repositories
-                repos_url = f'https://api.github.com/users/{username}/repos'
-                async with session.get(repos_url) as response:
-                    if response.status != 200:
-                        raise ValueError(f"Failed to fetch repositories: {response.status}")
-                    repos_data = await response.json()
-                
-                # Get languages
-                languages = {}
-                for repo in repos_data:
-                    lang = repo.get('language')
-                    if lang:
-                        languages[lang] = languages.get(lang, 0) + 1
-                
-                return {
-                    'username': user_data.get('login'),
-                    'name': user_data.get('name'),
-                    'bio': user_data.get('bio'),
-                    'repositories': [{
-                        'name': repo['name'],
-                        'description': repo.get('description'),
-                        'stars': repo.get('stargazers_count', 0),
-                        'language': repo.get('language'),
-                        'url': repo['html_url']
-                    } for repo in repos_data],
-                    'languages': languages,
-                    'contributions_last_year': await self._get_contributions(username, session)
-                }
-                
+            return self.build_github_profile(await self.fetch_github(username, events=True))
         except Exception as e:
             raise ValueError(f"GitHub profile parsing failed: {str(e)}")
             
-    async def _get_contributions(self, username: str, session: aiohttp.ClientSession) -> int:
+    def build_github_profile(self, github_snapshot: GitHubSnapshot) -> Dict:
+        """Profile summary (repositories, languages, contributions) from a GitHub snapshot"""
+        user_data, repos_data = github_snapshot.user, github_snapshot.repos
+        
+        # Get languages
+        languages = {}
+        for repo in repos_data:
+            lang = repo.get('language')
+            if lang:
+                languages[lang] = languages.get(lang, 0) + 1
+        
+        return {
+            'username': user_data.get('login'),
+            'name': user_data.get('name'),
+            'bio': user_data.get('bio'),
+            'repositories': [{
+                'name': repo['name'],
+                'description': repo.get('description'),
+                'stars': repo.get('stargazers_count', 0),
+                'language': repo.get('language'),
+                'url': repo['html_url']
+            } for repo in repos_data],
+            'languages': languages,
+            'contributions_last_year': self._count_contributions(github_snapshot.events)
+        }
+            
+    def _count_contributions(self, events: List[Dict]) -> int:
         """Get contribution count for the last year"""
         try:
-            url = f'https://api.github.com/users/{username}/events'
-            async with session.get(url) as response:
-                if response.status != 200:
-                    return 0
-                events = await response.json()
-                
             # Count push events in the last year
             one_year_ago = datetime.now() - timedelta(days=365)
             return sum(1 for event in events 
@@ -341,4 +313,4 @@ class ProfileParser:
                       and datetime.strptime(event['created_at'], '%Y-%m-%dT%H:%M:%SZ') > one_year_ago)
                       
         except Exception:
-            return 0 
\ No newline at end of file
+            return 0 
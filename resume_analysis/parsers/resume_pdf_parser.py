@@ -1,35 +1,14 @@
-import PyPDF2
-import re
-import io
+import logging
+from resume_analysis.parsers.pdf_parser import clean_text as _clean_text, iter_pdf_pages
 
-def _clean_text(text: str) -> str:
-        """Clean and normalize extracted text"""
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s.,;:!?-]', '', text)
-        
-        # Normalize line endings
-        text = text.replace('\r', '\n')
-        text = re.sub(r'\n\s*\n+', '\n\n', text)
-        
-        return text.strip()
+logger = logging.getLogger(__name__)
 
 
 def _parse_resume_pdf(pdf_bytes: bytes) -> str:
     """Extract and clean text from PDF resume"""
     try:
-        pdf_file = io.BytesIO(pdf_bytes)
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        
-        # Clean extracted text
-        text = _clean_text(text)
-        print(text)
+        text = "\n\n".join(page for page in iter_pdf_pages(pdf_bytes) if page)
+        logger.debug("Parsed resume text (%d chars)", len(text))
         return text
         
     except Exception as e:
@@ -0,0 +1,108 @@
+from typing import Any, Callable, Dict, Iterable, List
+import asyncio
+import inspect
+import time
+from resume_analysis.utils import tracing
+from resume_analysis.utils.exceptions import ResumeAnalysisError
+
+class Stage:
+    """One named step of a pipeline and the stages or inputs it depends on"""
+    
+    __slots__ = ('name', 'func', 'deps')
+    
+    def __init__(self, name: str, func: Callable, deps: Iterable[str] = ()):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+
+class PipelineResult:
+    """Value of every stage plus its own run time in seconds"""
+    
+    __slots__ = ('results', 'timings')
+    
+    def __init__(self, results: Dict[str, Any], timings: Dict[str, float]):
+        self.results = results
+        self.timings = timings
+        
+    def __getitem__(self, name: str) -> Any:
+        return self.results[name]
+
+class Pipeline:
+    """
+    Dependency graph of async (or plain) stages.
+
+    A stage is called with its dependencies' values as keyword arguments and
+    starts as soon as they are available, so independent stages run
+    concurrently. A dependency that is not yet a stage when its dependent is
+    added is an input, to be passed to ``run``, and can no longer become a
+    stage; this keeps the graph acyclic by construction. Timings exclude the
+    time spent waiting on dependencies. With tracing enabled every stage is
+    also a ``stage.<name>`` span under one ``pipeline`` span.
+    """
+    
+    def __init__(self):
+        self._stages: Dict[str, Stage] = {}
+        
+    @property
+    def stage_names(self) -> List[str]:
+        return list(self._stages)
+        
+    def add(self, name: str, func: Callable, deps: Iterable[str] = ()) -> 'Pipeline':
+        if name in self._stages:
+            raise ValueError(f"Duplicate pipeline stage: {name}")
+        stage = Stage(name, func, deps)
+        if name in stage.deps:
+            raise ValueError(f"Stage '{name}' depends on itself")
+        dependents = [s.name for s in self._stages.values() if name in s.deps]
+        if dependents:
+            raise ValueError(f"Stage '{name}' must be added before its dependents {dependents}")
+        self._stages[name] = stage
+        return self
+        
+    async def run(self, **inputs) -> PipelineResult:
+        """Run every stage; the first failure cancels the rest and is raised"""
+        overlap = [name for name in inputs if name in self._stages]
+        if overlap:
+            raise ValueError(f"Inputs {overlap} are pipeline stages")
+        for stage in self._stages.values():
+            missing = [d for d in stage.deps if d not in self._stages and d not in inputs]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown {missing}")
+                
+        results = dict(inputs)
+        timings: Dict[str, float] = {}
+        tasks: Dict[str, asyncio.Future] = {}
+        
+        async def run_stage(stage: Stage) -> None:
+            pending = [tasks[d] for d in stage.deps if d in tasks]
+            if pending:
+                await asyncio.gather(*pending)
+            start = time.perf_counter()
+            try:
+                with tracing.span(f"stage.{stage.name}"):
+                    value = stage.func(**{d: results[d] for d in stage.deps})
+                    if inspect.isawaitable(value):
+                        value = await value
+            except ResumeAnalysisError:
+                raise
+            except Exception as e:
+                raise ResumeAnalysisError(f"Stage '{stage.name}' failed: {str(e)}") from e
+            finally:
+                timings[stage.name] = round(time.perf_counter() - start, 4)
+            results[stage.name] = value
+            
+        start = time.perf_counter()
+        with tracing.span('pipeline', stages=len(self._stages)):
+            # Stages were added after their dependencies, so this order is topological
+            for stage in self._stages.values():
+                tasks[stage.name] = asyncio.ensure_future(run_stage(stage))
+            try:
+                await asyncio.gather(*tasks.values())
+            except BaseException:
+                for task in tasks.values():
+                    task.cancel()
+                await asyncio.gather(*tasks.values(), return_exceptions=True)
+                raise
+        timings['total'] = round(time.perf_counter() - start, 4)
+        
+        return PipelineResult({name: results[name] for name in self._stages}, timings)
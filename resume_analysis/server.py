@@ -0,0 +1,237 @@
+import sys
+import json
+import base64
+import binascii
+import asyncio
+import logging
+from typing import Dict, Optional
+from resume_analysis.main import (
+    initialize_llm,
+    analyze_candidate,
+    analyze_linkedin_profile
+)
+from resume_analysis.models.enhanced_resume_scorer import EnhancedResumeScorer
+from resume_analysis.models.hackathon_matcher import HackathonMatcher
+from resume_analysis.config import Config
+from resume_analysis.utils import tracing
+
+logger = logging.getLogger(__name__)
+
+def _pdf_bytes(data: Dict, field: str, required: bool = True) -> Optional[bytes]:
+    """
+    PDF bytes of a request from its base64 ``<field>_b64`` value.
+
+    Clients speak JSON, so a plain string is never accepted as the PDF: the
+    parsers would treat it as a path and open a file on the server. Raw
+    bytes are still taken from in-process callers.
+    """
+    encoded = data.get(f"{field}_b64")
+    if encoded is None:
+        value = data.get(field)
+        if isinstance(value, (bytes, bytearray)):
+            return bytes(value)
+        if value is not None:
+            raise ValueError(f"'{field}' must be sent base64-encoded as '{field}_b64'")
+        if required:
+            raise ValueError(f"Missing '{field}_b64'")
+        return None
+        
+    if not isinstance(encoded, str):
+        raise ValueError(f"'{field}_b64' must be a base64 string")
+    try:
+        return base64.b64decode(encoded, validate=True)
+    except binascii.Error as e:
+        raise ValueError(f"Invalid base64 in '{field}_b64': {str(e)}")
+
+def _max_request_bytes(config: Config) -> int:
+    """Largest request accepted: two base64-encoded PDFs at PDF_MAX_BYTES plus the rest of the JSON"""
+    return 2 * 4 * -(-config.PDF_MAX_BYTES // 3) + 1024 * 1024
+
+async def _read_request_line(reader: asyncio.StreamReader) -> Optional[bytes]:
+    """
+    Next newline-terminated request; ``b''`` at end of input.
+
+    A line over the reader's limit is discarded up to and including its
+    newline and None is returned, so the next request is read intact.
+    """
+    try:
+        return await reader.readuntil(b"\n")
+    except asyncio.IncompleteReadError as e:
+        return e.partial
+    except asyncio.LimitOverrunError as e:
+        consumed = e.consumed
+        
+    while True:
+        # The first `consumed` buffered bytes hold no newline; drop them and look again
+        await reader.readexactly(consumed)
+        try:
+            await reader.readuntil(b"\n")
+            return None
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError as e:
+            consumed = e.consumed
+
+class AnalysisWorker:
+    """Long-lived worker that keeps the scorer, spaCy pipeline and clients warm"""
+    
+    REQUEST_TYPES = ('analyze_candidate', 'analyze_linkedin')
+    
+    def __init__(self, config: Optional[Config] = None, concurrency: Optional[int] = None):
+        self.config = config or Config()
+        self.concurrency = max(1, concurrency or self.config.BATCH_CONCURRENCY)
+        self.scorer: Optional[EnhancedResumeScorer] = None
+        self.matcher: Optional[HackathonMatcher] = None
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        
+    async def close(self) -> None:
+        """Release the scorer's pooled connections"""
+        if self.scorer is not None:
+            await self.scorer.close()
+            
+    async def start(self) -> None:
+        """Run the one-off LLM check and load models before serving"""
+        tracing.configure_from_config(self.config)
+        if not await initialize_llm(self.config):
+            raise RuntimeError("Failed to initialize LLM")
+        self.scorer = EnhancedResumeScorer(self.config)
+        self.matcher = HackathonMatcher()
+        
+    async def handle(self, request_type: str, data: Dict) -> Dict:
+        """
+        Run one request against the warm scorer.
+
+        PDFs arrive base64-encoded as ``resume_pdf_b64``, ``linkedin_pdf_b64``
+        and ``pdf_content_b64``.
+        """
+        if request_type not in self.REQUEST_TYPES:
+            raise ValueError(f"Unknown request type: {request_type}")
+            
+        async with self._semaphore:
+            if request_type == 'analyze_candidate':
+                # analyze_candidate opens the request's trace
+                return await analyze_candidate(
+                    resume_pdf=_pdf_bytes(data, 'resume_pdf'),
+                    github_username=data.get('github_username'),
+                    hackathons=data.get('hackathons'),
+                    linkedin_pdf=_pdf_bytes(data, 'linkedin_pdf', required=False),
+                    scorer=self.scorer,
+                    matcher=self.matcher
+                )
+            with tracing.span('analyze_linkedin'):
+                return await analyze_linkedin_profile(
+                    _pdf_bytes(data, 'pdf_content'),
+                    self.scorer.profile_parser
+                )
+                
+    def metrics(self) -> str:
+        """Prometheus text: request counters, span latencies and the scorer's cache/coalescing gauges"""
+        gauges = {}
+        if self.scorer is not None:
+            for layer, stats in self.scorer.stats().items():
+                for key, value in stats.items():
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        gauges[f"{layer}_{key}"] = value
+        return tracing.render_metrics(gauges)
+            
+    async def handle_message(self, message: Dict) -> Dict:
+        """Handle a ``{"id", "type", "data"}`` message, never raising"""
+        response = {'id': message.get('id')}
+        try:
+            response['result'] = await self.handle(message.get('type'), message.get('data') or {})
+        except Exception as e:
+            response['error'] = str(e)
+        return response
+
+async def serve_stdio(worker: AnalysisWorker) -> None:
+    """Serve JSON-lines requests from stdin, writing responses to stdout as they complete"""
+    # Keep stdout for the protocol; stray prints from the pipeline go to stderr
+    protocol_out = sys.stdout
+    sys.stdout = sys.stderr
+    try:
+        await worker.start()
+        
+        loop = asyncio.get_running_loop()
+        # Requests carry base64 PDFs, far beyond the default 64 KiB line limit
+        max_bytes = _max_request_bytes(worker.config)
+        reader = asyncio.StreamReader(limit=max_bytes)
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        
+        def write(response: Dict) -> None:
+            protocol_out.write(json.dumps(response) + "\n")
+            protocol_out.flush()
+            
+        # A line is only read once one of ``worker.concurrency`` slots is free,
+        # so a fast producer waits in the pipe instead of filling memory
+        slots = asyncio.Semaphore(worker.concurrency)
+        
+        async def process(line: bytes) -> None:
+            try:
+                # handle_message never raises, so a decode error can only come from the line
+                write(await worker.handle_message(json.loads(line)))
+            except json.JSONDecodeError as e:
+                write({'id': None, 'error': f"Invalid JSON: {str(e)}"})
+            finally:
+                slots.release()
+                
+        tasks = set()
+        while True:
+            await slots.acquire()
+            line = await _read_request_line(reader)
+            if line and line.strip():
+                task = asyncio.ensure_future(process(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                continue
+            slots.release()
+            if line is None:
+                write({'id': None, 'error': f"Request exceeds {max_bytes} bytes"})
+            elif not line:
+                break
+                
+        if tasks:
+            await asyncio.gather(*tasks)
+        await worker.close()
+    finally:
+        sys.stdout = protocol_out
+
+async def serve_http(worker: AnalysisWorker, host: str = "127.0.0.1", port: int = 8765) -> None:
+    """Serve ``POST /<request_type>``, ``GET /health`` and ``GET /metrics`` on a local HTTP port"""
+    from aiohttp import web
+    
+    await worker.start()
+    
+    async def health(request: web.Request) -> web.Response:
+        return web.json_response({'status': 'ok'})
+        
+    async def metrics(request: web.Request) -> web.Response:
+        return web.Response(text=worker.metrics(), content_type='text/plain', charset='utf-8')
+        
+    async def analyze(request: web.Request) -> web.Response:
+        request_type = request.match_info['request_type']
+        if request_type not in worker.REQUEST_TYPES:
+            return web.json_response({'error': f"Unknown request type: {request_type}"}, status=404)
+        try:
+            data = await request.json()
+        except json.JSONDecodeError as e:
+            return web.json_response({'error': f"Invalid JSON: {str(e)}"}, status=400)
+        try:
+            return web.json_response(await worker.handle(request_type, data))
+        except Exception as e:
+            return web.json_response({'error': str(e)}, status=500)
+            
+    app = web.Application(client_max_size=_max_request_bytes(worker.config))
+    app.router.add_get('/health', health)
+    app.router.add_get('/metrics', metrics)
+    app.router.add_post('/{request_type}', analyze)
+    
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    logger.info("Serving resume analysis on http://%s:%s", host, port)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+        await worker.close()
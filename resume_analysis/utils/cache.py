@@ -1,29 +1,349 @@
-from typing import Any, Optional
-from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+import asyncio
+import hashlib
+import heapq
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import logging
+from resume_analysis.utils.singleflight import SingleFlight
 
-class Cache:
-    def __init__(self, ttl: Optional[int] = None):
-        self._cache = {}
-        self._expiry = {}
-        self._default_ttl = timedelta(hours=1 if ttl is None else ttl/3600)
+logger = logging.getLogger(__name__)
+
+def content_key(namespace: str, *parts: Union[str, bytes, None]) -> str:
+    """
+    Stable, process-independent cache key: SHA-256 over the namespace and parts.
+
+    Unlike ``hash()``, the key is identical across processes and restarts, so it
+    can address the disk tier. Parts are length-prefixed so that different
+    splits of the same bytes never collide.
+    """
+    digest = hashlib.sha256(namespace.encode())
+    for part in parts:
+        data = part if isinstance(part, bytes) else str(part).encode()
+        digest.update(len(data).to_bytes(8, 'big'))
+        digest.update(data)
+    return f"{namespace}:{digest.hexdigest()}"
+
+def payload_size(value: Any) -> int:
+    """Bytes of the value's JSON form (what the disk tier stores); shallow size for other objects"""
+    try:
+        return len(json.dumps(value))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+def _ttl_seconds(ttl: Optional[Union[float, timedelta]], default: float) -> float:
+    if ttl is None:
+        return default
+    return ttl.total_seconds() if isinstance(ttl, timedelta) else float(ttl)
+
+class _SingleFlight:
+    """``get_or_compute`` for caches exposing ``get``/``set``"""
+    
+    async def aget(self, key: str) -> Optional[Any]:
+        """``get`` for coroutines; tiers backed by disk read it off the event loop"""
+        return self.get(key)
+        
+    @property
+    def coalesced(self) -> int:
+        return self._flight.coalesced
+    
+    async def get_or_compute(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: Optional[Union[float, timedelta]] = None
+    ) -> Any:
+        """
+        Return the cached value or compute it once.
+
+        Concurrent misses on the same key share the first caller's in-flight
+        computation instead of each running ``factory``. ``None`` results and
+        failures are not cached.
+        """
+        value = await self.aget(key)
+        if value is not None:
+            return value
+            
+        async def compute() -> Any:
+            value = await factory()
+            if value is not None:
+                self.set(key, value, ttl)
+            return value
+            
+        return await self._flight.do(key, compute)
+
+class Cache(_SingleFlight):
+    """
+    Capacity-bounded LRU cache with monotonic-clock TTLs.
+
+    Expired entries are dropped when read and swept a few at a time on every
+    write, earliest expiry first (entries may carry different TTLs), so a
+    long-running worker's memory stays bounded by ``max_entries`` /
+    ``max_bytes`` without a background task. Sizes default to the length of
+    the value's JSON form.
+    """
+    
+    SWEEP_BATCH = 16  # Expired entries removed per write
+    
+    def __init__(
+        self,
+        ttl: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = payload_size
+    ):
+        self._cache = OrderedDict()  # key -> (value, expires_at, size), in LRU order
+        # Heap of (expires_at, key); entries replaced or removed since are skipped lazily
+        self._expiry = []
+        self._flight = SingleFlight()
+        self._default_ttl = 3600.0 if ttl is None else float(ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.bytes = 0
+        
+    def __len__(self) -> int:
+        return len(self._cache)
         
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache if not expired"""
-        if key not in self._cache:
+        entry = self._cache.get(key)
+        if entry is None:
+            self.misses += 1
             return None
             
-        if datetime.now() > self._expiry[key]:
-            self.delete(key)
+        if entry[1] <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
             return None
             
-        return self._cache[key]
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+        
+    def set(self, key: str, value: Any, ttl: Optional[Union[float, timedelta]] = None,
+            size: Optional[int] = None) -> None:
+        """
+        Set value in cache with expiry, evicting least recently used entries over capacity.
+
+        ``size`` skips measuring when the caller already knows it.
+        """
+        now = time.monotonic()
+        expires_at = now + _ttl_seconds(ttl, self._default_ttl)
+        size = self._sizeof(value) if size is None else size
         
-    def set(self, key: str, value: Any, ttl: Optional[timedelta] = None) -> None:
-        """Set value in cache with expiry"""
-        self._cache[key] = value
-        self._expiry[key] = datetime.now() + (ttl or self._default_ttl)
+        self._remove(key)
+        self._cache[key] = (value, expires_at, size)
+        heapq.heappush(self._expiry, (expires_at, key))
+        self.bytes += size
+        
+        self._sweep(now)
+        while self._cache and (
+            (self.max_entries and len(self._cache) > self.max_entries) or
+            (self.max_bytes and self.bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._cache)))
+            self.evictions += 1
         
     def delete(self, key: str) -> None:
         """Delete key from cache"""
-        self._cache.pop(key, None)
-        self._expiry.pop(key, None) 
\ No newline at end of file
+        self._remove(key)
+        
+    def clear(self) -> None:
+        self._cache.clear()
+        self._expiry.clear()
+        self.bytes = 0
+        
+    def _remove(self, key: str) -> None:
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[2]
+            
+    def _sweep(self, now: float) -> None:
+        """Drop up to SWEEP_BATCH expired entries, earliest expiry first"""
+        for _ in range(self.SWEEP_BATCH):
+            if not self._expiry or self._expiry[0][0] > now:
+                break
+            expires_at, key = heapq.heappop(self._expiry)
+            entry = self._cache.get(key)
+            if entry is not None and entry[1] == expires_at:
+                self._remove(key)
+                self.expirations += 1
+                
+        # Rebuild once skipped heap items outnumber the live entries
+        if len(self._expiry) > 2 * len(self._cache) + self.SWEEP_BATCH:
+            self._expiry = [(entry[1], key) for key, entry in self._cache.items()]
+            heapq.heapify(self._expiry)
+            
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._cache),
+            'bytes': self.bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'coalesced': self.coalesced
+        }
+
+def _log_write_error(future: Future) -> None:
+    if future.exception() is not None:
+        logger.warning("Disk cache write failed: %s", future.exception())
+
+class DiskCache:
+    """
+    SQLite-backed cache of JSON-serializable values that survives restarts.
+
+    Every SQLite call runs on the cache's own thread, in submission order:
+    coroutines read through ``aget`` and writes are queued without waiting,
+    so the event loop never blocks on disk.
+    """
+    
+    PURGE_EVERY = 256  # Writes between sweeps of expired rows
+    
+    def __init__(self, path: str, ttl: Optional[int] = None):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._default_ttl = 3600 if ttl is None else ttl
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="disk-cache")
+        
+    def get(self, key: str) -> Optional[Any]:
+        """Get value if present and not expired (blocks until queued writes are done)"""
+        return self._executor.submit(self._get, key).result()
+        
+    async def aget(self, key: str) -> Optional[Any]:
+        """``get`` awaited from a coroutine"""
+        return await asyncio.wrap_future(self._executor.submit(self._get, key))
+        
+    def _get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < time.time():
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+        return json.loads(row[0])
+        
+    def set(self, key: str, value: Any, ttl: Optional[Union[float, timedelta]] = None) -> None:
+        """Queue storing a JSON-serializable value"""
+        self.set_payload(key, json.dumps(value), ttl)
+        
+    def set_payload(self, key: str, payload: str, ttl: Optional[Union[float, timedelta]] = None) -> None:
+        """Queue storing an already serialized value"""
+        expires_at = time.time() + _ttl_seconds(ttl, self._default_ttl)
+        self._executor.submit(self._write, key, payload, expires_at).add_done_callback(_log_write_error)
+        
+    def _write(self, key: str, payload: str, expires_at: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, payload, expires_at)
+            )
+            self._writes += 1
+            if self._writes % self.PURGE_EVERY == 0:
+                self._conn.execute("DELETE FROM cache WHERE expires_at < ?", (time.time(),))
+                
+    def delete(self, key: str) -> None:
+        """Queue deleting key from cache"""
+        self._executor.submit(self._delete, key).add_done_callback(_log_write_error)
+        
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            
+    def close(self) -> None:
+        """Finish queued writes and close the database"""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            self._conn.close()
+
+class TieredCache(_SingleFlight):
+    """Bounded in-memory tier in front of an optional persistent disk tier"""
+    
+    def __init__(self, memory: Cache, disk: Optional[DiskCache] = None):
+        self.memory = memory
+        self.disk = disk
+        self._flight = SingleFlight()
+        self.disk_hits = 0
+        
+    def get(self, key: str) -> Optional[Any]:
+        """Get from memory, falling back to (and promoting from) disk; coroutines use ``aget``"""
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = self._promote(key, self.disk.get(key))
+        return value
+        
+    async def aget(self, key: str) -> Optional[Any]:
+        """``get`` with the disk read off the event loop"""
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = self._promote(key, await self.disk.aget(key))
+        return value
+        
+    def _promote(self, key: str, value: Optional[Any]) -> Optional[Any]:
+        if value is not None:
+            self.disk_hits += 1
+            self.memory.set(key, value)
+        return value
+        
+    def set(self, key: str, value: Any, ttl: Optional[Union[float, timedelta]] = None) -> None:
+        """Write through both tiers; the disk write is queued, and serialized once for both"""
+        if self.disk is None:
+            self.memory.set(key, value, ttl)
+            return
+        payload = json.dumps(value)
+        self.memory.set(key, value, ttl, size=len(payload))
+        self.disk.set_payload(key, payload, ttl)
+            
+    def delete(self, key: str) -> None:
+        self.memory.delete(key)
+        if self.disk is not None:
+            self.disk.delete(key)
+            
+    def stats(self) -> Dict[str, Any]:
+        """Memory-tier counters plus disk-tier hits"""
+        return {**self.memory.stats(), 'disk_hits': self.disk_hits, 'coalesced': self.coalesced}
+            
+    def close(self) -> None:
+        if self.disk is not None:
+            self.disk.close()
+
+def create_cache(config) -> TieredCache:
+    """Build the shared cache described by ``Config`` (disk tier off when CACHE_DIR is empty)"""
+    memory = Cache(ttl=config.CACHE_TTL, max_entries=config.CACHE_MAX_ENTRIES)
+    disk = None
+    if config.CACHE_DIR:
+        disk = DiskCache(
+            os.path.join(os.path.expanduser(config.CACHE_DIR), "cache.sqlite3"),
+            ttl=config.CACHE_TTL
+        )
+    return TieredCache(memory, disk)
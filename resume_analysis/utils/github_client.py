@@ -0,0 +1,229 @@
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, TYPE_CHECKING
+from contextlib import aclosing
+from dataclasses import dataclass, field
+import asyncio
+import heapq
+import json
+import re
+from resume_analysis.utils.cache import content_key
+from resume_analysis.utils.response_store import ResponseStore
+from resume_analysis.utils.singleflight import SingleFlight
+from resume_analysis.utils import tracing
+from resume_analysis.utils.rate_limiter import (
+    GITHUB_CORE, GITHUB_SEARCH, RateLimiterRegistry, get_rate_limiters
+)
+
+if TYPE_CHECKING:
+    import aiohttp
+
+GITHUB_API_URL = "https://api.github.com"
+
+_NEXT_LINK = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+# Orders the repos endpoint can sort by; 'stars' is applied client-side
+REPO_SORTS = ('pushed', 'updated', 'created', 'full_name')
+
+@dataclass(slots=True)
+class GitHubSnapshot:
+    """Everything fetched for one user, once; every GitHub view is derived from it"""
+    username: str
+    user: Dict
+    repos: List[Dict] = field(default_factory=list)
+    events: List[Dict] = field(default_factory=list)
+    
+    def fingerprint(self) -> str:
+        """Content hash of the user and repositories (events only feed contribution counts)"""
+        return content_key('github_snapshot', self.username, json.dumps([self.user, self.repos], sort_keys=True))
+
+class GitHubClient:
+    """Async GitHub REST client over one pooled, reusable aiohttp session"""
+    
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        base_url: str = GITHUB_API_URL,
+        max_connections: int = 20,
+        timeout: float = 10,
+        store: Optional[ResponseStore] = None,
+        rate_limiters: Optional[RateLimiterRegistry] = None,
+        repo_sort: Optional[str] = None,
+        repo_limit: Optional[int] = None,
+        repo_scan_limit: Optional[int] = None
+    ):
+        self.token = token
+        self.base_url = base_url.rstrip('/')
+        self.headers = {'Accept': 'application/vnd.github+json'}
+        if token:
+            self.headers['Authorization'] = f'token {token}'
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.store = store
+        self.inflight = SingleFlight()
+        # Defaults for snapshots: which repositories to keep and how far to page
+        self.repo_sort = repo_sort
+        self.repo_limit = repo_limit
+        self.repo_scan_limit = repo_scan_limit
+        self.rate_limiters = rate_limiters or get_rate_limiters()
+        self._session: Optional['aiohttp.ClientSession'] = None
+        
+    async def __aenter__(self) -> 'GitHubClient':
+        return self
+        
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+        
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        """Create the shared session on first use inside the running loop"""
+        import aiohttp
+        
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+        
+    async def close(self) -> None:
+        """Close the pooled session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        
+    async def _get(self, url: str, params: Optional[Dict] = None) -> Tuple[Any, Dict[str, str]]:
+        """
+        GET a URL (absolute or relative to the API root), returning JSON and headers.
+
+        Concurrent identical GETs share one request.
+        """
+        if not url.startswith('http'):
+            url = f"{self.base_url}{url}"
+        key = (url, json.dumps(params, sort_keys=True))
+        return await self.inflight.do(key, lambda: self._fetch(url, params))
+        
+    async def _fetch(self, url: str, params: Optional[Dict]) -> Tuple[Any, Dict[str, str]]:
+        """
+        With a response store, fresh stored responses need no request and
+        stale ones are revalidated conditionally; a 304 reuses the stored body
+        and its rate-limit token is given back, as GitHub does not count it.
+        """
+        stored = await self.store.get(url, params) if self.store is not None else None
+        if stored is not None and self.store.is_fresh(stored):
+            return stored['data'], stored['headers']
+                
+        request_headers = self.store.conditional_headers(stored) if self.store is not None else {}
+        limiter = self.rate_limiters.get(GITHUB_SEARCH if '/search/' in url else GITHUB_CORE)
+        with tracing.span('github.request', url=url, conditional=bool(request_headers)) as span:
+            async with limiter:
+                response = await self._get_session().get(url, params=params, headers=request_headers)
+            span.set(status=response.status)
+        tracing.count('github_requests_total', status=response.status)
+        async with response:
+            if response.status == 304 and stored is not None:
+                limiter.release()
+                limiter.update_from_headers(response.headers)
+                self.store.refresh(url, params, stored)
+                return stored['data'], stored['headers']
+                
+            limiter.update_from_headers(response.headers)
+            if response.status != 200:
+                raise ValueError(f"GitHub request failed ({response.status}): {url}")
+            data = await response.json()
+            # Pagination only needs the Link header
+            headers = {'Link': response.headers.get('Link', '')}
+            
+            if self.store is not None:
+                self.store.save(
+                    url, params, data, headers,
+                    response.headers.get('ETag'),
+                    response.headers.get('Last-Modified')
+                )
+        return data, headers
+            
+    async def _paginate(self, url: str, params: Optional[Dict] = None) -> AsyncIterator[Dict]:
+        """Yield items across every page by following ``Link: rel="next"``"""
+        params = {'per_page': 100, **(params or {})}
+        while url:
+            items, headers = await self._get(url, params)
+            for item in items:
+                yield item
+            match = _NEXT_LINK.search(headers.get('Link', ''))
+            url = match.group(1) if match else None
+            params = None  # The next link already carries the query string
+            
+    async def get_user(self, username: str) -> Dict:
+        """Fetch ``/users/{username}``"""
+        user, _ = await self._get(f"/users/{username}")
+        return user
+        
+    async def iter_repos(self, username: str, sort: Optional[str] = None,
+                         limit: Optional[int] = None) -> AsyncIterator[Dict]:
+        """
+        Yield the user's repositories; each listing entry already carries ``topics``.
+
+        ``sort`` is one of ``REPO_SORTS`` (newest first, or by name). No further
+        page is requested once ``limit`` repositories have been yielded.
+        """
+        params = {'type': 'owner'}
+        if sort is not None:
+            if sort not in REPO_SORTS:
+                raise ValueError(f"Unsupported repository sort: {sort}")
+            params['sort'] = sort
+            params['direction'] = 'asc' if sort == 'full_name' else 'desc'
+        if limit is not None:
+            if limit <= 0:
+                return
+            params['per_page'] = min(100, limit)
+            
+        count = 0
+        async with aclosing(self._paginate(f"/users/{username}/repos", params)) as repos:
+            async for repo in repos:
+                yield repo
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+            
+    async def get_repos(self, username: str, sort: Optional[str] = None, limit: Optional[int] = None,
+                        scan_limit: Optional[int] = None) -> List[Dict]:
+        """
+        Fetch the user's top ``limit`` repositories (all of them by default).
+
+        The API cannot sort by ``'stars'``, so that order scans at most
+        ``scan_limit`` repositories and keeps the most starred.
+        """
+        if sort == 'stars':
+            stars = lambda repo: repo.get('stargazers_count', 0)
+            repos = [repo async for repo in self.iter_repos(username, limit=scan_limit)]
+            if limit is not None:
+                return heapq.nlargest(limit, repos, key=stars)
+            return sorted(repos, key=stars, reverse=True)
+        return [repo async for repo in self.iter_repos(username, sort, limit)]
+        
+    async def get_events(self, username: str) -> List[Dict]:
+        """Fetch the most recent page of public events"""
+        events, _ = await self._get(f"/users/{username}/events", {'per_page': 100})
+        return events
+        
+    async def _get_events_or_empty(self, username: str) -> List[Dict]:
+        """Recent public events, or none if they are unavailable"""
+        try:
+            return await self.get_events(username)
+        except Exception:
+            return []
+        
+    async def get_snapshot(self, username: str, events: bool = False) -> GitHubSnapshot:
+        """Fetch the user, the top repositories and (optionally) recent events concurrently"""
+        requests = [
+            self.get_user(username),
+            self.get_repos(username, self.repo_sort, self.repo_limit, self.repo_scan_limit)
+        ]
+        if events:
+            requests.append(self._get_events_or_empty(username))
+        responses = await asyncio.gather(*requests)
+        return GitHubSnapshot(
+            username=username,
+            user=responses[0],
+            repos=responses[1],
+            events=responses[2] if events else []
+        )
+
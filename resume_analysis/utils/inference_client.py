@@ -0,0 +1,130 @@
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+import asyncio
+import random
+from resume_analysis.utils.exceptions import LLMError
+from resume_analysis.utils import tracing
+from resume_analysis.utils.rate_limiter import HF_INFERENCE, RateLimiter, get_rate_limiters
+
+if TYPE_CHECKING:
+    import aiohttp
+
+# Successful health checks, cached once per process per (endpoint, token)
+_healthy_endpoints: set = set()
+
+class InferenceClient:
+    """Async client for a HuggingFace-style inference endpoint over a pooled keep-alive session"""
+    
+    RETRY_STATUSES = (429, 503)
+    
+    def __init__(
+        self,
+        api_url: str,
+        token: Optional[str] = None,
+        max_connections: int = 10,
+        timeout: float = 10,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
+        self.api_url = api_url
+        self.token = token
+        self.headers = {"Authorization": f"Bearer {token}"} if token else {}
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.rate_limiter = rate_limiter or get_rate_limiters().get(HF_INFERENCE)
+        self._session: Optional['aiohttp.ClientSession'] = None
+        
+    async def __aenter__(self) -> 'InferenceClient':
+        return self
+        
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+        
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        """Create the shared session on first use inside the running loop"""
+        import aiohttp
+        
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=60)
+            )
+        return self._session
+        
+    async def close(self) -> None:
+        """Close the pooled session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter (``Retry-After`` is enforced by the rate limiter)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        
+    async def _post(self, payload: Dict, timeout: float) -> Tuple[int, Any, Dict[str, str]]:
+        """POST one payload, returning status, decoded body and headers"""
+        import aiohttp
+        
+        async with self.rate_limiter:
+            response = await self._get_session().post(
+                self.api_url,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=timeout)
+            )
+        async with response:
+            self.rate_limiter.update_from_headers(response.headers)
+            try:
+                body = await response.json(content_type=None)
+            except ValueError:
+                body = await response.text()
+            return response.status, body, dict(response.headers)
+            
+    async def generate(self, inputs: str, parameters: Optional[Dict] = None,
+                       timeout: Optional[float] = None) -> Any:
+        """Run one generation request, retrying 429/503 and network errors with backoff"""
+        import aiohttp
+        
+        payload = {"inputs": inputs}
+        if parameters:
+            payload["parameters"] = parameters
+            
+        with tracing.span('llm.request', url=self.api_url) as span:
+            for attempt in range(self.max_retries):
+                last_attempt = attempt == self.max_retries - 1
+                if attempt:
+                    tracing.count('llm_retries_total')
+                span.set(attempts=attempt + 1)
+                try:
+                    status, body, _ = await self._post(payload, timeout or self.timeout)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    tracing.count('llm_requests_total', status=type(e).__name__)
+                    if last_attempt:
+                        raise LLMError(f"LLM request failed: {str(e)}")
+                    await asyncio.sleep(self._backoff(attempt))
+                    continue
+                    
+                tracing.count('llm_requests_total', status=status)
+                span.set(status=status)
+                if status == 200:
+                    return body
+                if status not in self.RETRY_STATUSES or last_attempt:
+                    raise LLMError(f"Failed to get valid response ({status}): {body}")
+                await asyncio.sleep(self._backoff(attempt))
+                
+            raise LLMError("LLM request failed: retries exhausted")
+        
+    async def health_check(self) -> bool:
+        """Check the endpoint once per process; 503 counts as healthy (model loading)"""
+        key = (self.api_url, self.token)
+        if key in _healthy_endpoints:
+            return True
+            
+        status, body, _ = await self._post({"inputs": "Test"}, self.timeout)
+        if status not in (200, 503):
+            raise LLMError(f"API test failed with status code: {status}")
+        _healthy_endpoints.add(key)
+        return True
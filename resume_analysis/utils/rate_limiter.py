@@ -1,22 +1,126 @@
-from datetime import datetime, timedelta
-from collections import deque
+from typing import Dict, Mapping, Optional, Tuple
+import asyncio
+import time
+
+GITHUB_CORE = 'github_core'
+GITHUB_SEARCH = 'github_search'
+HF_INFERENCE = 'hf_inference'
 
 class RateLimiter:
-    def __init__(self, max_requests: int = 100, time_window: int = 3600):
+    """
+    Token bucket refilled at ``max_requests`` per ``time_window`` seconds.
+
+    ``async with limiter:`` waits for a token instead of rejecting. Waiters
+    reserve tokens in arrival order (the bucket may go into debt), so no lock
+    is needed and concurrent callers are spaced out evenly. Upstream rate-limit
+    headers can shrink the bucket or pause it until the reported reset time.
+    """
+    
+    def __init__(self, max_requests: int = 100, time_window: int = 3600, burst: Optional[int] = None):
+        self.configure(max_requests, time_window, burst)
+        self.tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self.waits = 0
+        
+    def configure(self, max_requests: int, time_window: int, burst: Optional[int] = None) -> None:
+        """Change the refill rate and bucket size"""
         self.max_requests = max_requests
         self.time_window = time_window  # in seconds
-        self.requests = deque()
-
-    def can_make_request(self) -> bool:
-        now = datetime.now()
+        self.rate = max_requests / time_window  # tokens per second
+        self.capacity = max(1, burst or max_requests)
         
-        # Remove old requests
-        while self.requests and (now - self.requests[0]) > timedelta(seconds=self.time_window):
-            self.requests.popleft()
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
         
-        # Check if we can make a new request
-        if len(self.requests) < self.max_requests:
-            self.requests.append(now)
+    def can_make_request(self) -> bool:
+        """Take a token if one is available right now, without waiting"""
+        now = time.monotonic()
+        self._refill(now)
+        if now >= self._blocked_until and self.tokens >= 1:
+            self.tokens -= 1
             return True
+        return False
+        
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it"""
+        now = time.monotonic()
+        self._refill(now)
+        self.tokens -= 1
+        wait = max(-self.tokens / self.rate if self.tokens < 0 else 0.0, self._blocked_until - now)
+        if wait <= 0:
+            return
+        self.waits += 1
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            self.tokens += 1  # Give back the reservation
+            raise
             
-        return False 
\ No newline at end of file
+    def release(self) -> None:
+        """Give back a token for a request the upstream did not count (e.g. a 304)"""
+        self.tokens = min(self.capacity, self.tokens + 1)
+        
+    async def __aenter__(self) -> 'RateLimiter':
+        await self.acquire()
+        return self
+        
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+        
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Adapt to ``X-RateLimit-Remaining``/``X-RateLimit-Reset`` and ``Retry-After``"""
+        now = time.monotonic()
+        self._refill(now)
+        try:
+            remaining = headers.get('X-RateLimit-Remaining')
+            if remaining is not None:
+                self.tokens = min(self.tokens, float(remaining))
+                reset = headers.get('X-RateLimit-Reset')
+                if float(remaining) <= 0 and reset is not None:
+                    self._blocked_until = max(self._blocked_until, now + float(reset) - time.time())
+                    
+            retry_after = headers.get('Retry-After')
+            if retry_after is not None:
+                self._blocked_until = max(self._blocked_until, now + float(retry_after))
+        except ValueError:
+            pass  # Malformed header; keep the local estimate
+
+class RateLimiterRegistry:
+    """Named token buckets, one per upstream"""
+    
+    def __init__(self, limits: Optional[Dict[str, Tuple[int, int]]] = None):
+        self.limits = dict(limits or {})
+        self._limiters: Dict[str, RateLimiter] = {}
+        
+    def configure(self, limits: Dict[str, Tuple[int, int]]) -> None:
+        """Apply ``{name: (max_requests, time_window)}``, updating existing buckets in place"""
+        self.limits.update(limits)
+        for name, (max_requests, time_window) in limits.items():
+            if name in self._limiters:
+                self._limiters[name].configure(max_requests, time_window)
+                
+    def get(self, name: str) -> RateLimiter:
+        if name not in self._limiters:
+            self._limiters[name] = RateLimiter(*self.limits.get(name, (60, 60)))
+        return self._limiters[name]
+
+def _limits_from_config(config) -> Dict[str, Tuple[int, int]]:
+    return {
+        GITHUB_CORE: (config.GITHUB_REQUESTS_PER_HOUR if config.GITHUB_TOKEN else 60, 3600),
+        GITHUB_SEARCH: (config.GITHUB_SEARCH_REQUESTS_PER_MINUTE, 60),
+        HF_INFERENCE: (config.MAX_REQUESTS_PER_MINUTE, 60),
+    }
+
+_registry = RateLimiterRegistry({
+    GITHUB_CORE: (60, 3600),  # Unauthenticated GitHub core limit
+    GITHUB_SEARCH: (10, 60),
+    HF_INFERENCE: (60, 60),
+})
+
+def get_rate_limiters(config=None) -> RateLimiterRegistry:
+    """Process-wide buckets shared by every client; ``config`` updates their limits"""
+    if config is not None:
+        _registry.configure(_limits_from_config(config))
+    return _registry
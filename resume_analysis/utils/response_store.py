@@ -0,0 +1,89 @@
+from typing import Any, Dict, Optional
+import json
+import os
+import time
+from resume_analysis.utils.cache import Cache, DiskCache, TieredCache, content_key
+
+class ResponseStore:
+    """
+    Persistent HTTP responses keyed by URL, kept with their validators.
+
+    An entry younger than ``stale_after`` seconds is served without a request.
+    Older entries are revalidated with ``If-None-Match``/``If-Modified-Since``
+    and kept for ``retention`` seconds, so a 304 can reuse the stored body.
+    """
+    
+    def __init__(
+        self,
+        stale_after: float = 3600,
+        retention: float = 30 * 24 * 3600,
+        path: Optional[str] = None,
+        max_entries: int = 1024
+    ):
+        self.stale_after = stale_after
+        self.retention = max(retention, stale_after)
+        self._cache = TieredCache(
+            Cache(ttl=self.retention, max_entries=max_entries),
+            DiskCache(path, ttl=self.retention) if path else None
+        )
+        self.fresh_hits = 0
+        self.revalidated = 0
+        self.fetched = 0
+        
+    def _key(self, url: str, params: Optional[Dict]) -> str:
+        return content_key('response', url, json.dumps(params, sort_keys=True))
+        
+    async def get(self, url: str, params: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
+        """Stored entry (``data``, ``headers``, ``etag``, ``last_modified``, ``fetched_at``)"""
+        return await self._cache.aget(self._key(url, params))
+        
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        fresh = time.time() - entry.get('fetched_at', 0) < self.stale_after
+        if fresh:
+            self.fresh_hits += 1
+        return fresh
+        
+    def conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Validators to send when revalidating a stale entry"""
+        headers = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+        
+    def save(self, url: str, params: Optional[Dict], data: Any, headers: Dict[str, str],
+             etag: Optional[str], last_modified: Optional[str]) -> None:
+        """Store a fresh 200 response"""
+        self.fetched += 1
+        self._cache.set(self._key(url, params), {
+            'data': data,
+            'headers': headers,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': time.time()
+        }, self.retention)
+        
+    def refresh(self, url: str, params: Optional[Dict], entry: Dict[str, Any]) -> None:
+        """Restart the staleness window of an entry the server confirmed with a 304"""
+        self.revalidated += 1
+        self._cache.set(self._key(url, params), {**entry, 'fetched_at': time.time()}, self.retention)
+        
+    def stats(self) -> Dict[str, int]:
+        return {'fresh_hits': self.fresh_hits, 'revalidated': self.revalidated, 'fetched': self.fetched}
+        
+    def close(self) -> None:
+        self._cache.close()
+
+def create_response_store(config) -> ResponseStore:
+    """GitHub response store described by ``Config`` (in memory only when CACHE_DIR is empty)"""
+    path = None
+    if config.CACHE_DIR:
+        path = os.path.join(os.path.expanduser(config.CACHE_DIR), "github.sqlite3")
+    return ResponseStore(
+        stale_after=config.GITHUB_STALE_AFTER,
+        retention=config.CACHE_CONTENT_TTL,
+        path=path,
+        max_entries=config.CACHE_MAX_ENTRIES
+    )
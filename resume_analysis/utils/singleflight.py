@@ -0,0 +1,64 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable
+import asyncio
+
+class _Call:
+    """One shared execution and the number of callers still awaiting it"""
+    
+    __slots__ = ('task', 'waiters')
+    
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+class SingleFlight:
+    """
+    Share one in-flight call among concurrent callers with the same key.
+
+    The first caller starts ``factory`` in its own task; every caller,
+    including the first, awaits that task through a shield, so cancelling
+    any one caller never cancels the others. The task itself is cancelled
+    only when every caller has gone. Keys are forgotten as soon as the call
+    completes, so nothing is cached. ``calls`` counts executions and
+    ``coalesced`` the calls saved.
+    """
+    
+    def __init__(self):
+        self._inflight: Dict[Hashable, _Call] = {}
+        self.calls = 0
+        self.coalesced = 0
+        
+    def __len__(self) -> int:
+        return len(self._inflight)
+        
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        call = self._inflight.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(factory()))
+            call.task.add_done_callback(lambda task: self._done(key, call))
+            self._inflight[key] = call
+            self.calls += 1
+        else:
+            self.coalesced += 1
+            
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Every caller was cancelled; later callers start afresh
+                self._forget(key, call)
+                call.task.cancel()
+                
+    def _done(self, key: Hashable, call: _Call) -> None:
+        self._forget(key, call)
+        # Mark failures as retrieved even when every caller had gone
+        if not call.task.cancelled():
+            call.task.exception()
+            
+    def _forget(self, key: Hashable, call: _Call) -> None:
+        if self._inflight.get(key) is call:
+            del self._inflight[key]
+            
+    def stats(self) -> Dict[str, int]:
+        return {'calls': self.calls, 'coalesced': self.coalesced, 'inflight': len(self._inflight)}
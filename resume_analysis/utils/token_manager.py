@@ -1,6 +1,9 @@
 from datetime import datetime, timedelta
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
 class TokenManager:
     @staticmethod
     def check_token_expiry(token: str) -> bool:
@@ -14,5 +17,5 @@ class TokenManager:
         token = os.getenv('HUGGINGFACE_TOKEN')
         if TokenManager.check_token_expiry(token):
             # Notify admin to rotate token
-            print("WARNING: Token rotation recommended")
+            logger.warning("Token rotation recommended")
         return token 
\ No newline at end of file
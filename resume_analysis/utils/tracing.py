@@ -0,0 +1,275 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from contextvars import ContextVar
+import asyncio
+import functools
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+_current_span: ContextVar[Optional['Span']] = ContextVar('resume_analysis_span', default=None)
+
+# Upper bounds (seconds) of the span latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+METRIC_PREFIX = 'resume_analysis_'
+
+class Span:
+    """
+    Timed unit of work within a trace.
+    
+    The first span of a task (or request) starts a new trace; spans opened
+    inside it, including in tasks it spawns, share its ``trace_id``.
+    """
+    
+    __slots__ = ('name', 'trace_id', 'span_id', 'parent_id', 'attributes',
+                 'start', 'duration', 'status', '_started', '_token')
+    
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        parent = _current_span.get()
+        self.name = name
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        self.parent_id = parent.span_id if parent else None
+        self.span_id = uuid.uuid4().hex[:16]
+        self.attributes = attributes
+        self.start = 0.0
+        self.duration = 0.0
+        self.status = 'ok'
+    
+    def set(self, **attributes) -> None:
+        self.attributes.update(attributes)
+    
+    def __enter__(self) -> 'Span':
+        self._token = _current_span.set(self)
+        self.start = time.time()
+        self._started = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.duration = time.perf_counter() - self._started
+        _current_span.reset(self._token)
+        if exc_type is asyncio.CancelledError:
+            self.status = 'cancelled'
+        elif exc_type is not None:
+            self.status = 'error'
+            self.attributes['error'] = f"{exc_type.__name__}: {exc}"
+        _tracer.finish(self)
+        return False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'start': round(self.start, 6),
+            'duration': round(self.duration, 6),
+            'status': self.status,
+            'attributes': self.attributes
+        }
+
+class _NoopSpan:
+    """Returned by ``span`` while tracing is disabled"""
+    
+    __slots__ = ()
+    trace_id = None
+    
+    def set(self, **attributes) -> None:
+        pass
+    
+    def __enter__(self) -> '_NoopSpan':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+_NOOP_SPAN = _NoopSpan()
+
+class JsonLinesExporter:
+    """Appends every finished span as one JSON object per line"""
+    
+    def __init__(self, path: str):
+        path = os.path.expanduser(path)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', buffering=1)
+    
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+    
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+def _labels_text(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ''
+    escape = lambda value: str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    pairs = ','.join(f'{key}="{escape(value)}"' for key, value in labels)
+    return '{' + pairs + '}'
+
+class Metrics:
+    """Counters and span latency histograms, rendered in the Prometheus text format"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+        # (span, status) -> [per-bucket counts..., count, sum]
+        self.latencies: Dict[Tuple[str, str], List[float]] = {}
+    
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+    
+    def observe(self, span: Span) -> None:
+        key = (span.name, span.status)
+        with self._lock:
+            series = self.latencies.get(key)
+            if series is None:
+                series = self.latencies[key] = [0] * (len(LATENCY_BUCKETS) + 2)
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if span.duration <= bound:
+                    series[i] += 1
+            series[-2] += 1
+            series[-1] += span.duration
+    
+    def reset(self) -> None:
+        with self._lock:
+            self.counters.clear()
+            self.latencies.clear()
+    
+    def render(self, gauges: Optional[Dict[str, float]] = None) -> str:
+        """Prometheus exposition text; ``gauges`` are point-in-time values read by the caller"""
+        lines = []
+        with self._lock:
+            counters = sorted(self.counters.items())
+            latencies = sorted((key, list(series)) for key, series in self.latencies.items())
+        
+        seen = set()
+        for (name, labels), value in counters:
+            metric = f"{METRIC_PREFIX}{name}"
+            if metric not in seen:
+                seen.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}{_labels_text(labels)} {value:g}")
+        
+        if latencies:
+            metric = f"{METRIC_PREFIX}span_duration_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            for (name, status), series in latencies:
+                labels = (('span', name), ('status', status))
+                for bound, count in zip(LATENCY_BUCKETS, series):
+                    lines.append(f"{metric}_bucket{_labels_text(labels + (('le', f'{bound:g}'),))} {count}")
+                lines.append(f"{metric}_bucket{_labels_text(labels + (('le', '+Inf'),))} {series[-2]}")
+                lines.append(f"{metric}_count{_labels_text(labels)} {series[-2]}")
+                lines.append(f"{metric}_sum{_labels_text(labels)} {series[-1]:.6f}")
+        
+        for name, value in sorted((gauges or {}).items()):
+            metric = f"{METRIC_PREFIX}{name}"
+            lines.append(f"# TYPE {metric} gauge")
+            lines.append(f"{metric} {value:g}")
+        return "\n".join(lines) + "\n"
+
+class Tracer:
+    """Process-wide switch, metrics and span exporter"""
+    
+    def __init__(self):
+        self.enabled = False
+        self.metrics = Metrics()
+        self.exporter: Optional[JsonLinesExporter] = None
+    
+    def configure(self, enabled: bool = True, path: Optional[str] = None) -> None:
+        """Turn tracing on or off; ``path`` exports finished spans as JSON lines"""
+        path = os.path.expanduser(path) if path else None
+        if self.exporter is not None and self.exporter.path != path:
+            self.exporter.close()
+            self.exporter = None
+        if enabled and path and self.exporter is None:
+            self.exporter = JsonLinesExporter(path)
+        self.enabled = enabled
+    
+    def finish(self, span: Span) -> None:
+        self.metrics.observe(span)
+        if self.exporter is not None:
+            try:
+                self.exporter.export(span)
+            except (OSError, ValueError) as e:
+                logger.warning("Failed to export span %s: %s", span.name, e)
+    
+    def close(self) -> None:
+        if self.exporter is not None:
+            self.exporter.close()
+            self.exporter = None
+
+_tracer = Tracer()
+
+def configure(enabled: bool = True, path: Optional[str] = None) -> None:
+    _tracer.configure(enabled, path)
+
+def configure_from_config(config) -> None:
+    """Apply ``TRACING_ENABLED`` and ``TRACE_FILE`` from ``Config``"""
+    _tracer.configure(config.TRACING_ENABLED, config.TRACE_FILE or None)
+
+def is_enabled() -> bool:
+    return _tracer.enabled
+
+def span(name: str, **attributes):
+    """Context manager timing ``name``; a shared no-op while tracing is disabled"""
+    if not _tracer.enabled:
+        return _NOOP_SPAN
+    return Span(name, attributes)
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Decorator running a sync or async function inside a span"""
+    def decorate(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not _tracer.enabled:
+                    return await func(*args, **kwargs)
+                with Span(span_name, {}):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _tracer.enabled:
+                return func(*args, **kwargs)
+            with Span(span_name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+def count(name: str, value: float = 1, **labels) -> None:
+    """Increment counter ``name`` (e.g. upstream status codes, retries) while tracing is enabled"""
+    if _tracer.enabled:
+        _tracer.metrics.inc(name, value, **labels)
+
+def current_trace_id() -> Optional[str]:
+    current = _current_span.get()
+    return current.trace_id if current else None
+
+def render_metrics(gauges: Optional[Dict[str, float]] = None) -> str:
+    return _tracer.metrics.render(gauges)
+
+def reset_metrics() -> None:
+    _tracer.metrics.reset()
+
+class TraceIdFilter(logging.Filter):
+    """Adds ``trace_id`` to log records ('-' outside a trace) for use in formats"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.trace_id = current_trace_id() or '-'
+        return True
@@ -0,0 +1,81 @@
+import asyncio
+import threading
+
+from resume_analysis.utils.cache import Cache, DiskCache, TieredCache, content_key
+
+def test_sweep_is_not_blocked_by_long_ttl_entries():
+    cache = Cache(ttl=3600)
+    cache.set('content', 'kept', ttl=30 * 24 * 3600)
+    for i in range(200):
+        cache.set(f"short:{i}", i, ttl=0)
+        
+    assert cache.get('content') == 'kept'
+    assert len(cache) <= 2
+    assert cache.expirations >= 199
+
+def test_expiry_heap_stays_bounded_under_overwrites():
+    cache = Cache(ttl=3600)
+    for i in range(1000):
+        cache.set('key', i)
+    assert len(cache._expiry) <= 2 * len(cache) + Cache.SWEEP_BATCH + 1
+
+def test_sizes_count_nested_values():
+    cache = Cache(max_bytes=150_000)
+    cache.set('a', {'text': 'x' * 100_000})
+    assert cache.bytes > 100_000
+    
+    cache.set('b', {'text': 'y' * 100_000})
+    assert cache.get('a') is None
+    assert cache.evictions == 1
+
+def test_disk_tier_survives_restart(tmp_path):
+    path = str(tmp_path / 'cache.sqlite3')
+    first = TieredCache(Cache(), DiskCache(path))
+    first.set('key', {'value': [1, 2, 3]}, ttl=60)
+    first.close()
+    
+    second = TieredCache(Cache(), DiskCache(path))
+    assert second.get('key') == {'value': [1, 2, 3]}
+    assert second.disk_hits == 1
+    second.close()
+
+def test_disk_reads_run_off_the_event_loop(tmp_path):
+    disk = DiskCache(str(tmp_path / 'cache.sqlite3'))
+    cache = TieredCache(Cache(), disk)
+    threads = []
+    read = disk._get
+    
+    def recording_get(key):
+        threads.append(threading.current_thread().name)
+        return read(key)
+    disk._get = recording_get
+    
+    async def main():
+        cache.set('key', 'value')
+        cache.memory.clear()
+        return await cache.aget('key')
+        
+    assert asyncio.run(main()) == 'value'
+    assert threads and all(name.startswith('disk-cache') for name in threads)
+    cache.close()
+
+def test_get_or_compute_runs_factory_once():
+    cache = Cache()
+    calls = 0
+    
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 'value'
+        
+    async def main():
+        return await asyncio.gather(*(cache.get_or_compute('key', factory) for _ in range(3)))
+        
+    assert asyncio.run(main()) == ['value'] * 3
+    assert calls == 1
+    assert cache.get('key') == 'value'
+
+def test_content_key_is_stable_and_unambiguous():
+    assert content_key('ns', b'ab', 'c') == content_key('ns', b'ab', 'c')
+    assert content_key('ns', 'ab', 'c') != content_key('ns', 'a', 'bc')
@@ -0,0 +1,55 @@
+import random
+
+from resume_analysis.models.candidate_index import CandidateIndex
+from resume_analysis.models.hackathon_matcher import HackathonMatcher
+
+TRACKS = list(HackathonMatcher.TRACKS)
+
+def _analysis(rng):
+    # Scores stay below 8 so no pair is clipped at 1 and the rankings have no ties
+    return {
+        'enhanced_scores': {track: {'score': rng.uniform(0, 8)} for track in TRACKS},
+        'llm_analysis': {
+            'technical_analysis': {'skill_depth_score': rng.uniform(0, 8)},
+            'project_evaluation': {'project_score': rng.uniform(0, 8)}
+        }
+    }
+
+def _hackathons():
+    return [
+        {'name': f"{track}-{difficulty}", 'primary_track': track, 'difficulty': difficulty}
+        for track in TRACKS
+        for difficulty in ('Beginner', 'Intermediate', 'Advanced', None)
+    ]
+
+def _as_pairs(matches, key):
+    return [(m[key], m['compatibility_score']) for m in matches]
+
+def test_top_for_hackathon_agrees_with_match_batch():
+    rng = random.Random(3)
+    analyses = [_analysis(rng) for _ in range(200)]
+    hackathons = _hackathons()
+    index = CandidateIndex()
+    index.add_many(dict(enumerate(analyses)))
+    
+    expected = HackathonMatcher().match_batch(analyses, hackathons, top_k=10, per='hackathon')
+    for hackathon, matches in zip(hackathons, expected):
+        assert _as_pairs(index.top_for_hackathon(hackathon, n=10), 'candidate_id') == \
+            _as_pairs(matches, 'candidate_index')
+
+def test_incremental_updates_match_bulk_load():
+    rng = random.Random(5)
+    analyses = {i: _analysis(rng) for i in range(100)}
+    bulk = CandidateIndex()
+    bulk.add_many(analyses)
+    
+    incremental = CandidateIndex()
+    for candidate_id, analysis in analyses.items():
+        incremental.add(candidate_id, _analysis(rng))  # Replaced below
+        incremental.add(candidate_id, analysis)
+    incremental.add('gone', _analysis(rng))
+    incremental.remove('gone')
+    
+    assert len(incremental) == len(bulk) == 100
+    for hackathon in _hackathons():
+        assert incremental.top_for_hackathon(hackathon, n=20) == bulk.top_for_hackathon(hackathon, n=20)
@@ -0,0 +1,51 @@
+import random
+
+from resume_analysis.models.hackathon_matcher import HackathonMatcher
+
+TRACKS = list(HackathonMatcher.TRACKS)
+
+def _analysis(rng):
+    return {
+        'enhanced_scores': {track: {'score': rng.uniform(0, 10)} for track in TRACKS},
+        'llm_analysis': {
+            'technical_analysis': {'skill_depth_score': rng.uniform(0, 10)},
+            'project_evaluation': {'project_score': rng.uniform(0, 10)}
+        }
+    }
+
+def _hackathons(rng, n):
+    return [{
+        'name': f"hack{i}",
+        'primary_track': rng.choice(TRACKS + ['unknown', '']),
+        'difficulty': rng.choice(['Beginner', 'Intermediate', 'Advanced', None])
+    } for i in range(n)]
+
+def test_match_batch_agrees_with_match_hackathons():
+    rng = random.Random(7)
+    matcher = HackathonMatcher()
+    analyses = [_analysis(rng) for _ in range(40)]
+    hackathons = _hackathons(rng, 25)
+    
+    batch = matcher.match_batch(analyses, hackathons, top_k=None)
+    for analysis, matches in zip(analyses, batch):
+        expected = matcher.match_hackathons(analysis, hackathons)
+        assert sorted((m['hackathon']['name'], m['compatibility_score']) for m in matches) == \
+            sorted((m['hackathon']['name'], m['compatibility_score']) for m in expected)
+        scores = [m['compatibility_score'] for m in matches]
+        assert scores == sorted(scores, reverse=True)
+
+def test_top_k_per_hackathon_is_a_prefix_of_the_full_ranking():
+    rng = random.Random(11)
+    matcher = HackathonMatcher()
+    analyses = [_analysis(rng) for _ in range(60)]
+    hackathons = _hackathons(rng, 10)
+    
+    full = matcher.match_batch(analyses, hackathons, top_k=None, per='hackathon')
+    top = matcher.match_batch(analyses, hackathons, top_k=5, per='hackathon')
+    for ranked, best in zip(full, top):
+        assert best == ranked[:5]
+
+def test_empty_inputs():
+    matcher = HackathonMatcher()
+    assert matcher.match_batch([], _hackathons(random.Random(1), 3)) == []
+    assert matcher.match_batch([_analysis(random.Random(1))], []) == [[]]
@@ -0,0 +1,120 @@
+import asyncio
+import json
+
+from resume_analysis.config import Config
+from resume_analysis.models.llm_analyzer import LLMAnalyzer
+from resume_analysis.models.llm_backends import LLMBackend
+from resume_analysis.utils.cache import Cache
+from resume_analysis.utils.exceptions import LLMError
+
+SECTIONS = {
+    'technical_depth': {'skill_depth_score': 9, 'project_score': 8},
+    'soft_skills': {'score': 7},
+    'project_analysis': {'project_score': 8},
+    'growth_potential': {'score': 6}
+}
+
+class FakeBackend(LLMBackend):
+    name = 'fake'
+    model_id = 'fake'
+    
+    def __init__(self):
+        self.failing = False
+        self.calls = 0
+        self.max_new_tokens_seen = []
+        
+    async def generate(self, prompt, max_new_tokens=None):
+        self.calls += 1
+        self.max_new_tokens_seen.append(max_new_tokens)
+        if self.failing:
+            raise LLMError("429 Too Many Requests")
+        return json.dumps(SECTIONS)
+
+def _analyzer(backend: FakeBackend) -> LLMAnalyzer:
+    return LLMAnalyzer(Config(CACHE_DIR=''), backend=backend, cache=Cache())
+
+def test_failed_calls_are_not_cached():
+    backend = FakeBackend()
+    analyzer = _analyzer(backend)
+    
+    backend.failing = True
+    degraded = asyncio.run(analyzer.analyze_text("Built a search engine in Python"))
+    assert degraded['technical_depth']['skill_depth_score'] == 5.0
+    
+    backend.failing = False
+    recovered = asyncio.run(analyzer.analyze_text("Built a search engine in Python"))
+    assert recovered['technical_depth']['skill_depth_score'] == 9.0
+
+def test_complete_results_are_cached():
+    backend = FakeBackend()
+    analyzer = _analyzer(backend)
+    
+    first = asyncio.run(analyzer.analyze_text("Built a search engine in Python"))
+    calls = backend.calls
+    second = asyncio.run(analyzer.analyze_text("Built a search engine in Python"))
+    assert second == first
+    assert backend.calls == calls
+
+def test_chunks_cover_text_within_budget():
+    analyzer = _analyzer(FakeBackend())
+    # Size by the word estimate so the budget check does not depend on transformers
+    analyzer._get_tokenizer = lambda: None
+    words = [f"word{i}" for i in range(2000)]
+    chunks = analyzer._chunk_text(' '.join(words), max_tokens=100, overlap=10)
+    
+    assert len(chunks) > 1
+    assert all(sum(len(w) // 4 + 1 for w in chunk.split()) <= 100 for chunk in chunks)
+    covered = set(word for chunk in chunks for word in chunk.split())
+    assert covered == set(words)
+
+def test_chunks_leave_room_for_the_prompt():
+    backend = FakeBackend()
+    backend.max_length = 800
+    analyzer = _analyzer(backend)
+    analyzer._get_tokenizer = lambda: None
+    count = lambda text: sum(tokens for _, _, tokens in analyzer._token_spans(text))
+    words = [f"word{i}" for i in range(2000)]
+    chunks = analyzer._chunk_text(' '.join(words))
+    
+    assert analyzer._chunk_budget() < analyzer.config.LLM_CHUNK_TOKENS
+    for chunk in chunks:
+        for name, prompt in analyzer.prompts.items():
+            limit = backend.input_limit(analyzer._max_new_tokens(name))
+            assert count(prompt.format(text=chunk)) <= limit
+
+def test_combined_prompt_needs_no_fallback():
+    backend = FakeBackend()
+    analyzer = _analyzer(backend)
+    result = asyncio.run(analyzer.analyze_text("Built a search engine in Python"))
+    
+    assert backend.calls == 1
+    assert backend.max_new_tokens_seen == [analyzer.config.LLM_COMBINED_MAX_NEW_TOKENS]
+    assert result['growth_potential']['score'] == 6.0
+
+def test_combined_completion_fits_a_full_response():
+    analyzer = _analyzer(FakeBackend())
+    # Every section with empty lists: the smallest well-formed combined response
+    response = json.dumps(analyzer.CATEGORY_DEFAULTS)
+    # GPT-2 spends about one token per 2.5 characters of JSON
+    assert len(response) / 2.5 < analyzer.config.LLM_COMBINED_MAX_NEW_TOKENS
+
+def test_only_changed_sources_reach_the_llm():
+    backend = FakeBackend()
+    prompts = []
+    generate = backend.generate
+    
+    async def recording(prompt, max_new_tokens=None):
+        prompts.append(prompt)
+        return await generate(prompt, max_new_tokens)
+        
+    backend.generate = recording
+    analyzer = _analyzer(backend)
+    
+    first = asyncio.run(analyzer.analyze_sources(["RESUME:\nBuilt a compiler", "GITHUB:\nrepo one"]))
+    assert len(prompts) == 2
+    
+    prompts.clear()
+    second = asyncio.run(analyzer.analyze_sources(["RESUME:\nBuilt a compiler", "GITHUB:\nrepo two"]))
+    assert len(prompts) == 1
+    assert "repo two" in prompts[0]
+    assert second == first
@@ -0,0 +1,47 @@
+import asyncio
+import threading
+
+from resume_analysis.models.llm_backends import LocalTransformersBackend
+from resume_analysis.utils.exceptions import LLMError
+
+def test_close_fails_queued_and_running_prompts():
+    backend = LocalTransformersBackend(max_batch_size=1, batch_wait=0)
+    started = threading.Event()
+    release = threading.Event()
+    
+    def generate_sync(prompts, max_new_tokens):
+        started.set()
+        release.wait(5)
+        return ['late'] * len(prompts)
+        
+    backend._generate_sync = generate_sync
+    
+    async def run():
+        running = asyncio.ensure_future(backend.generate('first'))
+        queued = asyncio.ensure_future(backend.generate('second'))
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        await backend.close()
+        release.set()
+        return await asyncio.wait_for(
+            asyncio.gather(running, queued, return_exceptions=True), timeout=1
+        )
+        
+    results = asyncio.run(run())
+    assert all(isinstance(result, LLMError) for result in results)
+
+def test_batches_split_by_completion_length():
+    backend = LocalTransformersBackend(batch_wait=0.05)
+    calls = []
+    backend._generate_sync = lambda prompts, n: calls.append((prompts, n)) or [f"{p}:{n}" for p in prompts]
+    
+    async def run():
+        try:
+            return await asyncio.gather(
+                backend.generate('a'), backend.generate('b', 300), backend.generate('c')
+            )
+        finally:
+            await backend.close()
+            
+    assert asyncio.run(run()) == ['a:100', 'b:300', 'c:100']
+    assert sorted(calls) == [(['a', 'c'], 100), (['b'], 300)]
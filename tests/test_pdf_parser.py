@@ -0,0 +1,72 @@
+import asyncio
+import mmap
+
+from resume_analysis.parsers.pdf_parser import aiter_pdf_pages, iter_pdf_pages
+
+FONT = b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+
+def _stream(content: bytes, extra: bytes = b"") -> bytes:
+    return b"<< " + extra + b"/Length %d >>\nstream\n" % len(content) + content + b"\nendstream"
+
+def _pdf(page_texts, form_xobject: bool = False) -> bytes:
+    """
+    Minimal PDF with one text page per entry; with ``form_xobject`` the text is
+    drawn by a form XObject that holds the font, not by the page itself.
+    """
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, FONT]
+    kids = []
+    for text in page_texts:
+        content = b"BT /F1 12 Tf 72 720 Td (" + text.encode() + b") Tj ET"
+        if form_xobject:
+            objects.append(_stream(
+                content,
+                b"/Type /XObject /Subtype /Form /BBox [0 0 612 792] /Resources << /Font << /F1 3 0 R >> >> "
+            ))
+            resources = b"<< /XObject << /Fm0 %d 0 R >> >>" % len(objects)
+            content = b"/Fm0 Do"
+        else:
+            resources = b"<< /Font << /F1 3 0 R >> >>"
+        objects.append(_stream(content))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources " + resources +
+            b" /Contents %d 0 R >>" % len(objects)
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [" + b" ".join(kids) + b"] /Count %d >>" % len(kids)
+    
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+def test_text_in_form_xobjects_is_extracted():
+    pages = list(iter_pdf_pages(_pdf(["Hello from a form xobject"], form_xobject=True)))
+    assert pages == ["Hello from a form xobject"]
+
+def test_pages_without_fonts_are_skipped():
+    pdf = _pdf(["Scanned"]).replace(b"/Resources << /Font << /F1 3 0 R >> >>", b"/Resources << >>")
+    assert list(iter_pdf_pages(pdf)) == ['']
+
+def test_mmap_source_across_many_tasks(tmp_path):
+    texts = [f"Page {i}" for i in range(80)]
+    path = tmp_path / 'long.pdf'
+    path.write_bytes(_pdf(texts))
+    
+    async def read(stop=None):
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            pages = []
+            async for page in aiter_pdf_pages(mapped, max_pages=100, pages_per_task=2):
+                pages.append(page)
+                if len(pages) == stop:
+                    break
+            return pages
+            
+    assert asyncio.run(read()) == texts
+    # Stopping early waits for running ranges before the map is closed
+    assert asyncio.run(read(stop=3)) == texts[:3]
@@ -0,0 +1,64 @@
+import asyncio
+import time
+
+import pytest
+
+from resume_analysis.pipeline import Pipeline
+from resume_analysis.utils.exceptions import ResumeAnalysisError
+
+def test_independent_stages_run_concurrently():
+    async def slow(value):
+        await asyncio.sleep(0.1)
+        return value
+        
+    pipeline = (
+        Pipeline()
+        .add('a', lambda source: slow(source + 1), deps=['source'])
+        .add('b', lambda source: slow(source * 2), deps=['source'])
+        .add('total', lambda a, b: a + b, deps=['a', 'b'])
+    )
+    start = time.perf_counter()
+    result = asyncio.run(pipeline.run(source=3))
+    
+    assert result['total'] == 10
+    assert time.perf_counter() - start < 0.18
+    assert set(result.timings) == {'a', 'b', 'total'}
+    assert result.timings['total'] >= 0.1
+
+def test_unknown_dependency_is_rejected():
+    pipeline = Pipeline().add('a', lambda missing: missing, deps=['missing'])
+    with pytest.raises(ValueError):
+        asyncio.run(pipeline.run())
+
+def test_duplicate_stage_is_rejected():
+    pipeline = Pipeline().add('a', lambda: 1)
+    with pytest.raises(ValueError):
+        pipeline.add('a', lambda: 2)
+
+def test_failure_cancels_running_stages():
+    cancelled = []
+    
+    async def long_running():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+            
+    def broken():
+        raise KeyError('boom')
+        
+    pipeline = Pipeline().add('long', long_running).add('broken', broken)
+    with pytest.raises(ResumeAnalysisError, match="Stage 'broken' failed"):
+        asyncio.run(pipeline.run())
+    assert cancelled == [True]
+
+def test_cycles_cannot_be_built():
+    pipeline = Pipeline().add('a', lambda b: b, deps=['b'])
+    with pytest.raises(ValueError, match="before its dependents"):
+        pipeline.add('b', lambda a: a, deps=['a'])
+    with pytest.raises(ValueError, match="depends on itself"):
+        Pipeline().add('a', lambda a: a, deps=['a'])
+        
+    # 'b' stayed an input of 'a'
+    assert asyncio.run(pipeline.run(b=1))['a'] == 1
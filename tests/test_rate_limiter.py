@@ -0,0 +1,67 @@
+import asyncio
+import time
+
+from resume_analysis.utils.rate_limiter import RateLimiter, RateLimiterRegistry
+
+def test_burst_then_waits_at_refill_rate():
+    limiter = RateLimiter(max_requests=20, time_window=1, burst=2)
+    
+    async def take(n):
+        start = time.monotonic()
+        for _ in range(n):
+            await limiter.acquire()
+        return time.monotonic() - start
+        
+    elapsed = asyncio.run(take(4))
+    # Two tokens from the bucket, two more refilled at 20/s
+    assert 0.08 <= elapsed < 0.5
+    assert limiter.waits == 2
+
+def test_concurrent_waiters_reserve_in_order():
+    limiter = RateLimiter(max_requests=50, time_window=1, burst=1)
+    
+    async def run():
+        order = []
+        async def worker(i):
+            async with limiter:
+                order.append(i)
+        await asyncio.gather(*(worker(i) for i in range(5)))
+        return order
+        
+    assert asyncio.run(run()) == [0, 1, 2, 3, 4]
+
+def test_cancelled_waiter_gives_its_token_back():
+    limiter = RateLimiter(max_requests=1, time_window=10, burst=1)
+    
+    async def run():
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        
+    asyncio.run(run())
+    assert -0.1 < limiter.tokens < 0.1
+
+def test_headers_pause_the_bucket():
+    limiter = RateLimiter(max_requests=100, time_window=1)
+    limiter.update_from_headers({'Retry-After': '30'})
+    assert not limiter.can_make_request()
+    
+    limiter = RateLimiter(max_requests=100, time_window=1)
+    limiter.update_from_headers({'X-RateLimit-Remaining': 'oops'})
+    assert limiter.can_make_request()
+
+def test_release_returns_a_token():
+    limiter = RateLimiter(max_requests=1, time_window=3600)
+    assert limiter.can_make_request()
+    assert not limiter.can_make_request()
+    limiter.release()
+    assert limiter.can_make_request()
+
+def test_registry_reconfigures_buckets_in_place():
+    registry = RateLimiterRegistry({'api': (10, 60)})
+    limiter = registry.get('api')
+    registry.configure({'api': (120, 60)})
+    assert registry.get('api') is limiter
+    assert limiter.rate == 2
@@ -0,0 +1,74 @@
+import asyncio
+
+from aiohttp import web
+
+from resume_analysis.utils.github_client import GitHubClient
+from resume_analysis.utils.rate_limiter import RateLimiterRegistry
+from resume_analysis.utils.response_store import ResponseStore
+
+ETAG = '"v1"'
+
+def _app(statuses):
+    async def user(request):
+        if request.headers.get('If-None-Match') == ETAG:
+            statuses.append(304)
+            return web.Response(status=304, headers={'ETag': ETAG})
+        statuses.append(200)
+        return web.json_response({'login': request.match_info['name']}, headers={'ETag': ETAG})
+        
+    app = web.Application()
+    app.router.add_get('/users/{name}', user)
+    return app
+
+async def _fetch_twice(statuses, factories, registry):
+    """Fetch one user through the store each factory returns, from the same server"""
+    runner = web.AppRunner(_app(statuses))
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    users = []
+    try:
+        for factory in factories:
+            client = GitHubClient(base_url=f"http://127.0.0.1:{port}", store=factory(), rate_limiters=registry)
+            users.append(await client.get_user('octocat'))
+            await client.close()
+    finally:
+        await runner.cleanup()
+    return users
+
+def test_fresh_entries_skip_the_request(tmp_path):
+    statuses = []
+    path = str(tmp_path / 'github.sqlite3')
+    stores = []
+    def reopened():
+        # A fresh store over the same file, as after a worker restart
+        if stores:
+            stores[-1].close()
+        stores.append(ResponseStore(stale_after=3600, path=path))
+        return stores[-1]
+        
+    users = asyncio.run(_fetch_twice(statuses, [reopened, reopened], RateLimiterRegistry()))
+    assert users == [{'login': 'octocat'}] * 2
+    assert statuses == [200]
+    assert stores[1].stats() == {'fresh_hits': 1, 'revalidated': 0, 'fetched': 0}
+    stores[1].close()
+
+def test_stale_entries_are_revalidated_with_the_etag():
+    statuses = []
+    registry = RateLimiterRegistry()
+    store = ResponseStore(stale_after=0)
+    users = asyncio.run(_fetch_twice(statuses, [lambda: store] * 2, registry))
+    
+    assert users == [{'login': 'octocat'}] * 2
+    assert statuses == [200, 304]
+    assert store.stats() == {'fresh_hits': 0, 'revalidated': 1, 'fetched': 1}
+    # The 304 is not counted against the rate limit
+    limiter = registry.get('github_core')
+    assert limiter.tokens > limiter.capacity - 1.5
+
+def test_conditional_headers_carry_both_validators():
+    store = ResponseStore()
+    headers = store.conditional_headers({'etag': ETAG, 'last_modified': 'Mon, 01 Jan 2024 00:00:00 GMT'})
+    assert headers == {'If-None-Match': ETAG, 'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'}
+    assert store.conditional_headers(None) == {}
@@ -0,0 +1,83 @@
+import asyncio
+import base64
+import json
+import os
+import sys
+
+import pytest
+
+from resume_analysis.config import Config
+from resume_analysis.server import AnalysisWorker, _pdf_bytes, _read_request_line, serve_stdio
+
+def test_pdf_bytes_decodes_base64():
+    data = {'resume_pdf_b64': base64.b64encode(b'%PDF-1.4 test').decode()}
+    assert _pdf_bytes(data, 'resume_pdf') == b'%PDF-1.4 test'
+
+def test_pdf_bytes_rejects_paths_and_bad_base64():
+    with pytest.raises(ValueError, match='resume_pdf_b64'):
+        _pdf_bytes({'resume_pdf': '/etc/passwd'}, 'resume_pdf')
+    with pytest.raises(ValueError, match='Invalid base64'):
+        _pdf_bytes({'resume_pdf_b64': 'not base64!'}, 'resume_pdf')
+    with pytest.raises(ValueError, match='Missing'):
+        _pdf_bytes({}, 'resume_pdf')
+    assert _pdf_bytes({}, 'linkedin_pdf', required=False) is None
+
+def test_worker_refuses_server_side_paths():
+    worker = AnalysisWorker(Config(CACHE_DIR=''))
+    response = asyncio.run(worker.handle_message({
+        'id': 1,
+        'type': 'analyze_linkedin',
+        'data': {'pdf_content': '/etc/passwd'}
+    }))
+    assert response['id'] == 1
+    assert 'pdf_content_b64' in response['error']
+
+def test_oversized_request_line_is_skipped():
+    async def main():
+        reader = asyncio.StreamReader(limit=16)
+        reader.feed_data(b'{"id": 1}\n' + b'x' * 100 + b'\n{"id": 2}\n{"id": 3}')
+        reader.feed_eof()
+        return [await _read_request_line(reader) for _ in range(5)]
+        
+    assert asyncio.run(main()) == [b'{"id": 1}\n', None, b'{"id": 2}\n', b'{"id": 3}', b'']
+
+class _SlowWorker(AnalysisWorker):
+    """Echoes requests after a pause, recording how many are in memory at once"""
+    
+    def __init__(self):
+        super().__init__(Config(CACHE_DIR=''), concurrency=2)
+        self.active = 0
+        self.peak = 0
+        
+    async def start(self) -> None:
+        pass
+        
+    async def close(self) -> None:
+        pass
+        
+    async def handle_message(self, message):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return {'id': message['id'], 'result': 'ok'}
+
+def test_stdio_bounds_pending_requests_and_restores_stdout(monkeypatch, tmp_path):
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b''.join(b'{"id": %d}\n' % i for i in range(20)) + b'not json\n')
+    os.close(write_fd)
+    stdin = os.fdopen(read_fd, 'rb')
+    stdout = open(tmp_path / 'out.jsonl', 'w')
+    monkeypatch.setattr(sys, 'stdin', stdin)
+    monkeypatch.setattr(sys, 'stdout', stdout)
+    
+    worker = _SlowWorker()
+    asyncio.run(serve_stdio(worker))
+    stdin.close()
+    stdout.close()
+    
+    assert sys.stdout is stdout
+    assert worker.peak <= worker.concurrency
+    responses = [json.loads(line) for line in (tmp_path / 'out.jsonl').read_text().splitlines()]
+    assert sorted(r['id'] for r in responses if r['id'] is not None) == list(range(20))
+    assert any('Invalid JSON' in r.get('error', '') for r in responses)
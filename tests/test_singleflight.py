@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from resume_analysis.utils.singleflight import SingleFlight
+
+def test_concurrent_callers_share_one_call():
+    async def main():
+        flight = SingleFlight()
+        calls = 0
+        
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 'value'
+            
+        results = await asyncio.gather(*(flight.do('key', factory) for _ in range(5)))
+        return results, calls, flight.stats()
+        
+    results, calls, stats = asyncio.run(main())
+    assert results == ['value'] * 5
+    assert calls == 1
+    assert stats == {'calls': 1, 'coalesced': 4, 'inflight': 0}
+
+def test_leader_cancelled_waiter_still_gets_result():
+    async def main():
+        flight = SingleFlight()
+        release = asyncio.Event()
+        
+        async def factory():
+            await release.wait()
+            return 'value'
+            
+        leader = asyncio.ensure_future(flight.do('key', factory))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(flight.do('key', factory))
+        await asyncio.sleep(0)
+        
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        return leader, await waiter
+        
+    leader, value = asyncio.run(main())
+    assert leader.cancelled()
+    assert value == 'value'
+
+def test_call_cancelled_once_every_caller_is_gone():
+    async def main():
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+        
+        async def factory():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+                
+        callers = [asyncio.ensure_future(flight.do('key', factory)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        return len(flight)
+        
+    assert asyncio.run(main()) == 0
+
+def test_failure_reaches_every_caller_and_is_not_kept():
+    async def main():
+        flight = SingleFlight()
+        attempts = 0
+        
+        async def factory():
+            nonlocal attempts
+            attempts += 1
+            await asyncio.sleep(0)
+            raise ValueError('boom')
+            
+        results = await asyncio.gather(*(flight.do('key', factory) for _ in range(3)), return_exceptions=True)
+        with pytest.raises(ValueError):
+            await flight.do('key', factory)
+        return results, attempts
+        
+    results, attempts = asyncio.run(main())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert attempts == 2
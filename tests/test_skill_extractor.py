@@ -0,0 +1,24 @@
+import pytest
+
+from resume_analysis.models.skill_extractor import SkillExtractor
+from resume_analysis.parsers.pdf_parser import clean_text
+
+@pytest.fixture(scope='module')
+def extractor():
+    return SkillExtractor()
+
+def test_skills_wrapped_across_lines_match(extractor):
+    text = clean_text("Experienced in machine\nlearning and web\n   development")
+    skills = extractor.extract_skills(text)
+    assert skills['ai_ml'] == ['machine learning']
+    assert skills['web_dev'] == ['web development']
+
+def test_line_breaks_still_end_clauses(extractor):
+    skills = extractor.extract_skills("React\n3 years Solidity")
+    assert skills['blockchain_experience'] == 3
+    assert 'web_dev_experience' not in skills
+
+def test_experience_attributed_within_clause(extractor):
+    skills = extractor.extract_skills("5 years of React; 2 yrs AWS")
+    assert skills['web_dev_experience'] == 5
+    assert skills['cloud_experience'] == 2
@@ -0,0 +1,91 @@
+import asyncio
+import json
+import socket
+
+import aiohttp
+import pytest
+
+from resume_analysis.config import Config
+from resume_analysis.server import AnalysisWorker, serve_http
+from resume_analysis.utils import tracing
+
+@pytest.fixture(autouse=True)
+def reset_tracing():
+    yield
+    tracing.configure(False)
+    tracing.reset_metrics()
+
+@tracing.traced('work')
+async def work(fail=False):
+    if fail:
+        raise RuntimeError('boom')
+    with tracing.span('inner') as span:
+        span.set(items=3)
+        return tracing.current_trace_id()
+
+def test_disabled_tracing_records_nothing():
+    assert asyncio.run(work()) is None
+    tracing.count('requests_total', status=200)
+    with tracing.span('outer') as span:
+        span.set(ignored=True)
+        assert span.trace_id is None
+    assert 'resume_analysis_' not in tracing.render_metrics()
+
+def test_enabled_tracing_exports_spans_and_metrics(tmp_path):
+    path = tmp_path / 'spans.jsonl'
+    tracing.configure(True, str(path))
+    
+    async def run():
+        with tracing.span('request') as root:
+            # Spans in spawned tasks join the caller's trace
+            trace_ids = await asyncio.gather(work(), work())
+            with pytest.raises(RuntimeError):
+                await work(fail=True)
+        return root.trace_id, trace_ids
+        
+    trace_id, trace_ids = asyncio.run(run())
+    tracing.count('requests_total', status=200)
+    tracing.configure(False)
+    
+    assert trace_ids == [trace_id, trace_id]
+    spans = [json.loads(line) for line in path.read_text().splitlines()]
+    assert {span['trace_id'] for span in spans} == {trace_id}
+    assert sorted(span['name'] for span in spans) == ['inner', 'inner', 'request', 'work', 'work', 'work']
+    failed = [span for span in spans if span['status'] == 'error']
+    assert len(failed) == 1 and 'RuntimeError: boom' in failed[0]['attributes']['error']
+    
+    text = tracing.render_metrics({'cache_entries': 4})
+    assert 'resume_analysis_requests_total{status="200"} 1' in text
+    assert 'resume_analysis_span_duration_seconds_count{span="work",status="ok"} 2' in text
+    assert 'resume_analysis_span_duration_seconds_count{span="work",status="error"} 1' in text
+    assert 'resume_analysis_cache_entries 4' in text
+
+class _IdleWorker(AnalysisWorker):
+    async def start(self) -> None:
+        pass
+
+def test_metrics_endpoint_serves_prometheus_text():
+    tracing.configure(True)
+    tracing.count('github_requests_total', status=304)
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+        
+    async def run():
+        server = asyncio.ensure_future(serve_http(_IdleWorker(Config(CACHE_DIR='')), port=port))
+        try:
+            async with aiohttp.ClientSession() as session:
+                for _ in range(50):
+                    try:
+                        async with session.get(f"http://127.0.0.1:{port}/metrics") as response:
+                            return response.content_type, await response.text()
+                    except aiohttp.ClientConnectionError:
+                        await asyncio.sleep(0.02)
+        finally:
+            server.cancel()
+            await asyncio.gather(server, return_exceptions=True)
+            
+    content_type, text = asyncio.run(run())
+    assert content_type == 'text/plain'
+    assert '# TYPE resume_analysis_github_requests_total counter' in text
+    assert 'resume_analysis_github_requests_total{status="304"} 1' in text